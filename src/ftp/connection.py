@@ -8,8 +8,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from ftplib import FTP, error_perm, error_temp
-from typing import Optional
+from typing import Optional, Tuple
 import socket
+import time
 
 from src.ftp.exceptions import (
     FTPConnectionError,
@@ -19,6 +20,10 @@ from src.ftp.exceptions import (
 )
 
 
+# Seconds the app keeps a disconnected session open for a quick reconnect
+SESSION_POOL_IDLE = 30.0
+
+
 class ConnectionState(Enum):
     """FTP connection state."""
     DISCONNECTED = "disconnected"
@@ -27,9 +32,9 @@ class ConnectionState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FTPConnectionConfig:
-    """FTP connection configuration."""
+    """FTP connection configuration (immutable, validated once on creation)."""
     host: str
     port: int = 2121
     username: str = "anonymous"
@@ -49,14 +54,25 @@ class FTPConnectionConfig:
 class FTPConnectionManager:
     """Manages FTP connection lifecycle."""
 
-    def __init__(self):
-        """Initialize the connection manager."""
+    def __init__(self, *, pool_idle: float = 0.0):
+        """
+        Initialize the connection manager.
+
+        Args:
+            pool_idle: Seconds a disconnected session is kept open for reuse
+                by a connect() to the same server and user (0 closes it)
+        """
+        self._pool_idle = pool_idle
+        # (session key, FTP object, monotonic time it was parked)
+        self._idle: Optional[Tuple[tuple, FTP, float]] = None
         self._ftp: Optional[FTP] = None
         self._config: Optional[FTPConnectionConfig] = None
         self._state = ConnectionState.DISCONNECTED
         self._connected_at: Optional[datetime] = None
         self._last_activity: Optional[datetime] = None
         self._error_message: Optional[str] = None
+        self._home_dir: Optional[str] = None
+        self._password = ""
 
     @property
     def state(self) -> ConnectionState:
@@ -66,7 +82,7 @@ class FTPConnectionManager:
     @property
     def is_connected(self) -> bool:
         """True if currently connected."""
-        return self._state == ConnectionState.CONNECTED
+        return self._state is ConnectionState.CONNECTED
 
     @property
     def config(self) -> Optional[FTPConnectionConfig]:
@@ -100,6 +116,20 @@ class FTPConnectionManager:
             raise FTPNotConnectedError("FTP access")
         return self._ftp
 
+    @property
+    def home_dir(self) -> str:
+        """
+        Working directory to return to after a temporary CWD.
+
+        Read with PWD once per session; callers that CWD away must restore it.
+
+        Raises:
+            FTPNotConnectedError: If not connected
+        """
+        if self._home_dir is None:
+            self._home_dir = self.ftp.pwd()
+        return self._home_dir
+
     def connect(self, config: FTPConnectionConfig, password: str = "") -> None:
         """
         Establish FTP connection.
@@ -116,6 +146,11 @@ class FTPConnectionManager:
         self._config = config
         self._state = ConnectionState.CONNECTING
         self._error_message = None
+        self._home_dir = None
+        self._password = password
+
+        if self._adopt_idle(config, password):
+            return
 
         try:
             # Create FTP instance
@@ -158,21 +193,138 @@ class FTPConnectionManager:
             self._ftp = None
             raise FTPConnectionError(config.host, config.port, e)
 
-    def disconnect(self) -> None:
-        """Close FTP connection gracefully."""
-        if self._ftp:
+    def _adopt_idle(self, config: FTPConnectionConfig, password: str) -> bool:
+        """
+        Reuse the parked session if it matches and is still alive.
+
+        Returns:
+            True if the parked session is now the active connection
+        """
+        if self._idle is None:
+            return False
+
+        key, ftp, parked_at = self._idle
+        self._idle = None
+        if (
+            key != self._session_key(config, password)
+            or time.monotonic() - parked_at >= self._pool_idle
+        ):
+            self._quit(ftp)
+            return False
+
+        try:
+            ftp.voidcmd("NOOP")
+        except Exception:
+            self._quit(ftp)
+            return False
+
+        ftp.set_pasv(config.passive_mode)
+        self._ftp = ftp
+        self._state = ConnectionState.CONNECTED
+        self._connected_at = datetime.now()
+        self._last_activity = self._connected_at
+        return True
+
+    @staticmethod
+    def _session_key(config: FTPConnectionConfig, password: str) -> tuple:
+        """Identity of a logged-in session for reuse."""
+        return (config.host, config.port, config.username, password)
+
+    @staticmethod
+    def _quit(ftp: FTP) -> None:
+        """Close an FTP session, gracefully if possible."""
+        try:
+            ftp.quit()
+        except Exception:
+            # Best effort close
             try:
-                self._ftp.quit()
+                ftp.close()
             except Exception:
-                # Best effort close
-                try:
-                    self._ftp.close()
-                except Exception:
-                    pass
+                pass
+
+    def disconnect(self, park: bool = False) -> None:
+        """
+        Close FTP connection gracefully.
+
+        Args:
+            park: Keep a healthy session open for a quick reconnect instead of
+                quitting (needs pool_idle). Only pass this on a clean,
+                user-initiated disconnect; error paths should always QUIT.
+                A parked session is closed when a later connect() can't reuse
+                it, by close_expired_idle() once pool_idle has passed, or by
+                close_idle().
+        """
+        if self._ftp:
+            config = self._config
+            if park and self._pool_idle > 0 and self.is_connected and config is not None:
+                self.close_idle()
+                self._idle = (
+                    self._session_key(config, self._password),
+                    self._ftp,
+                    time.monotonic(),
+                )
+            else:
+                self._quit(self._ftp)
 
         self._ftp = None
         self._state = ConnectionState.DISCONNECTED
         self._connected_at = None
+        self._home_dir = None
+        self._password = ""
+
+    def close_idle(self) -> None:
+        """Close the parked session, if any."""
+        if self._idle is not None:
+            self._quit(self._idle[1])
+            self._idle = None
+
+    def close_expired_idle(self) -> None:
+        """Close the parked session if it has been idle for pool_idle."""
+        if (
+            self._idle is not None
+            and time.monotonic() - self._idle[2] >= self._pool_idle
+        ):
+            self.close_idle()
+
+    def clone(self) -> "FTPConnectionManager":
+        """
+        Open a second session to the same server with the same credentials.
+
+        ftplib.FTP objects are not thread-safe, so concurrent work needs
+        one session per thread.
+
+        Returns:
+            New connected FTPConnectionManager (caller must disconnect it)
+
+        Raises:
+            FTPNotConnectedError: If not connected
+            FTPConnectionError: If connection fails
+            FTPAuthenticationError: If login fails
+            FTPTimeoutError: If connection times out
+        """
+        if not self.is_connected or self._config is None:
+            raise FTPNotConnectedError("Clone")
+        clone = FTPConnectionManager()
+        clone.connect(self._config, password=self._password)
+        return clone
+
+    def noop(self) -> None:
+        """
+        Send a NOOP command to verify and keep alive the control connection.
+
+        Raises:
+            FTPNotConnectedError: If not connected
+            FTPConnectionError: If the server does not respond
+        """
+        ftp = self.ftp
+        config = self._config
+        if config is None:
+            raise FTPNotConnectedError("NOOP")
+        try:
+            ftp.voidcmd("NOOP")
+        except (error_perm, error_temp, EOFError, OSError) as e:
+            raise FTPConnectionError(config.host, config.port, e)
+        self._update_activity()
 
     def _update_activity(self) -> None:
         """Update last activity timestamp."""
@@ -205,6 +357,7 @@ class FTPConnectionManager:
             FTPNotConnectedError: If not connected
         """
         self.ftp.cwd(path)
+        self._home_dir = path if path.startswith("/") else None
         self._update_activity()
 
     def get_current_directory(self) -> str:
@@ -218,4 +371,5 @@ class FTPConnectionManager:
             FTPNotConnectedError: If not connected
         """
         self._update_activity()
-        return self.ftp.pwd()
+        self._home_dir = self.ftp.pwd()
+        return self._home_dir
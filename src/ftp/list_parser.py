@@ -6,10 +6,75 @@ Used as fallback when NLST command is not supported by FTP server.
 
 import logging
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger("ps5_dump_runner.list_parser")
 
+# Unix long format has 8 whitespace-separated fields before the name:
+# permissions links user group size month day time name
+_UNIX_LIST_SPLITS = 8
+
+# Simplified format: permissions followed directly by the name
+_SIMPLE_DIR_PATTERN = re.compile(r'^d[rwx-]{9}\s+(.+)$')
+
+
+def split_list_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a Unix-style LIST line into its permissions and name.
+
+    The name keeps any spaces it contains, including repeated ones.
+
+    Args:
+        line: One line of LIST output
+
+    Returns:
+        Tuple (permissions, name), or None if the line is not in Unix long format
+    """
+    parts = line.split(None, _UNIX_LIST_SPLITS)
+    if len(parts) <= _UNIX_LIST_SPLITS:
+        return None
+    return parts[0], parts[-1].rstrip()
+
+
+def parse_list_line(line: str) -> Optional[str]:
+    """
+    Parse one Unix-style LIST line, returning the name if it is a directory.
+
+    Lets callers filter LIST output line by line as it arrives instead of
+    collecting the raw listing first.
+
+    Args:
+        line: One line of LIST output
+
+    Returns:
+        Directory name, or None for files, . and .., and malformed lines
+    """
+    # Skip empty lines
+    if not line.strip():
+        return None
+
+    # Parse Unix-style LIST output
+    # Format: drwxr-xr-x  2 user group 4096 Jan  1 12:00 dirname
+    # First character 'd' indicates directory, '-' indicates file
+    fields = split_list_line(line)
+    if fields is None:
+        logger.debug(f"Skipping malformed line (< 9 fields): {line}")
+        return None
+
+    permissions, dirname = fields
+
+    # Check if this is a directory (starts with 'd')
+    if not permissions.startswith('d'):
+        logger.debug(f"Skipping non-directory: {line}")
+        return None
+
+    # Skip . and .. special directories
+    if dirname in ('.', '..'):
+        logger.debug(f"Skipping special directory: {dirname}")
+        return None
+
+    return dirname
+
 
 def parse_list_output(list_output: str) -> List[str]:
     """
@@ -41,41 +106,10 @@ def parse_list_output(list_output: str) -> List[str]:
         logger.debug("LIST output is empty")
         return directories
 
-    lines = list_output.strip().split('\n')
-
-    for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-
-        # Parse Unix-style LIST output
-        # Format: drwxr-xr-x  2 user group 4096 Jan  1 12:00 dirname
-        # First character 'd' indicates directory, '-' indicates file
-        parts = line.split()
-
-        # Need at least: permissions user group size month day time name
-        if len(parts) < 8:
-            logger.debug(f"Skipping malformed line (< 8 parts): {line}")
-            continue
-
-        permissions = parts[0]
-
-        # Check if this is a directory (starts with 'd')
-        if not permissions.startswith('d'):
-            logger.debug(f"Skipping non-directory: {line}")
-            continue
-
-        # Directory name is the last part (may contain spaces)
-        # Join all parts after the timestamp to handle names with spaces
-        # Format: permissions links user group size month day time name [name...]
-        dirname = ' '.join(parts[8:])
-
-        # Skip . and .. special directories
-        if dirname in ('.', '..'):
-            logger.debug(f"Skipping special directory: {dirname}")
-            continue
-
-        directories.append(dirname)
+    for line in list_output.splitlines():
+        dirname = parse_list_line(line)
+        if dirname is not None:
+            directories.append(dirname)
 
     logger.info(f"Parsed {len(directories)} directories from LIST output")
     return directories
@@ -101,17 +135,15 @@ def parse_list_output_flexible(list_output: str) -> List[str]:
     if not list_output or not list_output.strip():
         return directories
 
-    lines = list_output.strip().split('\n')
-
-    for line in lines:
+    for line in list_output.splitlines():
         if not line.strip():
             continue
 
         # Try Unix-style format first (most common)
         if line.startswith('d'):
-            parts = line.split()
-            if len(parts) >= 8:
-                dirname = ' '.join(parts[8:])
+            fields = split_list_line(line)
+            if fields is not None:
+                dirname = fields[1]
                 if dirname not in ('.', '..'):
                     directories.append(dirname)
                     continue
@@ -127,7 +159,7 @@ def parse_list_output_flexible(list_output: str) -> List[str]:
                     continue
 
         # Try simplified format (permissions + name only)
-        match = re.match(r'^d[rwx-]{9}\s+(.+)$', line)
+        match = _SIMPLE_DIR_PATTERN.match(line)
         if match:
             dirname = match.group(1).strip()
             if dirname not in ('.', '..'):
@@ -4,19 +4,42 @@ Scans PS5 directories for game dumps and tracks their status.
 """
 
 import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from ftplib import error_perm
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from src.config.paths import SCAN_PATHS, get_location_type_from_path
 from src.ftp.connection import FTPConnectionManager
 from src.ftp.exceptions import FTPNotConnectedError
-from src.ftp.list_parser import parse_list_output
+from src.ftp.list_parser import parse_list_line, split_list_line
 
 logger = logging.getLogger("ps5_dump_runner.scanner")
 
+# Seconds a directory listing is reused before it is fetched again
+LISTING_CACHE_TTL = 30.0
+
+# FTP sessions used to scan paths in parallel (the app's setting; the
+# scanner itself defaults to a single session)
+SCAN_CONNECTIONS = 3
+
+ELF_FILE = "dump_runner.elf"
+JS_FILE = "homebrew.js"
+# dump_runner files whose presence marks a dump as installed
+REQUIRED_FILES = frozenset({ELF_FILE, JS_FILE})
+
+# Reply codes meaning the server doesn't implement MLSD at all
+_MLSD_UNSUPPORTED = ("500", "502")
+
+# Characters that make a path unsafe to pass as a LIST argument
+_LIST_ARG_UNSAFE = re.compile(r"[\s*?\[\]{}]")
+
 
 class LocationType(Enum):
     """Location where a game dump is stored."""
@@ -60,6 +83,13 @@ class GameDump:
     is_experimental: bool = False
     has_elf: bool = False
     has_js: bool = False
+    # Checkbox state in the dump list; UI-only, so ignored by equality
+    selected: bool = field(default=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern path and name; rescans rebuild dumps with the same strings."""
+        self.path = sys.intern(self.path)
+        self.name = sys.intern(self.name)
 
     @classmethod
     def from_path(cls, full_path: str) -> "GameDump":
@@ -119,16 +149,38 @@ class GameDump:
 class DumpScanner:
     """Scans PS5 directories for game dumps."""
 
-    def __init__(self, connection: FTPConnectionManager):
+    def __init__(
+        self,
+        connection: FTPConnectionManager,
+        cache_ttl: float = LISTING_CACHE_TTL,
+        max_connections: int = 1,
+        scan_paths: Optional[Sequence[str]] = None,
+        use_mlsd: bool = False,
+    ):
         """
         Initialize the scanner.
 
         Args:
             connection: Active FTP connection manager
+            cache_ttl: Seconds to reuse directory listings (0 disables caching)
+            max_connections: FTP sessions to scan paths with in parallel,
+                including this connection (1 scans sequentially)
+            scan_paths: Paths to scan for dumps (default: SCAN_PATHS)
+            use_mlsd: List directories with MLSD, which types every entry
+                in one command, falling back to NLST/LIST if the server
+                doesn't support it
         """
         self._connection = connection
         self._last_scan: Optional[datetime] = None
         self._dumps: List[GameDump] = []
+        self._cache_ttl = cache_ttl
+        self._max_connections = max_connections
+        self._paths = list(SCAN_PATHS if scan_paths is None else scan_paths)
+        self._use_mlsd = use_mlsd
+        # path -> (monotonic timestamp, entries, used LIST fallback)
+        self._listing_cache: Dict[str, Tuple[float, List[str], bool]] = {}
+        # Extra sessions for parallel scans, kept open between scans
+        self._sessions: List[FTPConnectionManager] = []
 
     @property
     def last_scan(self) -> Optional[datetime]:
@@ -140,6 +192,24 @@ class DumpScanner:
         """List of discovered dumps from last scan."""
         return self._dumps.copy()
 
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached directory listings.
+
+        Args:
+            path: Directory whose listing to drop, or None to drop all
+        """
+        if path is None:
+            self._listing_cache.clear()
+        else:
+            self._listing_cache.pop(path, None)
+
+    def close(self) -> None:
+        """Disconnect the extra sessions kept for parallel scans."""
+        sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.disconnect()
+
     def scan(self) -> List[GameDump]:
         """
         Scan all configured paths for game dumps.
@@ -163,146 +233,334 @@ class DumpScanner:
             # Connection is dead, re-raise as connection error
             raise OSError("[WinError 10061] Connection lost - FTP server not responding")
 
-        for base_path in SCAN_PATHS:
-            try:
-                logger.debug(f"Scanning path: {base_path}")
+        if self._max_connections > 1:
+            self._scan_parallel(ftp)
+        else:
+            self._scan_sequential()
 
-                # Quick existence check using CWD before trying to list
-                # This is safer than NLST/LIST which can cause connection issues
-                try:
-                    current_dir = ftp.pwd()
-                    ftp.cwd(base_path)
-                    ftp.cwd(current_dir)  # Return to original dir
-                except error_perm:
-                    # Directory doesn't exist, skip it
-                    logger.debug(f"Path does not exist: {base_path}")
-                    continue
+        self._last_scan = datetime.now()
+        logger.info(f"Scan complete: found {len(self._dumps)} dumps")
+        return self._dumps
 
-                # Try to list the directory with retry
-                # Track if LIST was used (entries are already verified as directories)
-                entries, used_list = self._nlst_with_retry(ftp, base_path, return_source=True)
-                logger.debug(f"Found {len(entries)} entries in {base_path} (LIST={used_list})")
+    def _scan_sequential(self) -> None:
+        """Scan every configured path in order on this connection."""
+        for base_path in self._paths:
+            dumps, keep_going = self._scan_path(base_path)
+            self._dumps.extend(dumps)
+            if not keep_going:
+                break
+
+    def _scan_path(
+        self, base_path: str, check_exists: bool = True, check_status: bool = True
+    ) -> Tuple[List[GameDump], bool]:
+        """
+        Scan one configured path for game dumps.
 
-                for entry in entries:
-                    # Skip if it's the base path itself
-                    if entry == base_path.rstrip("/"):
-                        continue
+        Args:
+            base_path: Path to scan
+            check_exists: If True, skip the path quietly when it doesn't exist
+            check_status: If True, list each dump to set its installation status
+
+        Returns:
+            Tuple (dumps, keep_going); keep_going is False if the connection
+            was lost and remaining paths should not be scanned
+        """
+        ftp = self._connection.ftp
+        dumps: List[GameDump] = []
 
-                    # Extract just the directory name (last part of path)
-                    entry_name = entry.rstrip("/").split("/")[-1]
+        try:
+            logger.debug(f"Scanning path: {base_path}")
 
-                    # Skip special directories and system folders
-                    if entry_name in ('.', '..', 'OffAct', 'system', 'System'):
-                        logger.debug(f"Skipping system directory: {entry_name}")
-                        continue
+            if check_exists and not self._path_exists(ftp, base_path):
+                return dumps, True
 
-                    # Construct full path
-                    if entry.startswith("/"):
-                        full_path = entry
-                    else:
-                        full_path = f"{base_path.rstrip('/')}/{entry}"
-
-                    # If LIST was used, entries are already known to be directories
-                    # (LIST output includes permissions, we only return 'd' entries)
-                    # Skip verification for LIST-derived entries to avoid CWD issues
-                    # with special characters in directory names
-                    if used_list:
-                        # Trust LIST output - it already filtered to directories only
-                        dump = GameDump.from_path(full_path)
-                        self._check_installation_status(dump)
-                        self._dumps.append(dump)
-                        logger.debug(f"Added dump (from LIST): {dump.name}")
-                    else:
-                        # NLST doesn't provide type info, verify it's a directory
-                        try:
-                            self._nlst_with_retry(ftp, full_path)
-                            # If we can list it, it's a directory
-                            dump = GameDump.from_path(full_path)
-                            self._check_installation_status(dump)
-                            self._dumps.append(dump)
-                            logger.debug(f"Added dump: {dump.name}")
-                        except error_perm:
-                            # Not a directory or can't access, skip
-                            continue
-                        except Exception as e:
-                            # Log but continue with other entries
-                            logger.warning(f"Error checking {full_path}: {e}")
-                            continue
+            # List the directory with retry; each entry is flagged True/False
+            # if its type is known, None if it has to be probed with NLST
+            entries = self._nlst_with_retry(ftp, base_path, return_flags=True)
+            logger.debug(f"Found {len(entries)} entries in {base_path}")
 
-            except error_perm:
-                # Path doesn't exist or can't access, skip
-                logger.debug(f"Path not accessible: {base_path}")
-                continue
-            except OSError as e:
-                # Connection was lost (WinError 10053, etc.)
-                error_str = str(e)
-                if "10053" in error_str or "10054" in error_str:
-                    # Try to check if connection is still alive with NOOP
+            for entry, is_dir in entries:
+                # Skip if it's the base path itself
+                if entry == base_path.rstrip("/"):
+                    continue
+
+                # Extract just the directory name (last part of path)
+                entry_name = entry.rstrip("/").split("/")[-1]
+
+                # Skip special directories and system folders
+                if entry_name in ('.', '..', 'OffAct', 'system', 'System'):
+                    logger.debug(f"Skipping system directory: {entry_name}")
+                    continue
+
+                # Construct full path
+                if entry.startswith("/"):
+                    full_path = entry
+                else:
+                    full_path = f"{base_path.rstrip('/')}/{entry}"
+
+                # Entries typed by LIST output (permissions column) need no
+                # verification; this also avoids CWD issues with special
+                # characters in directory names
+                if is_dir:
+                    dump = GameDump.from_path(full_path)
+                    if check_status:
+                        self._check_installation_status(dump)
+                    dumps.append(dump)
+                    logger.debug(f"Added dump (from LIST): {dump.name}")
+                elif is_dir is False:
+                    logger.debug(f"Skipping non-directory entry: {entry_name}")
+                else:
+                    # Type unknown, verify it's a directory
                     try:
-                        ftp.voidcmd("NOOP")
-                        # Connection still alive, just skip this path
-                        logger.warning(f"Error scanning {base_path}: {e} (connection recovered)")
+                        self._nlst_with_retry(ftp, full_path)
+                        # If we can list it, it's a directory
+                        dump = GameDump.from_path(full_path)
+                        if check_status:
+                            self._check_installation_status(dump)
+                        dumps.append(dump)
+                        logger.debug(f"Added dump: {dump.name}")
+                    except error_perm:
+                        # Not a directory or can't access, skip
                         continue
-                    except Exception:
-                        # Connection is truly dead
-                        logger.warning(f"Connection lost while scanning {base_path}, skipping remaining paths")
-                        break
-                logger.warning(f"Error scanning {base_path}: {e}")
-                continue
-            except Exception as e:
-                # Check for "150 Opening data transfer" error - PS5 FTP server quirk
-                error_str = str(e)
-                if "150" in error_str:
-                    # This is a failed data transfer, try to recover
-                    try:
-                        ftp.voidcmd("NOOP")
-                        logger.debug(f"Path {base_path} failed with 150 error, but connection still alive")
+                    except Exception as e:
+                        # Log but continue with other entries
+                        logger.warning(f"Error checking {full_path}: {e}")
                         continue
-                    except Exception:
-                        logger.warning(f"Connection lost after 150 error on {base_path}, skipping remaining paths")
-                        break
-                # Log other errors but continue scanning other paths
-                logger.warning(f"Error scanning {base_path}: {e}")
-                continue
 
-        self._last_scan = datetime.now()
-        logger.info(f"Scan complete: found {len(self._dumps)} dumps")
-        return self._dumps
+        except error_perm:
+            # Path doesn't exist or can't access, skip
+            logger.debug(f"Path not accessible: {base_path}")
+            return dumps, True
+        except OSError as e:
+            # Connection was lost (WinError 10053, etc.)
+            error_str = str(e)
+            if "10053" in error_str or "10054" in error_str:
+                # Try to check if connection is still alive with NOOP
+                try:
+                    ftp.voidcmd("NOOP")
+                    # Connection still alive, just skip this path
+                    logger.warning(f"Error scanning {base_path}: {e} (connection recovered)")
+                    return dumps, True
+                except Exception:
+                    # Connection is truly dead
+                    logger.warning(f"Connection lost while scanning {base_path}, skipping remaining paths")
+                    return dumps, False
+            logger.warning(f"Error scanning {base_path}: {e}")
+            return dumps, True
+        except Exception as e:
+            # Check for "150 Opening data transfer" error - PS5 FTP server quirk
+            error_str = str(e)
+            if "150" in error_str:
+                # This is a failed data transfer, try to recover
+                try:
+                    ftp.voidcmd("NOOP")
+                    logger.debug(f"Path {base_path} failed with 150 error, but connection still alive")
+                    return dumps, True
+                except Exception:
+                    logger.warning(f"Connection lost after 150 error on {base_path}, skipping remaining paths")
+                    return dumps, False
+            # Log other errors but continue scanning other paths
+            logger.warning(f"Error scanning {base_path}: {e}")
+            return dumps, True
+
+        return dumps, True
+
+    def _path_exists(self, ftp, base_path: str) -> bool:
+        """
+        Quick existence check using CWD before trying to list.
 
-    def _nlst_with_retry(self, ftp, path: str, retries: int = 2, return_source: bool = False):
+        This is safer than NLST/LIST which can cause connection issues.
+        """
+        try:
+            current_dir = self._connection.home_dir
+            ftp.cwd(base_path)
+            ftp.cwd(current_dir)  # Return to original dir
+        except error_perm:
+            logger.debug(f"Path does not exist: {base_path}")
+            return False
+        return True
+
+    def _scan_paths(
+        self, paths: List[str], check_status: bool = True
+    ) -> Dict[str, List[GameDump]]:
+        """Scan paths known to exist in order, stopping if the connection is lost."""
+        found: Dict[str, List[GameDump]] = {}
+        for base_path in paths:
+            dumps, keep_going = self._scan_path(
+                base_path, check_exists=False, check_status=check_status
+            )
+            found[base_path] = dumps
+            if not keep_going:
+                break
+        return found
+
+    def _scan_parallel(self, ftp) -> None:
+        """
+        Scan existing paths over several FTP sessions at once.
+
+        Listings are network-bound, so the work is spread across this
+        connection and up to max_connections - 1 clones of it: first the
+        base paths are listed, then the per-dump listings that set each
+        installation status are shared out. The clones stay open for the
+        next scan until close() is called. If the server refuses extra
+        sessions, everything is scanned on this connection.
+        """
+        try:
+            existing = [p for p in self._paths if self._path_exists(ftp, p)]
+        except Exception as e:
+            logger.warning(f"Error checking scan paths, scanning sequentially: {e}")
+            self._scan_sequential()
+            return
+
+        if not existing:
+            return
+
+        scanners = [self]
+        for session in self._checkout_sessions(self._max_connections - 1):
+            child = DumpScanner(
+                session, cache_ttl=self._cache_ttl, use_mlsd=self._use_mlsd
+            )
+            child._listing_cache = self._listing_cache
+            scanners.append(child)
+
+        if len(scanners) == 1:
+            found = self._scan_paths(existing)
+            for base_path in existing:
+                self._dumps.extend(found.get(base_path, []))
+            return
+
+        workers = len(scanners)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            shares = [existing[i::workers] for i in range(workers)]
+            found = {}
+            for result in executor.map(
+                partial(DumpScanner._scan_paths, check_status=False), scanners, shares
+            ):
+                found.update(result)
+
+            for base_path in existing:
+                self._dumps.extend(found.get(base_path, []))
+
+            dump_shares = [self._dumps[i::workers] for i in range(workers)]
+            # Consume the iterator so worker exceptions propagate
+            list(executor.map(DumpScanner._check_statuses, scanners, dump_shares))
+
+    def _check_statuses(self, dumps: List[GameDump]) -> None:
+        """Set the installation status of each dump on this connection."""
+        for dump in dumps:
+            self._check_installation_status(dump)
+
+    def _checkout_sessions(self, count: int) -> List[FTPConnectionManager]:
+        """
+        Get up to count live extra sessions, reusing those from earlier scans.
+
+        Kept sessions that died or belong to another server are dropped,
+        and new clones are opened until count is reached or the server
+        refuses more.
+        """
+        live: List[FTPConnectionManager] = []
+        for session in self._sessions:
+            if len(live) < count and session.config == self._connection.config:
+                try:
+                    session.noop()
+                    live.append(session)
+                    continue
+                except Exception:
+                    pass
+            session.disconnect()
+
+        while len(live) < count:
+            try:
+                live.append(self._connection.clone())
+            except Exception as e:
+                logger.debug(f"Extra scan connection refused, continuing with fewer: {e}")
+                break
+
+        self._sessions = live
+        return live
+
+    def _nlst_with_retry(
+        self,
+        ftp,
+        path: str,
+        retries: int = 2,
+        return_source: bool = False,
+        return_flags: bool = False,
+    ):
         """
         List directory with retry on transient connection errors.
 
         Some FTP servers (like PS5) may drop data connections intermittently.
         If NLST command fails (e.g., on macOS), automatically falls back to LIST command.
+        Successful listings are cached for the scanner's cache TTL.
 
         Args:
             ftp: FTP connection object
             path: Directory path to list
             retries: Number of retry attempts
             return_source: If True, return tuple (entries, used_list_fallback)
+            return_flags: If True, return (entry, is_dir) tuples; is_dir is
+                None when the type could not be determined from LIST output
 
         Returns:
             List of entries from nlst or LIST (fallback)
             If return_source=True: tuple (entries, used_list_fallback)
+            If return_flags=True: list of (entry, is_dir) tuples
 
         Raises:
             error_perm: If path doesn't exist or permission denied
             Exception: If all retries fail
         """
-        import time
+        result, used_list = self._list_entries(ftp, path, retries)
+
+        if return_flags:
+            if not used_list:
+                result, used_list = self._classify_with_list(ftp, path, result)
+            if used_list:
+                # LIST output only contains directories
+                return [(entry, True) for entry in result]
+            return [(entry, None) for entry in result]
+
+        return (result, used_list) if return_source else result
+
+    def _list_entries(self, ftp, path: str, retries: int) -> Tuple[List[str], bool]:
+        """
+        List directory entries, using the cache when possible.
+
+        Returns:
+            Tuple (entries, used_list_fallback)
+        """
+        cached = self._listing_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            _, result, used_list = cached
+            return list(result), used_list
+
+        if self._use_mlsd:
+            entries = self._mlsd(ftp, path)
+            if entries is not None:
+                base = path.rstrip("/")
+                result = [
+                    f"{base}/{name}" for name, facts in entries
+                    if facts.get("type") == "dir"
+                ]
+                # Directories only, like a LIST fallback listing
+                self._cache_listing(path, result, True)
+                return result, True
+
         last_error = None
 
         for attempt in range(retries + 1):
             try:
                 result = ftp.nlst(path)
-                return (result, False) if return_source else result
+                self._cache_listing(path, result, False)
+                return result, False
             except error_perm:
                 # NLST may not be supported - try LIST fallback
                 logger.debug(f"NLST failed for {path}, attempting LIST fallback")
                 try:
                     result = self._list_with_fallback(ftp, path)
-                    return (result, True) if return_source else result
+                    self._cache_listing(path, result, True)
+                    return result, True
                 except error_perm:
                     # Permission error on LIST too, don't retry
                     raise
@@ -325,6 +583,88 @@ class DumpScanner:
         # All retries failed
         raise last_error
 
+    def _mlsd(self, ftp, path: str) -> Optional[List[Tuple[str, Dict[str, str]]]]:
+        """
+        List a directory with MLSD, which gives each entry's type.
+
+        Default facts are used, since requesting specific ones costs an
+        extra OPTS command per listing. If the server doesn't implement
+        MLSD, or its listings carry no type fact, it is disabled for this
+        scanner. Type values are lowercased, as RFC 3659 makes them
+        case-insensitive.
+
+        Returns:
+            List of (name, facts) tuples, or None if the caller should
+            list with NLST/LIST instead
+
+        Raises:
+            error_perm: If path doesn't exist or permission denied
+        """
+        try:
+            entries = list(ftp.mlsd(path))
+        except error_perm as e:
+            if not str(e).startswith(_MLSD_UNSUPPORTED):
+                raise
+            logger.debug(f"MLSD not supported, using NLST/LIST: {e}")
+            self._use_mlsd = False
+            return None
+        except Exception as e:
+            # Leave transient errors to the NLST/LIST path and its retries
+            logger.debug(f"MLSD failed for {path}, using NLST/LIST: {e}")
+            return None
+
+        if entries and not any("type" in facts for _, facts in entries):
+            logger.debug("MLSD listing has no type facts, using NLST/LIST")
+            self._use_mlsd = False
+            return None
+        for _, facts in entries:
+            if "type" in facts:
+                facts["type"] = facts["type"].lower()
+        return entries
+
+    def _classify_with_list(
+        self, ftp, path: str, entries: List[str]
+    ) -> Tuple[List[str], bool]:
+        """
+        Filter NLST entries to directories using a single LIST of the parent.
+
+        Replaces one NLST probe per entry with one LIST command. The filtered
+        result is cached as a LIST listing so rescans skip both commands.
+
+        Args:
+            ftp: FTP connection object
+            path: Directory that was listed
+            entries: Entries returned by NLST
+
+        Returns:
+            Tuple (entries, used_list); used_list is False and entries are
+            unchanged if LIST failed or gave no usable output
+        """
+        if not entries:
+            return entries, False
+
+        try:
+            directories = set(self._list_with_fallback(ftp, path))
+        except Exception as e:
+            logger.debug(f"LIST failed for {path}, probing entries instead: {e}")
+            return entries, False
+
+        if not directories:
+            return entries, False
+
+        base = path.rstrip("/")
+        result = [
+            entry for entry in entries
+            if (entry if entry.startswith("/") else f"{base}/{entry}") in directories
+        ]
+        self._cache_listing(path, result, True)
+        return result, True
+
+    def _cache_listing(self, path: str, entries: List[str], used_list: bool) -> None:
+        """Store a directory listing in the cache (no-op when caching is disabled)."""
+        if self._cache_ttl > 0:
+            self._listing_cache[path] = (time.monotonic(), list(entries), used_list)
+
     def _list_with_fallback(self, ftp, path: str) -> list:
         """
         List directory using LIST command (fallback when NLST not supported).
@@ -343,19 +683,44 @@ class DumpScanner:
             error_perm: If path doesn't exist or permission denied
             Exception: If LIST command fails
         """
-        logger.info(f"Using LIST fallback for {path} (NLST not supported)")
-
-        # Execute LIST command and capture output
-        listing = []
+        logger.debug(f"Listing {path} with LIST")
+
+        # Parse each LIST line as it arrives, keeping only directories
+        # (as full paths, matching NLST behavior)
+        directories: List[str] = []
+        others: List[str] = []
+        base = path.rstrip('/')
+
+        def collect(line: str) -> None:
+            dirname = parse_list_line(line)
+            if dirname is not None:
+                directories.append(dirname if dirname.startswith("/") else f"{base}/{dirname}")
+            else:
+                fields = split_list_line(line)
+                if fields is not None:
+                    others.append(fields[1])
 
-        def capture_line(line):
-            listing.append(line)
+        # LIST <path> saves the PWD/CWD round-trips, but servers may treat the
+        # argument as a glob pattern, so only pass plain paths
+        if not _LIST_ARG_UNSAFE.search(path):
+            try:
+                ftp.dir(path, collect)
+            except error_perm as e:
+                logger.debug(f"LIST {path} rejected, retrying via CWD: {e}")
+            else:
+                # LIST of a plain file lists just that file; only CWD can tell
+                # it apart from a directory holding one file of the same name
+                if directories or others not in ([base], [base.rpartition('/')[2]]):
+                    logger.debug(f"LIST fallback found {len(directories)} directories in {path}")
+                    return directories
+                logger.debug(f"LIST {path} named only itself, checking via CWD")
+            directories.clear()
 
         # CWD to target directory, list contents, then return
-        current_dir = ftp.pwd()  # Save current directory
+        current_dir = self._connection.home_dir  # Directory to return to
         try:
             ftp.cwd(path)  # Change to target directory
-            ftp.dir(capture_line)  # List current directory (no path argument)
+            ftp.dir(collect)  # List current directory (no path argument)
             ftp.cwd(current_dir)  # Return to original directory
         except Exception:
             # Try to restore original directory even if listing failed
@@ -365,25 +730,12 @@ class DumpScanner:
                 pass
             raise  # Re-raise the exception
 
-        # Parse the LIST output to extract directory names
-        list_output = '\n'.join(listing)
-
-        directories = parse_list_output(list_output)
-
-        # Convert directory names to full paths (matching NLST behavior)
-        full_paths = []
-        for dirname in directories:
-            if dirname.startswith("/"):
-                full_paths.append(dirname)
-            else:
-                full_paths.append(f"{path.rstrip('/')}/{dirname}")
-
-        logger.debug(f"LIST fallback found {len(full_paths)} directories in {path}")
-        return full_paths
+        logger.debug(f"LIST fallback found {len(directories)} directories in {path}")
+        return directories
 
     def _list_files_in_dir(self, ftp, dir_path: str) -> list:
         """
-        List all files (not directories) in a directory using CWD + LIST.
+        List all files (not directories) in a directory using MLSD or LIST.
 
         Args:
             ftp: FTP connection object
@@ -392,26 +744,40 @@ class DumpScanner:
         Returns:
             List of filenames (not full paths, just names)
         """
-        current_dir = ftp.pwd()
+        if self._use_mlsd:
+            try:
+                entries = self._mlsd(ftp, dir_path)
+            except error_perm as e:
+                logger.debug(f"Failed to list files in {dir_path}: {e}")
+                return []
+            if entries is not None:
+                return [name for name, facts in entries if facts.get("type") == "file"]
+
         files = []
-        try:
-            ftp.cwd(dir_path)
-            listing = []
-            ftp.dir(lambda line: listing.append(line))
 
-            for line in listing:
-                if not line.strip():
-                    continue
-                parts = line.split()
-                if len(parts) < 8:
-                    continue
-                permissions = parts[0]
-                # Files start with '-', directories start with 'd'
-                if permissions.startswith('-'):
-                    # Extract filename (last part, may contain spaces)
-                    filename = ' '.join(parts[8:])
-                    files.append(filename)
+        def collect(line: str) -> None:
+            fields = split_list_line(line)
+            # Files start with '-', directories start with 'd'
+            if fields is not None and fields[0].startswith('-'):
+                files.append(fields[1])
+
+        # One LIST <path> per dump instead of CWD + LIST + CWD back, for
+        # plain paths only (see _list_with_fallback)
+        if not _LIST_ARG_UNSAFE.search(dir_path):
+            try:
+                ftp.dir(dir_path, collect)
+                return files
+            except error_perm as e:
+                logger.debug(f"LIST {dir_path} rejected, retrying via CWD: {e}")
+                files.clear()
+            except Exception as e:
+                logger.debug(f"Failed to list files in {dir_path}: {e}")
+                return []
 
+        current_dir = self._connection.home_dir
+        try:
+            ftp.cwd(dir_path)
+            ftp.dir(collect)
             return files
         except Exception as e:
             logger.debug(f"Failed to list files in {dir_path}: {e}")
@@ -438,13 +804,15 @@ class DumpScanner:
             # List all files in the dump directory
             files = self._list_files_in_dir(ftp, dump.path)
 
-            dump.has_elf = "dump_runner.elf" in files
-            dump.has_js = "homebrew.js" in files
+            # One pass over the listing, however many files the dump has
+            present = REQUIRED_FILES.intersection(files)
+            dump.has_elf = ELF_FILE in present
+            dump.has_js = JS_FILE in present
 
-            if dump.has_elf and dump.has_js:
+            if present == REQUIRED_FILES:
                 # Files present, but we can't easily determine official vs experimental
                 dump.installation_status = InstallationStatus.UNKNOWN
-            elif dump.has_elf or dump.has_js:
+            elif present:
                 # Partial installation
                 dump.installation_status = InstallationStatus.UNKNOWN
             else:
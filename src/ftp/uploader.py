@@ -3,11 +3,14 @@
 Handles uploading dump_runner files to game dumps via FTP.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from queue import Queue
 from typing import Callable, List, Optional, Union
 import threading
 import logging
+import time
 
 from src.core.scanner_base import UploadResult, CompletionCallback
 from src.ftp.connection import FTPConnectionManager
@@ -16,6 +19,10 @@ from src.ftp.exceptions import FTPNotConnectedError, FTPUploadError
 
 logger = logging.getLogger("ps5_dump_runner.uploader")
 
+# FTP sessions used to upload to several dumps at once (the app's setting;
+# the uploader itself defaults to a single session)
+UPLOAD_CONNECTIONS = 4
+
 
 @dataclass
 class UploadProgress:
@@ -40,17 +47,21 @@ ProgressCallback = Callable[[UploadProgress], None]
 class FileUploader:
     """Handles file uploads to game dumps."""
 
-    # Block size for FTP transfers (8KB)
-    BLOCK_SIZE = 8192
+    # Block size for FTP transfers (64KB); larger blocks mean fewer send()
+    # calls and progress callbacks per file
+    BLOCK_SIZE = 65536
 
-    def __init__(self, connection: FTPConnectionManager):
+    def __init__(self, connection: FTPConnectionManager, max_connections: int = 1):
         """
         Initialize the uploader.
 
         Args:
             connection: Active FTP connection manager
+            max_connections: FTP sessions to upload to dumps in parallel,
+                including this connection (1 uploads sequentially)
         """
         self._connection = connection
+        self._max_connections = max_connections
         self._cancelled = threading.Event()
         self._current_upload: Optional[str] = None
 
@@ -96,7 +107,6 @@ class FileUploader:
                 error_message="Not connected to FTP"
             )
 
-        import time
         start_time = time.time()
         total_bytes = 0
         elf_uploaded = False
@@ -233,7 +243,9 @@ class FileUploader:
         """
         Upload files to multiple dumps.
 
-        Continues on individual failures, collects all results.
+        Continues on individual failures, collects all results. With
+        max_connections above 1, dumps are uploaded over several sessions
+        at once and the callbacks are called from worker threads.
 
         Args:
             dumps: List of target game dumps
@@ -243,32 +255,89 @@ class FileUploader:
             on_complete: Optional callback when each dump completes
 
         Returns:
-            List of UploadResult for each dump
+            List of UploadResult for each dump, in the order of dumps
         """
         # Convert to Path if needed
         elf_path = Path(elf_path) if isinstance(elf_path, str) else elf_path
         js_path = Path(js_path) if isinstance(js_path, str) else js_path
 
         self.reset_cancel()
-        results: List[UploadResult] = []
 
-        for dump in dumps:
-            if self._cancelled.is_set():
-                # Add cancelled result for remaining dumps
-                results.append(UploadResult(
-                    dump_path=dump.path,
-                    success=False,
-                    error_message="Upload cancelled"
-                ))
-                continue
+        if self._max_connections > 1 and len(dumps) > 1:
+            return self._upload_parallel(dumps, elf_path, js_path, on_progress, on_complete)
+
+        return [
+            self._upload_one(dump, elf_path, js_path, on_progress, on_complete)
+            for dump in dumps
+        ]
+
+    def _upload_one(
+        self,
+        dump: GameDump,
+        elf_path: Path,
+        js_path: Path,
+        on_progress: Optional[ProgressCallback],
+        on_complete: Optional[CompletionCallback]
+    ) -> UploadResult:
+        """Upload to one dump of a batch, skipping it once cancelled."""
+        if self._cancelled.is_set():
+            return UploadResult(
+                dump_path=dump.path,
+                success=False,
+                error_message="Upload cancelled"
+            )
+
+        result = self.upload_to_dump(dump, elf_path, js_path, on_progress)
 
-            result = self.upload_to_dump(dump, elf_path, js_path, on_progress)
-            results.append(result)
+        if on_complete:
+            on_complete(dump, result)
 
-            if on_complete:
-                on_complete(dump, result)
+        return result
 
-        return results
+    def _upload_parallel(
+        self,
+        dumps: List[GameDump],
+        elf_path: Path,
+        js_path: Path,
+        on_progress: Optional[ProgressCallback],
+        on_complete: Optional[CompletionCallback]
+    ) -> List[UploadResult]:
+        """
+        Upload to dumps over several FTP sessions at once.
+
+        Small files are dominated by per-transfer round trips, so each
+        worker takes the next dump on its own session: this connection or
+        one of up to max_connections - 1 clones of it. If the server
+        refuses extra sessions, the dumps are uploaded on this connection.
+        """
+        uploaders = [self]
+        for _ in range(min(len(dumps), self._max_connections) - 1):
+            try:
+                clone = self._connection.clone()
+            except Exception as e:
+                logger.debug(f"Extra upload connection refused, continuing with fewer: {e}")
+                break
+            child = FileUploader(clone)
+            child._cancelled = self._cancelled
+            uploaders.append(child)
+
+        idle: "Queue[FileUploader]" = Queue()
+        for uploader in uploaders:
+            idle.put(uploader)
+
+        def upload(dump: GameDump) -> UploadResult:
+            uploader = idle.get()
+            try:
+                return uploader._upload_one(dump, elf_path, js_path, on_progress, on_complete)
+            finally:
+                idle.put(uploader)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(uploaders)) as executor:
+                return list(executor.map(upload, dumps))
+        finally:
+            for child in uploaders[1:]:
+                child._connection.disconnect()
 
     def get_batch_summary(self, results: List[UploadResult]) -> dict:
         """
@@ -6,10 +6,13 @@ dumps for batch operations.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from src.ftp.scanner import GameDump, LocationType
 
+# Milliseconds of typing pause before the list is redrawn for a new search
+SEARCH_DEBOUNCE_MS = 150
+
 
 class DumpList(ttk.Frame):
     """
@@ -38,11 +41,21 @@ class DumpList(ttk.Frame):
         self._on_selection_changed = on_selection_changed
         self._dumps: List[GameDump] = []
         self._filtered_dumps: List[GameDump] = []
-        self._selected_paths: Set[str] = set()
+        # Lowercased dump names, parallel to _dumps, so filtering on each
+        # keystroke doesn't lowercase every name again
+        self._names_lower: List[str] = []
+        # Selection lives on each dump's ``selected`` flag; this maps tree
+        # row ids back to their dump
+        self._dumps_by_path: Dict[str, GameDump] = {}
         self._check_vars: dict[str, tk.BooleanVar] = {}
         self._search_var = tk.StringVar()
         self._search_placeholder = "Search for game name..."
         self._placeholder_active = True  # Initialize before trace
+        self._redraw_after_id: Optional[str] = None
+        # Every dump has a tree row (iid = dump path); rows filtered out are
+        # detached rather than deleted, so filtering only touches changed rows
+        self._tree_paths: List[str] = []
+        self._visible_paths: Set[str] = set()
         self._search_var.trace_add("write", self._on_search_changed)
 
         self._create_widgets()
@@ -161,13 +174,15 @@ class DumpList(ttk.Frame):
         """
         # Store full dump list
         self._dumps = dumps
+        self._names_lower = [dump.name.lower() for dump in dumps]
+        self._dumps_by_path = {dump.path: dump for dump in dumps}
 
         # Clear selection and checkbox state
-        self._selected_paths.clear()
         self._check_vars.clear()
 
         # Initialize checkbox variables for all dumps
         for dump in dumps:
+            dump.selected = False
             var = tk.BooleanVar(value=False)
             self._check_vars[dump.path] = var
 
@@ -193,13 +208,17 @@ class DumpList(ttk.Frame):
 
     def _toggle_item(self, item: str) -> None:
         """Toggle the checkbox state of an item."""
-        if item in self._selected_paths:
-            self._selected_paths.discard(item)
+        dump = self._dumps_by_path.get(item)
+        if dump is None:
+            return
+
+        if dump.selected:
+            dump.selected = False
             self._tree.item(item, text="☐")
             if item in self._check_vars:
                 self._check_vars[item].set(False)
         else:
-            self._selected_paths.add(item)
+            dump.selected = True
             self._tree.item(item, text="☑")
             if item in self._check_vars:
                 self._check_vars[item].set(True)
@@ -207,23 +226,28 @@ class DumpList(ttk.Frame):
         self._notify_selection_changed()
 
     def _select_all(self) -> None:
-        """Select all dumps."""
-        for item in self._tree.get_children():
-            self._selected_paths.add(item)
-            self._tree.item(item, text="☑")
-            if item in self._check_vars:
-                self._check_vars[item].set(True)
+        """Select all dumps matching the current filter."""
+        # The tree may still show the rows from before a debounced redraw
+        if self._redraw_after_id is not None:
+            self._redraw_now()
+        for dump in self._filtered_dumps:
+            dump.selected = True
+            self._tree.item(dump.path, text="☑")
+            if dump.path in self._check_vars:
+                self._check_vars[dump.path].set(True)
 
         self._notify_selection_changed()
 
     def _select_none(self) -> None:
         """Deselect all dumps."""
-        for item in self._tree.get_children():
-            self._tree.item(item, text="☐")
-            if item in self._check_vars:
-                self._check_vars[item].set(False)
+        # Includes selected rows hidden by the current filter
+        for dump in self._dumps:
+            if dump.selected:
+                dump.selected = False
+                self._tree.item(dump.path, text="☐")
+                if dump.path in self._check_vars:
+                    self._check_vars[dump.path].set(False)
 
-        self._selected_paths.clear()
         self._notify_selection_changed()
 
     def _request_refresh(self) -> None:
@@ -244,20 +268,29 @@ class DumpList(ttk.Frame):
         Returns:
             List of selected GameDump objects
         """
-        return [d for d in self._dumps if d.path in self._selected_paths]
+        return [d for d in self._dumps if d.selected]
 
     def get_selected_count(self) -> int:
         """Get number of selected dumps."""
-        return len(self._selected_paths)
+        return sum(1 for d in self._dumps if d.selected)
+
+    @property
+    def _selected_paths(self) -> Set[str]:
+        """Paths of the selected dumps (a snapshot, not a live view)."""
+        return {d.path for d in self._dumps if d.selected}
 
     def clear(self) -> None:
         """Clear the dump list."""
-        children = self._tree.get_children()
-        if children:
-            self._tree.delete(*children)
+        if self._tree_paths:
+            self._tree.delete(*self._tree_paths)
+        self._tree_paths = []
+        self._visible_paths = set()
 
+        for dump in self._dumps:
+            dump.selected = False
         self._dumps = []
-        self._selected_paths.clear()
+        self._names_lower = []
+        self._dumps_by_path = {}
         self._check_vars.clear()
         self._count_label.config(text="0 dumps found")
 
@@ -304,8 +337,8 @@ class DumpList(ttk.Frame):
         else:
             # Case-insensitive substring match on dump name
             self._filtered_dumps = [
-                dump for dump in self._dumps
-                if query in dump.name.lower()
+                dump for dump, name in zip(self._dumps, self._names_lower)
+                if query in name
             ]
 
     def _on_search_changed(self, *args) -> None:
@@ -319,18 +352,62 @@ class DumpList(ttk.Frame):
         if current_value and current_value != self._search_placeholder:
             self._placeholder_active = False
 
+        # Filter and count now (cheap), but update the tree only once
+        # typing pauses, so a burst of keystrokes costs one redraw
         self._apply_filter()
-        self._update_display()
+        self._update_count_label()
+        self._cancel_redraw()
+        if SEARCH_DEBOUNCE_MS > 0:
+            self._redraw_after_id = self.after(SEARCH_DEBOUNCE_MS, self._redraw_now)
+        else:
+            self._sync_visible()
+
+    def _redraw_now(self) -> None:
+        """Run the pending debounced redraw."""
+        self._redraw_after_id = None
+        self._sync_visible()
+
+    def _sync_visible(self) -> None:
+        """Show exactly the filtered dumps, moving only rows whose state changed."""
+        self._cancel_redraw()
+
+        new_paths = {dump.path for dump in self._filtered_dumps}
+        hidden = self._visible_paths - new_paths
+        if hidden:
+            self._tree.detach(*hidden)
+
+        shown = new_paths - self._visible_paths
+        if shown:
+            # Rows still attached keep their relative order, so reattaching
+            # in filtered order at each row's index restores the full order
+            for index, dump in enumerate(self._filtered_dumps):
+                if dump.path in shown:
+                    self._tree.move(dump.path, "", index)
+
+        self._visible_paths = new_paths
+        self._update_count_label()
+
+    def _cancel_redraw(self) -> None:
+        """Drop the pending debounced redraw, if any."""
+        if self._redraw_after_id is not None:
+            self.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+
+    def destroy(self) -> None:
+        """Destroy the widget, dropping any pending redraw."""
+        self._cancel_redraw()
+        super().destroy()
 
     def _update_display(self) -> None:
-        """Refresh treeview with filtered dumps."""
-        # Clear existing items
-        children = self._tree.get_children()
-        if children:
-            self._tree.delete(*children)
+        """Rebuild the treeview from all dumps, showing the filtered ones."""
+        self._cancel_redraw()
 
-        # Add filtered items
-        for dump in self._filtered_dumps:
+        # Clear existing items, including detached ones
+        if self._tree_paths:
+            self._tree.delete(*self._tree_paths)
+
+        # Add a row for every dump, then detach the filtered-out ones
+        for dump in self._dumps:
             # Determine status text based on actual file presence
             if dump.has_elf and dump.has_js:
                 status = "Installed"
@@ -362,7 +439,7 @@ class DumpList(ttk.Frame):
             }.get(dump.location_type, "Unknown")
 
             # Determine checkbox text based on selection state
-            checkbox_text = "☑" if dump.path in self._selected_paths else "☐"
+            checkbox_text = "☑" if dump.selected else "☐"
 
             # Insert item
             self._tree.insert(
@@ -374,8 +451,9 @@ class DumpList(ttk.Frame):
                 tags=(dump.location_type.value,)
             )
 
-        # Update count label
-        self._update_count_label()
+        self._tree_paths = [dump.path for dump in self._dumps]
+        self._visible_paths = set(self._tree_paths)
+        self._sync_visible()
 
         # Configure tag colors
         self._configure_tag_colors()
@@ -4,9 +4,10 @@ Scans local/portable drives for PS5 game dumps without requiring FTP connection.
 """
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from src.ftp.scanner import GameDump, InstallationStatus, LocationType
 
@@ -15,6 +16,24 @@ logger = logging.getLogger("ps5_dump_runner.local_scanner")
 # Predefined subpaths to scan on selected volume
 PREDEFINED_PATHS = ["homebrew", "etaHEN/games"]
 
+EBOOT_FILE = os.path.normcase("eboot.bin")
+ELF_FILE = os.path.normcase("dump_runner.elf")
+JS_FILE = os.path.normcase("homebrew.js")
+
+
+def _list_names(folder_path: Path) -> Set[str]:
+    """
+    List entry names in a folder with a single directory read.
+
+    Names are normalized with os.path.normcase so lookups follow the
+    platform's case sensitivity.
+
+    Raises:
+        OSError: If the folder cannot be read
+    """
+    with os.scandir(folder_path) as entries:
+        return {os.path.normcase(entry.name) for entry in entries}
+
 
 class LocalScanner:
     """Scans local directories for game dumps.
@@ -67,12 +86,14 @@ class LocalScanner:
                 continue
 
             try:
-                for entry in scan_path.iterdir():
-                    if entry.is_dir():
-                        dump = self._check_dump_folder(entry)
-                        if dump:
-                            self._dumps.append(dump)
-                            logger.debug(f"Found dump: {dump.name}")
+                # scandir entries carry the file type, so is_dir() needs no stat
+                with os.scandir(scan_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            dump = self._check_dump_folder(Path(entry.path))
+                            if dump:
+                                self._dumps.append(dump)
+                                logger.debug(f"Found dump: {dump.name}")
             except PermissionError as e:
                 logger.warning(f"Permission denied accessing {scan_path}: {e}")
             except Exception as e:
@@ -97,9 +118,15 @@ class LocalScanner:
         """
         folder_name = folder_path.name
 
+        # One directory read answers the eboot.bin and dump_runner checks
+        try:
+            names = _list_names(folder_path)
+        except OSError as e:
+            logger.debug(f"Cannot read {folder_name}, skipping: {e}")
+            return None
+
         # Check for eboot.bin file (indicates a game dump)
-        eboot_file = folder_path / "eboot.bin"
-        if not eboot_file.exists():
+        if EBOOT_FILE not in names:
             logger.debug(f"No eboot.bin found in {folder_name}, skipping")
             return None
 
@@ -111,12 +138,15 @@ class LocalScanner:
         )
 
         # Check installation status
-        self._check_installation_status(dump, folder_path)
+        self._check_installation_status(dump, folder_path, names)
 
         return dump
 
     def _check_installation_status(
-        self, dump: GameDump, folder_path: Path
+        self,
+        dump: GameDump,
+        folder_path: Path,
+        names: Optional[Set[str]] = None
     ) -> None:
         """
         Check if dump_runner files are installed in a dump.
@@ -124,13 +154,14 @@ class LocalScanner:
         Args:
             dump: GameDump to check (modified in place)
             folder_path: Path to the dump folder
+            names: Entry names already listed from the folder, if available
         """
         try:
-            elf_file = folder_path / "dump_runner.elf"
-            js_file = folder_path / "homebrew.js"
+            if names is None:
+                names = _list_names(folder_path)
 
-            dump.has_elf = elf_file.exists()
-            dump.has_js = js_file.exists()
+            dump.has_elf = ELF_FILE in names
+            dump.has_js = JS_FILE in names
 
             if dump.has_elf and dump.has_js:
                 dump.installation_status = InstallationStatus.UNKNOWN
@@ -5,15 +5,22 @@ Initializes the application, wires up components, and starts the GUI.
 
 import sys
 import tkinter as tk
+from functools import partial
 from pathlib import Path
 from tkinter import filedialog
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
 
 from src.config.paths import get_log_file_path
 from src.config.settings import AppSettings, SettingsManager
 from src.config.credentials import CredentialManager
-from src.ftp.connection import FTPConnectionConfig, FTPConnectionManager, ConnectionState
-from src.ftp.scanner import DumpScanner, GameDump
+from src.ftp.connection import (
+    SESSION_POOL_IDLE,
+    ConnectionState,
+    FTPConnectionConfig,
+    FTPConnectionManager,
+)
+from src.ftp.scanner import SCAN_CONNECTIONS, DumpScanner, GameDump, InstallationStatus
 from src.ftp.exceptions import (
     FTPError,
     FTPConnectionError,
@@ -22,7 +29,7 @@ from src.ftp.exceptions import (
     FTPNotConnectedError,
     FTPUploadError,
 )
-from src.ftp.uploader import FileUploader, UploadProgress, UploadResult
+from src.ftp.uploader import UPLOAD_CONNECTIONS, FileUploader, UploadProgress, UploadResult
 from src.gui.main_window import MainWindow, AppCallbacks
 from src.gui.upload_dialog import UploadDialog
 from src.gui.download_dialog import DownloadDialog
@@ -38,6 +45,12 @@ from src.ftp.uninstaller import FTPUninstaller
 from src.local.uninstaller import LocalUninstaller
 from src.models.uninstall import UninstallProgress, UninstallResult
 
+# File dialog filters for selecting custom dump_runner files
+_ELF_FILETYPES = (("ELF files", "*.elf"), ("All files", "*.*"))
+_JS_FILETYPES = (("JavaScript files", "*.js"), ("All files", "*.*"))
+
+_NOT_INSTALLED = InstallationStatus.NOT_INSTALLED
+
 
 class Application(AppCallbacks):
     """
@@ -59,12 +72,17 @@ class Application(AppCallbacks):
         self._credential_manager = CredentialManager()
 
         # Initialize FTP components
-        self._connection_manager = FTPConnectionManager()
+        self._connection_manager = FTPConnectionManager(pool_idle=SESSION_POOL_IDLE)
         self._scanner: Optional[DumpScanner] = None
         self._uploader: Optional[FileUploader] = None
         self._upload_dialog: Optional[UploadDialog] = None
+        self._upload_dumps: Dict[str, GameDump] = {}
         self._scan_in_progress: bool = False
 
+        # Last directories used in the file dialogs
+        self._last_elf_dir: Optional[str] = None
+        self._last_js_dir: Optional[str] = None
+
         # Initialize Local mode components
         self._local_scanner: Optional[LocalScanner] = None
         self._local_uploader: Optional[LocalUploader] = None
@@ -190,7 +208,11 @@ class Application(AppCallbacks):
             self._save_connection_settings(host, port, username, password)
 
             # Initialize scanner and auto-scan
-            self._scanner = DumpScanner(self._connection_manager)
+            self._close_scanner()
+            self._scanner = DumpScanner(
+                self._connection_manager,
+                max_connections=SCAN_CONNECTIONS,
+            )
             self.on_scan()
         else:
             self._logger.error(f"Connection failed: {error}")
@@ -208,16 +230,34 @@ class Application(AppCallbacks):
 
             self._window.show_error("Connection Error", message)
 
+    def _close_scanner(self) -> None:
+        """Drop the scanner along with its extra scan sessions."""
+        if self._scanner:
+            self._scanner.close()
+            self._scanner = None
+
     def on_disconnect(self) -> None:
         """Handle disconnect request from GUI."""
         self._logger.info("Disconnect requested")
-        self._connection_manager.disconnect()
-        self._scanner = None
+        self._close_scanner()
+        self._connection_manager.disconnect(park=True)
+        # Don't leave the parked session logged in on the PS5 indefinitely;
+        # the extra second keeps Tk's timer from firing just before expiry
+        self._root.after(
+            int((SESSION_POOL_IDLE + 1) * 1000),
+            self._connection_manager.close_expired_idle,
+        )
         self._window.set_connection_state(ConnectionState.DISCONNECTED)
         self._window.update_status("Disconnected")
 
-    def on_scan(self) -> None:
-        """Handle scan request from GUI."""
+    def on_scan(self, use_cache: bool = False) -> None:
+        """
+        Handle scan request from GUI.
+
+        Args:
+            use_cache: Reuse recent directory listings (for rescans after
+                upload/uninstall, which only change files inside dumps)
+        """
         if not self._scanner:
             self._window.show_error("Error", "Not connected to FTP server.")
             return
@@ -227,6 +267,9 @@ class Application(AppCallbacks):
             self._logger.debug("Scan already in progress, ignoring request")
             return
 
+        if not use_cache:
+            self._scanner.invalidate()
+
         self._scan_in_progress = True
         self._logger.info("Scanning for game dumps")
         self._window.update_status("Scanning for game dumps...")
@@ -268,8 +311,8 @@ class Application(AppCallbacks):
                     "Try disconnecting and reconnecting."
                 )
                 # Reset connection state since it's clearly broken
+                self._close_scanner()
                 self._connection_manager.disconnect()
-                self._scanner = None
                 self._window.set_connection_state(ConnectionState.DISCONNECTED)
             elif "10054" in error_str or "forcibly closed" in error_str:
                 message = (
@@ -277,8 +320,8 @@ class Application(AppCallbacks):
                     "The FTP server may have timed out or been stopped.\n"
                     "Try disconnecting and reconnecting."
                 )
+                self._close_scanner()
                 self._connection_manager.disconnect()
-                self._scanner = None
                 self._window.set_connection_state(ConnectionState.DISCONNECTED)
             elif "timed out" in error_str.lower():
                 message = (
@@ -304,38 +347,54 @@ class Application(AppCallbacks):
             self._window.show_error("Error", "Not connected to FTP server.")
             return
 
-        # Ask user to select dump_runner files
-        elf_path = self._select_file(
-            "Select dump_runner.elf",
-            [("ELF files", "*.elf"), ("All files", "*.*")]
-        )
-        if not elf_path:
+        # Check the control connection in background before opening the
+        # file dialogs, so a stale connection is reported up front
+        def noop_task():
+            try:
+                self._connection_manager.noop()
+                return None
+            except Exception as e:
+                return e
+
+        def on_noop_complete(result):
+            error = result.result
+            self._root.after(0, lambda: self._handle_upload_connection_check(
+                selected_dumps, error
+            ))
+
+        task = ThreadedTask(noop_task, on_complete=on_noop_complete)
+        task.start()
+
+    def _handle_upload_connection_check(
+        self,
+        selected_dumps: List[GameDump],
+        error: Optional[Exception]
+    ) -> None:
+        """Continue upload after the connection check (main thread)."""
+        if error:
+            self._logger.error(f"Connection check failed: {error}")
+            self._close_scanner()
+            self._connection_manager.disconnect()
+            self._window.set_connection_state(ConnectionState.DISCONNECTED)
+            self._window.show_error(
+                "Connection Lost",
+                "The connection to the PS5 was lost.\n\n"
+                "Please reconnect and try again."
+            )
             return
 
-        js_path = self._select_file(
-            "Select homebrew.js",
-            [("JavaScript files", "*.js"), ("All files", "*.*")]
-        )
-        if not js_path:
+        # Ask user to select dump_runner files
+        files = self._select_dump_runner_files()
+        if not files:
             return
+        elf_path, js_path = files
 
         # Check if files already exist (overwrite confirmation)
-        dumps_with_existing = self._check_existing_files(selected_dumps)
-        if dumps_with_existing:
-            dump_names = "\n".join([d.display_name for d in dumps_with_existing[:5]])
-            if len(dumps_with_existing) > 5:
-                dump_names += f"\n... and {len(dumps_with_existing) - 5} more"
-
-            if not self._window.show_warning(
-                "Overwrite Confirmation",
-                f"The following dumps already have dump_runner files:\n\n"
-                f"{dump_names}\n\n"
-                f"Do you want to overwrite them?"
-            ):
-                return
+        if not self._confirm_overwrite(selected_dumps):
+            return
 
         # Start the upload
-        self._start_upload(selected_dumps, Path(elf_path), Path(js_path))
+        self._start_upload(selected_dumps, elf_path, js_path)
 
     def on_download_release(self) -> None:
         """Handle download latest release request from GUI."""
@@ -478,19 +537,8 @@ class Application(AppCallbacks):
             return
 
         # Check if files already exist (overwrite confirmation)
-        dumps_with_existing = self._check_existing_files(selected_dumps)
-        if dumps_with_existing:
-            dump_names = "\n".join([d.display_name for d in dumps_with_existing[:5]])
-            if len(dumps_with_existing) > 5:
-                dump_names += f"\n... and {len(dumps_with_existing) - 5} more"
-
-            if not self._window.show_warning(
-                "Overwrite Confirmation",
-                f"The following dumps already have dump_runner files:\n\n"
-                f"{dump_names}\n\n"
-                f"Do you want to overwrite them?"
-            ):
-                return
+        if not self._confirm_overwrite(selected_dumps):
+            return
 
         # Start the upload with official release files
         self._start_upload(
@@ -548,19 +596,91 @@ class Application(AppCallbacks):
         except Exception as e:
             self._logger.warning(f"Failed to check cached release: {e}")
 
-    def _select_file(self, title: str, filetypes: list) -> Optional[str]:
+    def _select_file(
+        self,
+        title: str,
+        filetypes: tuple,
+        initialdir: Optional[str] = None
+    ) -> Optional[str]:
         """Open file dialog to select a file."""
         return filedialog.askopenfilename(
             title=title,
             filetypes=filetypes,
+            initialdir=initialdir,
             parent=self._root
         )
 
-    def _check_existing_files(self, dumps: List[GameDump]) -> List[GameDump]:
-        """Check which dumps already have dump_runner files installed."""
-        from src.ftp.scanner import InstallationStatus
-        # Check for any installed status (OFFICIAL, EXPERIMENTAL, or UNKNOWN with files present)
-        return [d for d in dumps if d.installation_status != InstallationStatus.NOT_INSTALLED]
+    def _select_dump_runner_files(self) -> Optional[tuple[Path, Path]]:
+        """
+        Ask the user to select dump_runner.elf and homebrew.js.
+
+        Each dialog opens in the directory last used for that file type.
+
+        Returns:
+            Tuple of (elf_path, js_path), or None if either dialog was cancelled
+        """
+        elf_path = self._select_file(
+            "Select dump_runner.elf", _ELF_FILETYPES, self._last_elf_dir
+        )
+        if not elf_path:
+            return None
+        self._last_elf_dir = str(Path(elf_path).parent)
+
+        js_path = self._select_file(
+            "Select homebrew.js", _JS_FILETYPES, self._last_js_dir or self._last_elf_dir
+        )
+        if not js_path:
+            return None
+        self._last_js_dir = str(Path(js_path).parent)
+
+        return Path(elf_path), Path(js_path)
+
+    def _iter_existing(self, dumps: List[GameDump]) -> Iterator[GameDump]:
+        """Yield dumps that already have dump_runner files installed."""
+        # Any installed status counts (OFFICIAL, EXPERIMENTAL, or UNKNOWN with files present)
+        return (d for d in dumps if d.installation_status is not _NOT_INSTALLED)
+
+    def _first_n_existing(
+        self,
+        dumps: List[GameDump],
+        n: int = 5
+    ) -> tuple[List[GameDump], int]:
+        """
+        Get the first dumps with existing files without scanning the whole list.
+
+        Args:
+            dumps: Dumps to check
+            n: Maximum number of dumps to return
+
+        Returns:
+            Tuple of (first n existing dumps, number of further existing dumps)
+        """
+        existing = self._iter_existing(dumps)
+        first = list(islice(existing, n))
+        remaining = sum(1 for _ in existing) if len(first) == n else 0
+        return first, remaining
+
+    def _confirm_overwrite(self, dumps: List[GameDump]) -> bool:
+        """
+        Ask for confirmation if any dumps already have dump_runner files.
+
+        Returns:
+            True if the upload should proceed
+        """
+        first, remaining = self._first_n_existing(dumps)
+        if not first:
+            return True
+
+        dump_names = "\n".join(d.display_name for d in first)
+        if remaining:
+            dump_names += f"\n... and {remaining} more"
+
+        return self._window.show_warning(
+            "Overwrite Confirmation",
+            f"The following dumps already have dump_runner files:\n\n"
+            f"{dump_names}\n\n"
+            f"Do you want to overwrite them?"
+        )
 
     def _start_upload(
         self,
@@ -575,7 +695,10 @@ class Application(AppCallbacks):
         )
 
         # Create uploader
-        self._uploader = FileUploader(self._connection_manager)
+        self._uploader = FileUploader(
+            self._connection_manager, max_connections=UPLOAD_CONNECTIONS
+        )
+        self._upload_dumps = {dump.path: dump for dump in dumps}
 
         # Create and show upload dialog
         self._upload_dialog = UploadDialog(
@@ -584,46 +707,33 @@ class Application(AppCallbacks):
             on_cancel=self._handle_upload_cancel
         )
 
-        # Run upload in background thread
-        def upload_task():
-            results = []
-            for i, dump in enumerate(dumps):
-                if self._uploader.is_cancelled:
-                    # Add cancelled result for remaining dumps
-                    results.append(UploadResult(
-                        dump_path=dump.path,
-                        success=False,
-                        error_message="Upload cancelled"
-                    ))
-                    continue
-
-                # Update current dump in dialog
-                self._root.after(0, lambda d=dump: self._update_current_dump(d))
-
-                # Upload to this dump
-                result = self._uploader.upload_to_dump(
-                    dump,
-                    elf_path,
-                    js_path,
-                    on_progress=self._on_upload_progress
+        # Called from upload worker threads as each dump finishes
+        def on_dump_complete(dump, result):
+            # Log per-dump result
+            if result.success:
+                self._logger.info(
+                    "Upload to %s succeeded: %d bytes in %.1fs",
+                    dump.display_name,
+                    result.bytes_transferred,
+                    result.duration_seconds
+                )
+            else:
+                self._logger.error(
+                    "Upload to %s failed: %s", dump.display_name, result.error_message
                 )
-                results.append(result)
-
-                # Log per-dump result
-                if result.success:
-                    self._logger.info(
-                        f"Upload to {dump.display_name} succeeded: "
-                        f"{result.bytes_transferred} bytes in {result.duration_seconds:.1f}s"
-                    )
-                else:
-                    self._logger.error(
-                        f"Upload to {dump.display_name} failed: {result.error_message}"
-                    )
 
-                # Update dialog with result
-                self._root.after(0, lambda r=result: self._add_upload_result(r))
+            # Update dialog with result
+            self._root.after(0, partial(self._add_upload_result, result))
 
-            return results
+        # Run upload in background thread
+        def upload_task():
+            return self._uploader.upload_batch(
+                dumps,
+                elf_path,
+                js_path,
+                on_progress=self._on_upload_progress,
+                on_complete=on_dump_complete
+            )
 
         def on_upload_complete(task_result):
             results = task_result.result if task_result.result else []
@@ -640,11 +750,14 @@ class Application(AppCallbacks):
     def _on_upload_progress(self, progress: UploadProgress) -> None:
         """Handle upload progress (called from background thread)."""
         # Schedule GUI update on main thread
-        self._root.after(0, lambda: self._update_upload_progress(progress))
+        self._root.after(0, partial(self._update_upload_progress, progress))
 
     def _update_upload_progress(self, progress: UploadProgress) -> None:
         """Update upload progress in dialog (main thread)."""
         if self._upload_dialog:
+            dump = self._upload_dumps.get(progress.dump_path)
+            if dump:
+                self._upload_dialog.set_current_dump(dump)
             self._upload_dialog.update_progress(progress)
 
     def _add_upload_result(self, result: UploadResult) -> None:
@@ -672,8 +785,11 @@ class Application(AppCallbacks):
         if results:
             summary = FileUploader(self._connection_manager).get_batch_summary(results)
             self._logger.info(
-                f"Upload batch complete: {summary['successful']}/{summary['total']} successful, "
-                f"{summary['bytes_transferred']} bytes in {summary['duration_seconds']:.1f}s"
+                "Upload batch complete: %d/%d successful, %d bytes in %.1fs",
+                summary['successful'],
+                summary['total'],
+                summary['bytes_transferred'],
+                summary['duration_seconds']
             )
 
             # Show summary in status bar
@@ -692,7 +808,7 @@ class Application(AppCallbacks):
 
         # Refresh dump list to show updated installation status
         self._window.update_status("Rescanning to update installation status...")
-        self.on_scan()
+        self.on_scan(use_cache=True)
 
     def on_scan_local(self, volume_path: Path) -> None:
         """Handle scan request for local volume."""
@@ -746,37 +862,17 @@ class Application(AppCallbacks):
         self._logger.info(f"Local upload requested for {len(selected_dumps)} dumps")
 
         # Ask user to select dump_runner files
-        elf_path = self._select_file(
-            "Select dump_runner.elf",
-            [("ELF files", "*.elf"), ("All files", "*.*")]
-        )
-        if not elf_path:
-            return
-
-        js_path = self._select_file(
-            "Select homebrew.js",
-            [("JavaScript files", "*.js"), ("All files", "*.*")]
-        )
-        if not js_path:
+        files = self._select_dump_runner_files()
+        if not files:
             return
+        elf_path, js_path = files
 
         # Check if files already exist (overwrite confirmation)
-        dumps_with_existing = self._check_existing_files(selected_dumps)
-        if dumps_with_existing:
-            dump_names = "\n".join([d.display_name for d in dumps_with_existing[:5]])
-            if len(dumps_with_existing) > 5:
-                dump_names += f"\n... and {len(dumps_with_existing) - 5} more"
-
-            if not self._window.show_warning(
-                "Overwrite Confirmation",
-                f"The following dumps already have dump_runner files:\n\n"
-                f"{dump_names}\n\n"
-                f"Do you want to overwrite them?"
-            ):
-                return
+        if not self._confirm_overwrite(selected_dumps):
+            return
 
         # Start the upload using local uploader
-        self._start_local_upload(selected_dumps, Path(elf_path), Path(js_path))
+        self._start_local_upload(selected_dumps, elf_path, js_path)
 
     def on_upload_official_local(self, selected_dumps: List[GameDump]) -> None:
         """Handle upload official release request for local dumps."""
@@ -806,19 +902,8 @@ class Application(AppCallbacks):
         )
 
         # Check if files already exist (overwrite confirmation)
-        dumps_with_existing = self._check_existing_files(selected_dumps)
-        if dumps_with_existing:
-            dump_names = "\n".join([d.display_name for d in dumps_with_existing[:5]])
-            if len(dumps_with_existing) > 5:
-                dump_names += f"\n... and {len(dumps_with_existing) - 5} more"
-
-            if not self._window.show_warning(
-                "Overwrite Confirmation",
-                f"The following dumps already have dump_runner files:\n\n"
-                f"{dump_names}\n\n"
-                f"Do you want to overwrite them?"
-            ):
-                return
+        if not self._confirm_overwrite(selected_dumps):
+            return
 
         # Start the upload with official release files using local uploader
         self._start_local_upload(
@@ -864,7 +949,7 @@ class Application(AppCallbacks):
                     continue
 
                 # Update current dump in dialog
-                self._root.after(0, lambda d=dump: self._update_current_dump(d))
+                self._root.after(0, partial(self._update_current_dump, dump))
 
                 # Upload to this dump
                 result = uploader.upload_to_dump(
@@ -876,14 +961,14 @@ class Application(AppCallbacks):
 
                 # Log per-dump result
                 if result.success:
-                    self._logger.info(f"Upload to {dump.display_name} succeeded")
+                    self._logger.info("Upload to %s succeeded", dump.display_name)
                 else:
                     self._logger.error(
-                        f"Upload to {dump.display_name} failed: {result.error_message}"
+                        "Upload to %s failed: %s", dump.display_name, result.error_message
                     )
 
                 # Update dialog with result
-                self._root.after(0, lambda r=result: self._add_upload_result(r))
+                self._root.after(0, partial(self._add_upload_result, result))
 
             return results
 
@@ -910,7 +995,7 @@ class Application(AppCallbacks):
             failed = sum(1 for r in results if not r.success)
 
             self._logger.info(
-                f"Local upload batch complete: {successful}/{len(results)} successful"
+                "Local upload batch complete: %d/%d successful", successful, len(results)
             )
 
             # Show summary in status bar
@@ -1100,7 +1185,7 @@ class Application(AppCallbacks):
 
         # Refresh dump list to show updated installation status
         self._window.update_status("Rescanning to update installation status...")
-        self.on_scan()
+        self.on_scan(use_cache=True)
 
     def _handle_local_uninstall_complete(self, results: List[UninstallResult]) -> None:
         """Handle local uninstall completion (main thread)."""
@@ -1182,16 +1267,20 @@ class Application(AppCallbacks):
         self._settings_manager.save(self._settings)
 
         # Disconnect if connected
+        self._close_scanner()
         if self._connection_manager.is_connected:
             self._connection_manager.disconnect()
+        self._connection_manager.close_idle()
 
         self._logger.info("Application closing")
         self._root.quit()
 
     def _cleanup(self) -> None:
         """Clean up resources."""
+        self._close_scanner()
         if self._connection_manager.is_connected:
             self._connection_manager.disconnect()
+        self._connection_manager.close_idle()
         if self._release_downloader:
             self._release_downloader.close()
         self._logger.info("Application cleanup complete")
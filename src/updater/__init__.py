@@ -6,27 +6,48 @@ This module handles dump_runner release management:
 - Release models: DumpRunnerRelease, ReleaseAsset dataclasses
 """
 
+import importlib
+
 from src.updater.release import DumpRunnerRelease, ReleaseSource
-from src.updater.github_client import (
-    GitHubClient,
-    GitHubRelease,
-    ReleaseAsset,
-    GitHubError,
-    GitHubConnectionError,
-    GitHubRateLimitError,
-    GitHubNotFoundError,
-)
-from src.updater.downloader import (
-    ReleaseDownloader,
-    DownloadProgress,
-    ProgressCallback,
-)
+
+# Client and downloader names are imported on first access (PEP 562) so
+# importing the package stays cheap until the updater is actually used
+_LAZY_IMPORTS = {
+    "AssetDownload": "src.updater.github_client",
+    "GitHubClient": "src.updater.github_client",
+    "GitHubRelease": "src.updater.github_client",
+    "ReleaseAsset": "src.updater.github_client",
+    "GitHubError": "src.updater.github_client",
+    "GitHubConnectionError": "src.updater.github_client",
+    "GitHubRateLimitError": "src.updater.github_client",
+    "GitHubNotFoundError": "src.updater.github_client",
+    "ReleaseDownloader": "src.updater.downloader",
+    "DownloadProgress": "src.updater.downloader",
+    "ProgressCallback": "src.updater.downloader",
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Release models
     "DumpRunnerRelease",
     "ReleaseSource",
     # GitHub client
+    "AssetDownload",
     "GitHubClient",
     "GitHubRelease",
     "ReleaseAsset",
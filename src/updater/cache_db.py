@@ -0,0 +1,187 @@
+"""SQLite store for cached release metadata.
+
+Keeps the metadata of every cached release in a single WAL-mode
+database, so cache lookups are one indexed query instead of reading
+a JSON file per release directory.
+"""
+
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("ps5_dump_runner.cache_db")
+
+
+# Bumped when the schema changes; 0 means a freshly created database
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    dir_name TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    name TEXT,
+    published_at TEXT,
+    body TEXT,
+    html_url TEXT,
+    downloaded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_releases_downloaded
+    ON releases(downloaded_at DESC);
+CREATE TABLE IF NOT EXISTS assets (
+    dir_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    sha256 TEXT,
+    etag TEXT,
+    size INTEGER,
+    PRIMARY KEY (dir_name, name)
+);
+"""
+
+
+class ReleaseCacheDB:
+    """Release metadata keyed by release cache directory name."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the database wrapper.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """Path to the database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per operation, so any thread may call)."""
+        conn = sqlite3.connect(self._path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def initialize(self) -> bool:
+        """
+        Create the schema if needed.
+
+        Returns:
+            True if the database was newly created
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            is_new = conn.execute("PRAGMA user_version").fetchone()[0] == 0
+            if is_new:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.commit()
+            return is_new
+
+    def get(self, dir_name: str) -> Optional[dict]:
+        """
+        Get metadata for a cached release.
+
+        Args:
+            dir_name: Release cache directory name
+
+        Returns:
+            Metadata dict with an "assets" mapping, or None if not cached
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM releases WHERE dir_name = ?", (dir_name,)
+            ).fetchone()
+            if row is None:
+                return None
+            assets = conn.execute(
+                "SELECT name, sha256, etag, size FROM assets WHERE dir_name = ?",
+                (dir_name,)
+            ).fetchall()
+
+        metadata = {key: row[key] for key in row.keys() if key != "dir_name"}
+        metadata["assets"] = {
+            asset["name"]: {
+                "sha256": asset["sha256"],
+                "etag": asset["etag"],
+                "size": asset["size"],
+            }
+            for asset in assets
+        }
+        return metadata
+
+    def put(self, dir_name: str, metadata: dict) -> None:
+        """
+        Insert or replace metadata for a cached release.
+
+        Args:
+            dir_name: Release cache directory name
+            metadata: Metadata dict as returned by get()
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO releases "
+                "(dir_name, version, name, published_at, body, html_url, downloaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    dir_name,
+                    metadata["version"],
+                    metadata.get("name"),
+                    metadata.get("published_at"),
+                    metadata.get("body"),
+                    metadata.get("html_url"),
+                    metadata["downloaded_at"],
+                )
+            )
+            conn.execute("DELETE FROM assets WHERE dir_name = ?", (dir_name,))
+            conn.executemany(
+                "INSERT INTO assets (dir_name, name, sha256, etag, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (dir_name, name, info.get("sha256"), info.get("etag"), info.get("size"))
+                    for name, info in metadata.get("assets", {}).items()
+                ]
+            )
+
+    def delete(self, dir_name: str) -> None:
+        """Remove metadata for a cached release."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM assets WHERE dir_name = ?", (dir_name,))
+            conn.execute("DELETE FROM releases WHERE dir_name = ?", (dir_name,))
+
+    def dir_names_by_download_time(self) -> list[str]:
+        """Get cached release directory names, most recently downloaded first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT dir_name FROM releases ORDER BY downloaded_at DESC"
+            ).fetchall()
+        return [row["dir_name"] for row in rows]
+
+    def versions(self) -> list[tuple[str, str]]:
+        """Get (version, dir_name) for every cached release."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT version, dir_name FROM releases").fetchall()
+        return [(row["version"], row["dir_name"]) for row in rows]
+
+    def move_aside(self) -> None:
+        """Rename an unreadable database to "<name>.corrupt" so a new one can be created."""
+        corrupt = self._path.with_name(self._path.name + ".corrupt")
+        try:
+            self._path.replace(corrupt)
+        except FileNotFoundError:
+            pass
+        for suffix in ("-wal", "-shm"):
+            self._path.with_name(self._path.name + suffix).unlink(missing_ok=True)
+
+    def remove(self) -> None:
+        """Delete the database file along with its WAL and shared-memory files."""
+        for suffix in ("", "-wal", "-shm"):
+            path = self._path.with_name(self._path.name + suffix)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove {path}: {e}")
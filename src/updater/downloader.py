@@ -3,22 +3,33 @@
 Downloads and caches official releases from GitHub.
 """
 
+import hashlib
 import io
 import json
 import logging
+import re
 import shutil
+import sqlite3
+import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import IO, Callable, Optional
 
 from src.config.paths import get_releases_cache_dir
+from src.updater.cache_db import ReleaseCacheDB
 from src.updater.github_client import (
+    DOWNLOAD_CHUNK_SIZE,
+    AssetDownload,
     GitHubClient,
     GitHubRelease,
     GitHubConnectionError,
     GitHubError,
+    ReleaseAsset,
 )
 from src.updater.release import DumpRunnerRelease, ReleaseSource
 
@@ -58,9 +69,24 @@ ProgressCallback = Callable[[DownloadProgress], None]
 class ReleaseDownloader:
     """Downloads and caches dump_runner releases from GitHub."""
 
+    METADATA_DB_FILE = "releases.db"
+    # Per-release JSON metadata written by earlier versions, imported once
     METADATA_FILE = "release_metadata.json"
+    API_CACHE_FILE = "github_api_cache.json"
     ELF_FILE = "dump_runner.elf"
     JS_FILE = "homebrew.js"
+    # Files every cached release must contain
+    TARGET_FILES = (ELF_FILE, JS_FILE)
+    PARTIAL_SUFFIX = ".part"
+    # Attempts per asset; later attempts resume from the bytes received
+    DOWNLOAD_ATTEMPTS = 3
+
+    # Zip downloads larger than this spill from memory to a temp file
+    ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+    # Characters not allowed in release directory names (\w keeps the
+    # Unicode-aware isalnum() semantics; "_" maps to itself)
+    _UNSAFE_DIR_CHARS = re.compile(r"[^\w.-]")
 
     def __init__(self, cache_dir: Optional[Path] = None):
         """
@@ -71,44 +97,170 @@ class ReleaseDownloader:
         """
         self._cache_dir = cache_dir or get_releases_cache_dir()
         self._client: Optional[GitHubClient] = None
+        self._db: Optional[ReleaseCacheDB] = None
 
     def _get_client(self) -> GitHubClient:
         """Get or create GitHub client."""
         if self._client is None:
-            self._client = GitHubClient()
+            self._client = GitHubClient(
+                response_cache_path=self._cache_dir / self.API_CACHE_FILE
+            )
         return self._client
 
     def _get_release_dir(self, version: str) -> Path:
         """Get the cache directory for a specific release version."""
-        # Sanitize version for use as directory name
-        safe_version = "".join(c if c.isalnum() or c in "._-" else "_" for c in version)
-        return self._cache_dir / safe_version
+        return self._cache_dir / self._UNSAFE_DIR_CHARS.sub("_", version)
+
+    def _get_db(self) -> Optional[ReleaseCacheDB]:
+        """
+        Get or open the metadata database, importing legacy JSON on creation.
+
+        A corrupt database is moved aside and recreated. If the database
+        can't be opened (e.g. it is locked), None is returned and releases
+        are treated as not cached; opening is retried on the next call.
+        """
+        if self._db is None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            db = ReleaseCacheDB(self._cache_dir / self.METADATA_DB_FILE)
+            try:
+                is_new = db.initialize()
+            except sqlite3.OperationalError as e:
+                # Locked or not openable; leave the file alone
+                logger.warning(f"Release cache database unavailable, not using cache: {e}")
+                return None
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"Release cache database is corrupt, recreating it: {e}")
+                try:
+                    db.move_aside()
+                    is_new = db.initialize()
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"Release cache database unavailable, not using cache: {e}")
+                    return None
+            if is_new:
+                self._import_json_metadata(db)
+            self._db = db
+        return self._db
+
+    def _import_json_metadata(self, db: ReleaseCacheDB) -> None:
+        """Import per-directory release_metadata.json files into the database."""
+        for release_dir in self._cache_dir.iterdir():
+            metadata_path = release_dir / self.METADATA_FILE
+            if not metadata_path.is_file():
+                continue
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+                downloaded_at = metadata.get("downloaded_at")
+                metadata["downloaded_at"] = (
+                    datetime.fromisoformat(downloaded_at).timestamp()
+                    if downloaded_at else metadata_path.stat().st_mtime
+                )
+                metadata.setdefault("version", release_dir.name)
+                db.put(release_dir.name, metadata)
+            except (json.JSONDecodeError, ValueError, IOError) as e:
+                logger.warning(f"Failed to import metadata from {metadata_path}: {e}")
 
     def _read_metadata(self, release_dir: Path) -> Optional[dict]:
-        """Read cached release metadata."""
-        metadata_path = release_dir / self.METADATA_FILE
-        if not metadata_path.exists():
+        """Read cached release metadata (None if missing or unreadable)."""
+        db = self._get_db()
+        if db is None:
             return None
         try:
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read metadata: {e}")
+            return db.get(release_dir.name)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read cache metadata for {release_dir.name}: {e}")
             return None
 
-    def _write_metadata(self, release_dir: Path, release: GitHubRelease) -> None:
-        """Write release metadata to cache."""
+    def _delete_metadata(self, release_dir: Path) -> None:
+        """Drop cached release metadata, if the database is available."""
+        db = self._get_db()
+        if db is None:
+            return
+        try:
+            db.delete(release_dir.name)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache metadata for {release_dir.name}: {e}")
+
+    def _write_metadata(
+        self,
+        release_dir: Path,
+        release: GitHubRelease,
+        assets: Optional[dict[str, dict]] = None
+    ) -> None:
+        """
+        Write release metadata to cache.
+
+        Args:
+            release_dir: Release cache directory
+            release: Release that was downloaded
+            assets: Per-asset "sha256", "etag" and "size", keyed by asset name
+        """
         metadata = {
             "version": release.tag_name,
             "name": release.name,
             "published_at": release.published_at.isoformat() if release.published_at else None,
             "body": release.body,
             "html_url": release.html_url,
-            "downloaded_at": datetime.now().isoformat(),
+            "downloaded_at": time.time(),
+            "assets": assets or {},
+        }
+        db = self._get_db()
+        if db is None:
+            return
+        try:
+            db.put(release_dir.name, metadata)
+        except sqlite3.Error as e:
+            # The files are in place; the release just won't be reused from cache
+            logger.warning(f"Failed to write cache metadata for {release_dir.name}: {e}")
+
+    def _cached_files_intact(self, release_dir: Path, metadata: dict) -> bool:
+        """
+        Check cached files against the sizes recorded at download time.
+
+        Catches files left truncated by an interrupted write. Files without
+        a recorded size (older caches) only need to exist.
+        """
+        assets = metadata.get("assets", {})
+        for name in self.TARGET_FILES:
+            path = release_dir / name
+            if not path.exists():
+                return False
+            expected_size = assets.get(name, {}).get("size")
+            if expected_size is not None and path.stat().st_size != expected_size:
+                return False
+        return True
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """Hash a file in chunks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _cached_etags(self, release_dir: Path) -> dict[str, str]:
+        """
+        Get ETags of intact cached assets, for conditional downloads.
+
+        A 304 keeps the local files, so they are re-hashed first: a forced
+        download is often asked for because they are suspect. Files with no
+        recorded hash can't be verified and are downloaded again.
+        """
+        metadata = self._read_metadata(release_dir)
+        if not metadata or not self._cached_files_intact(release_dir, metadata):
+            return {}
+        assets = metadata.get("assets", {})
+        for name in self.TARGET_FILES:
+            expected = assets.get(name, {}).get("sha256")
+            if not expected or self._file_sha256(release_dir / name) != expected:
+                logger.debug(f"Cached {name} does not match its recorded hash")
+                return {}
+        return {
+            name: info["etag"]
+            for name, info in metadata.get("assets", {}).items()
+            if info.get("etag")
         }
-        metadata_path = release_dir / self.METADATA_FILE
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
 
     def get_cached_release(self, version: Optional[str] = None) -> Optional[DumpRunnerRelease]:
         """
@@ -132,37 +284,19 @@ class ReleaseDownloader:
 
     def _find_latest_cached(self) -> Optional[Path]:
         """Find the most recently downloaded release directory."""
-        if not self._cache_dir.exists():
+        db = self._get_db()
+        if db is None:
             return None
-
-        latest_time = None
-        latest_dir = None
-
-        for release_dir in self._cache_dir.iterdir():
-            if not release_dir.is_dir():
-                continue
-            metadata = self._read_metadata(release_dir)
-            if not metadata:
-                continue
-
-            # Check if files exist
-            elf_path = release_dir / self.ELF_FILE
-            js_path = release_dir / self.JS_FILE
-            if not (elf_path.exists() and js_path.exists()):
-                continue
-
-            # Get download time
-            downloaded_at = metadata.get("downloaded_at")
-            if downloaded_at:
-                try:
-                    download_time = datetime.fromisoformat(downloaded_at)
-                    if latest_time is None or download_time > latest_time:
-                        latest_time = download_time
-                        latest_dir = release_dir
-                except ValueError:
-                    pass
-
-        return latest_dir
+        try:
+            dir_names = db.dir_names_by_download_time()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to list cached releases: {e}")
+            return None
+        for dir_name in dir_names:
+            release_dir = self._cache_dir / dir_name
+            if all((release_dir / name).exists() for name in self.TARGET_FILES):
+                return release_dir
+        return None
 
     def _load_cached_release(self, release_dir: Path) -> Optional[DumpRunnerRelease]:
         """Load a release from cache directory."""
@@ -181,6 +315,10 @@ class ReleaseDownloader:
             logger.debug(f"Cached release missing metadata: {release_dir}")
             return None
 
+        if not self._cached_files_intact(release_dir, metadata):
+            logger.debug(f"Cached release files do not match metadata: {release_dir}")
+            return None
+
         # Parse release date
         release_date = None
         if metadata.get("published_at"):
@@ -198,54 +336,180 @@ class ReleaseDownloader:
             download_url=metadata.get("html_url"),
         )
 
-    def _extract_zip(self, content: bytes, release_dir: Path) -> None:
+    def _extract_zip(self, fileobj: IO[bytes], release_dir: Path) -> dict[str, dict]:
         """
         Extract dump_runner.zip contents to release directory.
 
         Looks for dump_runner.elf and homebrew.js in the zip file,
-        handling nested directories if present.
+        handling nested directories if present. Members are copied in
+        chunks rather than decompressed into memory.
 
         Args:
-            content: Zip file content as bytes
+            fileobj: Seekable file object containing the zip archive
             release_dir: Directory to extract files to
 
+        Returns:
+            "sha256" and "size" of each extracted file, keyed by name
+
         Raises:
             ValueError: If required files not found in zip
         """
-        elf_path = release_dir / self.ELF_FILE
-        js_path = release_dir / self.JS_FILE
+        with zipfile.ZipFile(fileobj) as zf:
+            # Find the target files (may be in subdirectories), stopping as
+            # soon as all are found
+            found: dict[str, zipfile.ZipInfo] = {}
+            for info in zf.infolist():
+                basename = info.filename.rpartition("/")[2]
+                if basename in self.TARGET_FILES and basename not in found:
+                    found[basename] = info
+                    if len(found) == len(self.TARGET_FILES):
+                        break
+
+            for name in self.TARGET_FILES:
+                if name not in found:
+                    raise ValueError(f"{name} not found in zip file")
+
+            # Extract the files (opening by ZipInfo skips the name lookup),
+            # hashing them on the way for the cache metadata
+            extracted = {}
+            for name in self.TARGET_FILES:
+                info = found[name]
+                dest = release_dir / name
+                logger.debug(f"Extracting {info.filename} -> {dest}")
+                digest = hashlib.sha256()
+                size = 0
+                with zf.open(info) as src, \
+                        open(dest, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as dst:
+                    while chunk := src.read(DOWNLOAD_CHUNK_SIZE):
+                        digest.update(chunk)
+                        dst.write(chunk)
+                        size += len(chunk)
+                extracted[name] = {"sha256": digest.hexdigest(), "size": size}
+
+            logger.info(f"Extracted {' and '.join(self.TARGET_FILES)} from zip")
+            return extracted
+
+    def _download_with_resume(
+        self,
+        client: GitHubClient,
+        asset: ReleaseAsset,
+        fileobj: IO[bytes],
+        callback: Optional[Callable[[int, int], None]] = None,
+        etag: Optional[str] = None
+    ) -> AssetDownload:
+        """
+        Download an asset into a file, resuming if the connection drops.
 
-        with zipfile.ZipFile(io.BytesIO(content)) as zf:
-            # List all files in the zip
-            file_list = zf.namelist()
-            logger.debug(f"Zip contains: {file_list}")
+        Args:
+            client: GitHub client to download with
+            asset: ReleaseAsset to download
+            fileobj: Readable, writable and seekable binary file object
+            callback: Optional progress callback(bytes_downloaded, total_bytes)
+            etag: ETag of a previously downloaded copy
 
-            # Find dump_runner.elf and homebrew.js (may be in subdirectories)
-            elf_found = None
-            js_found = None
+        Returns:
+            AssetDownload for the complete asset
 
-            for name in file_list:
-                basename = name.split("/")[-1]
-                if basename == self.ELF_FILE:
-                    elf_found = name
-                elif basename == self.JS_FILE:
-                    js_found = name
+        Raises:
+            GitHubConnectionError: If every attempt fails
+        """
+        offset = 0
+        validator = None
+        for attempt in range(1, self.DOWNLOAD_ATTEMPTS + 1):
+            try:
+                return client.download_asset_to_file(
+                    asset,
+                    fileobj,
+                    callback=callback,
+                    etag=etag,
+                    resume_from=offset,
+                    if_range=validator
+                )
+            except GitHubConnectionError as e:
+                if attempt == self.DOWNLOAD_ATTEMPTS:
+                    raise
+                validator = e.validator
+                if validator:
+                    offset = fileobj.seek(0, io.SEEK_END)
+                else:
+                    # Without a validator the partial copy can't be trusted
+                    offset = 0
+                    fileobj.seek(0)
+                    fileobj.truncate()
+                logger.warning(
+                    f"Download of {asset.name} interrupted ({e}), "
+                    f"{f'resuming from byte {offset}' if offset else 'restarting'} "
+                    f"(attempt {attempt + 1}/{self.DOWNLOAD_ATTEMPTS})"
+                )
+        # The last attempt re-raises, so the loop never runs out
+        raise AssertionError("unreachable")
+
+    def _download_files(
+        self,
+        client: GitHubClient,
+        targets: list[tuple[ReleaseAsset, Path]],
+        progress_callback: Optional[ProgressCallback] = None,
+        etags: Optional[dict[str, str]] = None
+    ) -> dict[str, AssetDownload]:
+        """
+        Download several assets concurrently, one connection per asset.
 
-            if not elf_found:
-                raise ValueError(f"{self.ELF_FILE} not found in zip file")
-            if not js_found:
-                raise ValueError(f"{self.JS_FILE} not found in zip file")
+        Progress from all downloads is summed and reported as a single
+        DownloadProgress covering every file. Each asset is written to a
+        partial file and only moved into place once complete.
 
-            # Extract the files
-            logger.debug(f"Extracting {elf_found} -> {elf_path}")
-            with zf.open(elf_found) as src, open(elf_path, "wb") as dst:
-                dst.write(src.read())
+        Args:
+            client: GitHub client to download with
+            targets: List of (asset, destination path) tuples
+            progress_callback: Optional callback for progress updates
+            etags: ETags of cached copies, keyed by asset name
 
-            logger.debug(f"Extracting {js_found} -> {js_path}")
-            with zf.open(js_found) as src, open(js_path, "wb") as dst:
-                dst.write(src.read())
+        Returns:
+            Download results keyed by asset name
+        """
+        etags = etags or {}
+        lock = threading.Lock()
+        downloaded = {asset.name: 0 for asset, _ in targets}
+        totals = {asset.name: asset.size for asset, _ in targets}
+        asset_names = " + ".join(asset.name for asset, _ in targets)
+
+        def report_progress(name: str, bytes_downloaded: int, total: int) -> None:
+            if not progress_callback:
+                return
+            with lock:
+                downloaded[name] = bytes_downloaded
+                totals[name] = total
+                progress_callback(DownloadProgress(
+                    asset_name=asset_names,
+                    bytes_downloaded=sum(downloaded.values()),
+                    total_bytes=sum(totals.values()),
+                    current_file=1,
+                    total_files=1,
+                ))
+
+        def download(asset: ReleaseAsset, dest: Path) -> AssetDownload:
+            logger.info(f"Downloading {asset.name}...")
+            partial_path = dest.with_name(dest.name + self.PARTIAL_SUFFIX)
+            with open(partial_path, "w+b", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                result = self._download_with_resume(
+                    client,
+                    asset,
+                    f,
+                    callback=lambda done, total: report_progress(asset.name, done, total),
+                    etag=etags.get(asset.name)
+                )
+            if result.not_modified:
+                partial_path.unlink()
+            else:
+                partial_path.replace(dest)
+            return result
 
-            logger.info(f"Extracted {self.ELF_FILE} and {self.JS_FILE} from zip")
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {
+                asset.name: executor.submit(download, asset, dest)
+                for asset, dest in targets
+            }
+            return {name: future.result() for name, future in futures.items()}
 
     def download_release(
         self,
@@ -287,6 +551,10 @@ class ReleaseDownloader:
         # Create release directory
         release_dir.mkdir(parents=True, exist_ok=True)
 
+        # Intact cached files can be revalidated instead of re-downloaded
+        previous_assets = (self._read_metadata(release_dir) or {}).get("assets", {})
+        etags = self._cached_etags(release_dir)
+
         client = self._get_client()
         elf_path = release_dir / self.ELF_FILE
         js_path = release_dir / self.JS_FILE
@@ -307,54 +575,56 @@ class ReleaseDownloader:
                             total_files=1,
                         ))
 
-                content = client.download_asset(zip_asset, callback=zip_progress)
-
-                # Extract the zip file
-                logger.info("Extracting dump_runner.zip...")
-                self._extract_zip(content, release_dir)
+                # Stream the zip to a spooled temp file rather than into memory
+                with tempfile.SpooledTemporaryFile(
+                    max_size=self.ZIP_SPOOL_MAX_SIZE
+                ) as zip_file:
+                    result = self._download_with_resume(
+                        client,
+                        zip_asset,
+                        zip_file,
+                        callback=zip_progress,
+                        etag=etags.get(zip_asset.name)
+                    )
+
+                    if not result.not_modified:
+                        # Extract the zip file
+                        zip_file.seek(0)
+                        logger.info("Extracting dump_runner.zip...")
+                        extracted = self._extract_zip(zip_file, release_dir)
+
+                downloads = {zip_asset.name: result}
 
             else:
-                # Download individual files
-                # Download ELF file
-                elf_asset = release.get_elf_asset()
-                if elf_asset:
-                    logger.info(f"Downloading {self.ELF_FILE}...")
-
-                    def elf_progress(downloaded: int, total: int):
-                        if progress_callback:
-                            progress_callback(DownloadProgress(
-                                asset_name=self.ELF_FILE,
-                                bytes_downloaded=downloaded,
-                                total_bytes=total,
-                                current_file=1,
-                                total_files=2,
-                            ))
-
-                    content = client.download_asset(elf_asset, callback=elf_progress)
-                    with open(elf_path, "wb") as f:
-                        f.write(content)
-
-                # Download JS file
-                js_asset = release.get_js_asset()
-                if js_asset:
-                    logger.info(f"Downloading {self.JS_FILE}...")
-
-                    def js_progress(downloaded: int, total: int):
-                        if progress_callback:
-                            progress_callback(DownloadProgress(
-                                asset_name=self.JS_FILE,
-                                bytes_downloaded=downloaded,
-                                total_bytes=total,
-                                current_file=2,
-                                total_files=2,
-                            ))
-
-                    content = client.download_asset(js_asset, callback=js_progress)
-                    with open(js_path, "wb") as f:
-                        f.write(content)
-
-            # Write metadata
-            self._write_metadata(release_dir, release)
+                # Download individual files in parallel
+                asset_getters = {
+                    self.ELF_FILE: release.get_elf_asset,
+                    self.JS_FILE: release.get_js_asset,
+                }
+                targets = []
+                for name in self.TARGET_FILES:
+                    asset = asset_getters[name]()
+                    if asset is None:
+                        raise ValueError(f"{name} not found in release {release.tag_name}")
+                    targets.append((asset, release_dir / name))
+                downloads = self._download_files(client, targets, progress_callback, etags)
+
+            # Write metadata, keeping recorded hashes of unchanged assets
+            assets = {
+                name: previous_assets[name] if result.not_modified else {
+                    "sha256": result.sha256,
+                    "etag": result.etag,
+                    "size": result.size,
+                }
+                for name, result in downloads.items()
+            }
+            if zip_asset:
+                # Record the extracted files too, so they can be verified
+                assets.update(
+                    {name: previous_assets[name] for name in self.TARGET_FILES}
+                    if downloads[zip_asset.name].not_modified else extracted
+                )
+            self._write_metadata(release_dir, release, assets)
 
             logger.info(f"Downloaded release {release.tag_name} to {release_dir}")
 
@@ -375,6 +645,7 @@ class ReleaseDownloader:
                     shutil.rmtree(release_dir)
                 except OSError:
                     pass
+            self._delete_metadata(release_dir)
             raise
 
     def download_latest(
@@ -428,6 +699,7 @@ class ReleaseDownloader:
             release_dir = self._get_release_dir(version)
             if release_dir.exists():
                 shutil.rmtree(release_dir)
+                self._delete_metadata(release_dir)
                 logger.info(f"Cleared cache for version: {version}")
                 return 1
             return 0
@@ -441,24 +713,41 @@ class ReleaseDownloader:
                             count += 1
                         except OSError as e:
                             logger.warning(f"Failed to clear {release_dir}: {e}")
+                # Drop all metadata along with the releases
+                ReleaseCacheDB(self._cache_dir / self.METADATA_DB_FILE).remove()
+                self._db = None
             logger.info(f"Cleared {count} cached releases")
             return count
 
+    @staticmethod
+    def _version_sort_key(version: str) -> list:
+        """Sort key comparing numeric parts of a version numerically."""
+        return [
+            int(part) if i % 2 else part
+            for i, part in enumerate(re.split(r"(\d+)", version))
+        ]
+
     def list_cached_versions(self) -> list[str]:
         """
         List all cached release versions.
 
         Returns:
-            List of version strings
+            List of version strings, newest first
         """
-        versions = []
-        if self._cache_dir.exists():
-            for release_dir in self._cache_dir.iterdir():
-                if release_dir.is_dir():
-                    metadata = self._read_metadata(release_dir)
-                    if metadata:
-                        versions.append(metadata.get("version", release_dir.name))
-        return sorted(versions, reverse=True)
+        db = self._get_db()
+        if db is None:
+            return []
+        try:
+            cached = db.versions()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to list cached releases: {e}")
+            return []
+        versions = [
+            version
+            for version, dir_name in cached
+            if (self._cache_dir / dir_name).is_dir()
+        ]
+        return sorted(versions, key=self._version_sort_key, reverse=True)
 
     def close(self) -> None:
         """Clean up resources."""
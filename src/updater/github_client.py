@@ -3,12 +3,23 @@
 Fetches release information and assets from the EchoStretch/dump_runner repository.
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+try:
+    # Optional: parses API responses several times faster than json
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger("ps5_dump_runner.github_client")
 
@@ -22,6 +33,23 @@ RELEASES_URL = f"{GITHUB_API_BASE}/repos/{REPO_OWNER}/{REPO_NAME}/releases"
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Chunk size for streaming asset downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Connections kept per host, enough for concurrent asset downloads
+CONNECTION_POOL_SIZE = 4
+
+# Retries for transient gateway errors, with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Seconds an API response is reused without revalidating its ETag
+RESPONSE_CACHE_TTL = 60
+
+# Remaining API requests below which a rate limit warning is logged
+RATE_LIMIT_WARNING_THRESHOLD = 10
+
 
 class GitHubError(Exception):
     """Base exception for GitHub API errors."""
@@ -29,8 +57,17 @@ class GitHubError(Exception):
 
 
 class GitHubConnectionError(GitHubError):
-    """Raised when unable to connect to GitHub."""
-    pass
+    """
+    Raised when unable to connect to GitHub.
+
+    Attributes:
+        validator: ETag or Last-Modified of a download that was cut off,
+            for resuming it with If-Range; None if it can't be resumed
+    """
+
+    def __init__(self, message: str, validator: Optional[str] = None):
+        super().__init__(message)
+        self.validator = validator
 
 
 class GitHubRateLimitError(GitHubError):
@@ -43,9 +80,9 @@ class GitHubNotFoundError(GitHubError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReleaseAsset:
-    """Represents a downloadable asset from a GitHub release."""
+    """Represents a downloadable asset from a GitHub release (immutable)."""
     name: str
     download_url: str
     size: int
@@ -62,6 +99,15 @@ class ReleaseAsset:
         )
 
 
+@dataclass
+class AssetDownload:
+    """Result of streaming a release asset to a file."""
+    size: int
+    sha256: str
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+
 @dataclass
 class GitHubRelease:
     """Represents a GitHub release with its assets."""
@@ -73,6 +119,14 @@ class GitHubRelease:
     assets: List[ReleaseAsset]
     prerelease: bool
     draft: bool
+    _assets_by_name: Dict[str, ReleaseAsset] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        """Index assets by name; the first asset wins on duplicate names."""
+        for asset in self.assets:
+            self._assets_by_name.setdefault(asset.name, asset)
 
     @property
     def version(self) -> str:
@@ -87,17 +141,17 @@ class GitHubRelease:
     @property
     def has_elf(self) -> bool:
         """Check if release has dump_runner.elf asset."""
-        return any(a.name == "dump_runner.elf" for a in self.assets)
+        return "dump_runner.elf" in self._assets_by_name
 
     @property
     def has_js(self) -> bool:
         """Check if release has homebrew.js asset."""
-        return any(a.name == "homebrew.js" for a in self.assets)
+        return "homebrew.js" in self._assets_by_name
 
     @property
     def has_zip(self) -> bool:
         """Check if release has dump_runner.zip asset (bundled files)."""
-        return any(a.name == "dump_runner.zip" for a in self.assets)
+        return "dump_runner.zip" in self._assets_by_name
 
     @property
     def is_complete(self) -> bool:
@@ -106,10 +160,7 @@ class GitHubRelease:
 
     def get_asset(self, name: str) -> Optional[ReleaseAsset]:
         """Get asset by name."""
-        for asset in self.assets:
-            if asset.name == name:
-                return asset
-        return None
+        return self._assets_by_name.get(name)
 
     def get_elf_asset(self) -> Optional[ReleaseAsset]:
         """Get the dump_runner.elf asset."""
@@ -126,13 +177,11 @@ class GitHubRelease:
     @classmethod
     def from_api_response(cls, data: dict) -> "GitHubRelease":
         """Create GitHubRelease from GitHub API response."""
-        # Parse published_at date
+        # Parse published_at date (fromisoformat accepts "Z" since 3.11)
         published_at = None
         if data.get("published_at"):
             try:
-                published_at = datetime.fromisoformat(
-                    data["published_at"].replace("Z", "+00:00")
-                )
+                published_at = datetime.fromisoformat(data["published_at"])
             except (ValueError, TypeError):
                 pass
 
@@ -157,29 +206,88 @@ class GitHubRelease:
 class GitHubClient:
     """Client for interacting with GitHub API for dump_runner releases."""
 
-    def __init__(self, timeout: int = REQUEST_TIMEOUT):
+    def __init__(
+        self,
+        timeout: int = REQUEST_TIMEOUT,
+        response_cache_path: Optional[Path] = None
+    ):
         """
         Initialize GitHub client.
 
         Args:
             timeout: Request timeout in seconds
+            response_cache_path: Optional JSON file persisting API responses
+                and their ETags between sessions
         """
         self._timeout = timeout
+        self._response_cache_path = response_cache_path
+        self._response_cache = self._load_response_cache()
+
+        # requests (with urllib3 and certifi) is imported on first use so
+        # startup does not pay for it when updates are never checked
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self._session = requests.Session()
         self._session.headers.update({
             "Accept": "application/vnd.github.v3+json",
+            "Accept-Encoding": "gzip, deflate",
             "User-Agent": "PS5DumpRunnerInstaller/1.0",
         })
+        # Keep-alive pool shared by API calls and asset downloads
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                raise_on_status=False,
+            )
+        )
+        self._session.mount("https://", adapter)
 
-    def _make_request(self, url: str) -> dict:
+    def _load_response_cache(self) -> dict[str, dict]:
+        """Load cached API responses from disk."""
+        if not self._response_cache_path or not self._response_cache_path.exists():
+            return {}
+        try:
+            data = self._response_cache_path.read_bytes()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read GitHub response cache: {e}")
+            return {}
+
+    def _save_response_cache(self) -> None:
+        """Persist cached API responses to disk."""
+        if not self._response_cache_path:
+            return
+        try:
+            with open(self._response_cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._response_cache, f, separators=(",", ":"))
+        except (TypeError, IOError) as e:
+            logger.warning(f"Failed to write GitHub response cache: {e}")
+
+    def _log_rate_limit(self, response: "requests.Response") -> None:
+        """Warn when few unauthenticated API requests remain."""
+        remaining = str(response.headers.get("X-RateLimit-Remaining", ""))
+        if remaining.isdigit() and int(remaining) <= RATE_LIMIT_WARNING_THRESHOLD:
+            logger.warning(f"GitHub API rate limit nearly exhausted: {remaining} remaining")
+
+    def _make_request(self, url: str) -> Any:
         """
         Make a GET request to GitHub API.
 
+        Responses younger than RESPONSE_CACHE_TTL are served from cache;
+        older ones are revalidated with If-None-Match, and a 304 reply
+        reuses the cached body.
+
         Args:
             url: Full URL to request
 
         Returns:
-            JSON response as dict
+            Decoded JSON response
 
         Raises:
             GitHubConnectionError: If unable to connect
@@ -187,12 +295,40 @@ class GitHubClient:
             GitHubNotFoundError: If resource not found
             GitHubError: For other errors
         """
+        cached = self._response_cache.get(url)
+        if cached and time.time() - cached["fetched_at"] < RESPONSE_CACHE_TTL:
+            logger.debug(f"Using cached response for: {url}")
+            return cached["body"]
+
+        import requests
+
         try:
             logger.debug(f"Making request to: {url}")
-            response = self._session.get(url, timeout=self._timeout)
-
-            if response.status_code == 200:
-                return response.json()
+            headers = None
+            if cached and cached.get("etag"):
+                headers = {"If-None-Match": cached["etag"]}
+            response = self._session.get(url, timeout=self._timeout, headers=headers)
+            self._log_rate_limit(response)
+
+            if response.status_code == 304 and cached:
+                logger.debug(f"Response not modified: {url}")
+                cached["fetched_at"] = time.time()
+                self._save_response_cache()
+                return cached["body"]
+            elif response.status_code == 200:
+                try:
+                    body = orjson.loads(response.content) if orjson else response.json()
+                except ValueError:
+                    # orjson.JSONDecodeError and requests' JSONDecodeError
+                    # are both ValueErrors
+                    raise GitHubError(f"Invalid JSON response from {url}")
+                self._response_cache[url] = {
+                    "etag": response.headers.get("ETag"),
+                    "body": body,
+                    "fetched_at": time.time(),
+                }
+                self._save_response_cache()
+                return body
             elif response.status_code == 404:
                 raise GitHubNotFoundError(f"Resource not found: {url}")
             elif response.status_code == 403:
@@ -291,54 +427,118 @@ class GitHubClient:
         logger.info(f"Found release: {release.tag_name}")
         return release
 
-    def download_asset(
+    def download_asset_to_file(
         self,
         asset: ReleaseAsset,
-        callback: Optional[callable] = None
-    ) -> bytes:
+        fileobj: IO[bytes],
+        callback: Optional[callable] = None,
+        etag: Optional[str] = None,
+        resume_from: int = 0,
+        if_range: Optional[str] = None
+    ) -> AssetDownload:
         """
-        Download a release asset.
+        Download a release asset directly into a file object.
+
+        Chunks are written and hashed as they arrive, so the asset is
+        never held in memory as a whole.
 
         Args:
             asset: ReleaseAsset to download
+            fileobj: Writable binary file object
             callback: Optional progress callback(bytes_downloaded, total_bytes)
+            etag: ETag of a previously downloaded copy; if the server reports
+                it unchanged, nothing is written
+            resume_from: Number of bytes of the asset already in fileobj;
+                the rest is requested with a Range header. fileobj must then
+                be readable and seekable. If the server answers with the
+                full asset instead, fileobj is truncated and rewritten.
+            if_range: Validator of the partial copy (from
+                GitHubConnectionError.validator), sent as If-Range so a
+                changed asset is sent in full rather than spliced
 
         Returns:
-            Downloaded file content as bytes
+            AssetDownload with size, SHA-256 and ETag of the downloaded content
 
         Raises:
             GitHubConnectionError: If unable to connect
             GitHubError: For other errors
         """
+        import requests
+
+        validator = None
         try:
             logger.info(f"Downloading asset: {asset.name} ({asset.size} bytes)")
 
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if resume_from:
+                headers["Range"] = f"bytes={resume_from}-"
+                if if_range:
+                    headers["If-Range"] = if_range
+
             response = self._session.get(
                 asset.download_url,
                 stream=True,
-                timeout=self._timeout
+                timeout=self._timeout,
+                headers=headers or None
             )
+            if etag and response.status_code == 304:
+                logger.info(f"Asset not modified, keeping cached copy: {asset.name}")
+                return AssetDownload(size=0, sha256="", etag=etag, not_modified=True)
             response.raise_for_status()
 
-            total_size = int(response.headers.get("content-length", asset.size))
-            chunks = []
+            # If-Range needs a strong ETag; fall back to the modification date
+            validator = response.headers.get("ETag")
+            if not validator or validator.startswith("W/"):
+                validator = response.headers.get("Last-Modified")
+
             downloaded = 0
+            digest = hashlib.sha256()
+
+            if resume_from and response.status_code == 206:
+                # Hash the bytes already on disk so the digest covers the
+                # whole asset, leaving the file positioned at its end
+                logger.info(f"Resuming {asset.name} from byte {resume_from}")
+                fileobj.seek(0)
+                while downloaded < resume_from:
+                    chunk = fileobj.read(min(DOWNLOAD_CHUNK_SIZE, resume_from - downloaded))
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    downloaded += len(chunk)
+            elif resume_from:
+                # Range not honoured, or the asset changed; start over
+                fileobj.seek(0)
+                fileobj.truncate()
 
-            for chunk in response.iter_content(chunk_size=8192):
+            total_size = downloaded + int(
+                response.headers.get("content-length", asset.size - downloaded)
+            )
+
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
-                    chunks.append(chunk)
+                    fileobj.write(chunk)
+                    digest.update(chunk)
                     downloaded += len(chunk)
                     if callback:
                         callback(downloaded, total_size)
 
-            content = b"".join(chunks)
-            logger.info(f"Downloaded {len(content)} bytes for {asset.name}")
-            return content
+            logger.info(f"Downloaded {downloaded} bytes for {asset.name}")
+            return AssetDownload(
+                size=downloaded,
+                sha256=digest.hexdigest(),
+                etag=response.headers.get("ETag"),
+            )
 
         except requests.exceptions.Timeout:
             raise GitHubConnectionError("Download timed out")
-        except requests.exceptions.ConnectionError as e:
-            raise GitHubConnectionError(f"Download failed: {e}")
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            # ChunkedEncodingError covers connections dropped mid-stream
+            raise GitHubConnectionError(f"Download failed: {e}", validator=validator)
         except requests.exceptions.RequestException as e:
             raise GitHubError(f"Download failed: {e}")
 
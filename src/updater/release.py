@@ -3,6 +3,8 @@
 Defines enums and dataclasses for dump_runner releases.
 """
 
+import os
+import stat
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -10,13 +12,22 @@ from pathlib import Path
 from typing import Optional
 
 
+def _file_size(path: Path) -> Optional[int]:
+    """Get a regular file's size with a single stat, or None if not a readable file."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
 class ReleaseSource(Enum):
     """Source of dump_runner files."""
     GITHUB = "github"  # Official release from EchoStretch/dump_runner
     LOCAL = "local"    # User-provided experimental files
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DumpRunnerRelease:
     """Represents a version of dump_runner files."""
     version: str
@@ -47,14 +58,13 @@ class DumpRunnerRelease:
     @property
     def files_exist(self) -> bool:
         """True if both required files exist."""
-        return self.elf_path.exists() and self.js_path.exists()
+        return os.path.exists(self.elf_path) and os.path.exists(self.js_path)
 
     @property
     def files_valid(self) -> bool:
         """True if files exist and have content."""
-        if not self.files_exist:
-            return False
-        return self.elf_path.stat().st_size > 0 and self.js_path.stat().st_size > 0
+        # One stat per file covers both the existence and size checks
+        return bool(_file_size(self.elf_path)) and bool(_file_size(self.js_path))
 
     @classmethod
     def from_local_files(
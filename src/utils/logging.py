@@ -7,32 +7,98 @@ and sensitive data are never written to log files.
 import logging
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+# Password in various formats (password, passwd, pass)
+_PASSWORD_PATTERN = re.compile(r'((?:password|passwd|pass)["\s:=]+)[^\s,}\]]+', re.IGNORECASE)
+# FTP URLs with credentials
+_FTP_CREDENTIALS_PATTERN = re.compile(r'ftp://[^:]+:[^@]+@')
+# IP addresses (partial redaction for privacy)
+_IP_ADDRESS_PATTERN = re.compile(r'(\d+\.\d+\.)\d+\.\d+')
+
 # PII patterns to redact from logs
 PII_PATTERNS = [
-    # Password in various formats
-    (re.compile(r'(password["\s:=]+)[^\s,}\]]+', re.IGNORECASE), r'\1[REDACTED]'),
-    (re.compile(r'(passwd["\s:=]+)[^\s,}\]]+', re.IGNORECASE), r'\1[REDACTED]'),
-    (re.compile(r'(pass["\s:=]+)[^\s,}\]]+', re.IGNORECASE), r'\1[REDACTED]'),
-    # FTP URLs with credentials
-    (re.compile(r'ftp://[^:]+:[^@]+@'), 'ftp://[REDACTED]@'),
-    # IP addresses (partial redaction for privacy)
-    (re.compile(r'(\d+\.\d+\.)\d+\.\d+'), r'\1*.*'),
+    (_PASSWORD_PATTERN, r'\1[REDACTED]'),
+    (_FTP_CREDENTIALS_PATTERN, 'ftp://[REDACTED]@'),
+    (_IP_ADDRESS_PATTERN, r'\1*.*'),
 ]
 
+_redact_passwords = _PASSWORD_PATTERN.sub
+_redact_ftp_credentials = _FTP_CREDENTIALS_PATTERN.sub
+_redact_ip_addresses = _IP_ADDRESS_PATTERN.sub
+
+# Cheap pre-check so most records skip the full IP address pattern
+_has_digit_dot = re.compile(r'\d\.\d').search
+
+# Loggers already returned by get_logger, keyed by name
+_LOGGERS: dict[str, logging.Logger] = {}
+
+# Application log line format
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Distinct log messages whose redacted form is remembered
+REDACTION_CACHE_SIZE = 256
+
+
+def _redact(text: str) -> str:
+    """Redact PII from text."""
+    # Only run a substitution when its trigger text is present
+    if "pass" in text.lower():
+        text = _redact_passwords(r'\1[REDACTED]', text)
+    if "ftp://" in text:
+        text = _redact_ftp_credentials('ftp://[REDACTED]@', text)
+    # A dotted quad needs three dots; count() is a plain C scan
+    if text.count(".") >= 3 and _has_digit_dot(text):
+        text = _redact_ip_addresses(r'\1*.*', text)
+    return text
+
+
+# Progress loops log the same messages repeatedly
+_redact_message = lru_cache(maxsize=REDACTION_CACHE_SIZE)(_redact)
+
 
 class PIIRedactingFormatter(logging.Formatter):
-    """Custom formatter that redacts PII from log messages."""
+    """
+    Custom formatter that redacts PII from log messages.
+
+    The message, exception and stack text are redacted separately, so
+    the timestamp that makes every formatted line unique does not stop
+    repeated messages from reusing a cached redaction.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter (same arguments as logging.Formatter)."""
+        super().__init__(*args, **kwargs)
+        # The application format can be built directly, skipping the
+        # generic style dispatch in logging.Formatter.format
+        self._is_app_format = (
+            self._fmt == LOG_FORMAT and isinstance(self._style, logging.PercentStyle)
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record, redacting any PII."""
-        message = super().format(record)
-        for pattern, replacement in PII_PATTERNS:
-            message = pattern.sub(replacement, message)
-        return message
+        if self._is_app_format and not (record.exc_info or record.exc_text or record.stack_info):
+            record.message = _redact_message(record.getMessage())
+            record.asctime = self.formatTime(record, self.datefmt)
+            return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+        return super().format(record)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the record with its message redacted."""
+        record.message = _redact_message(record.message)
+        return super().formatMessage(record)
+
+    def formatException(self, ei) -> str:
+        """Format and redact exception information."""
+        return _redact(super().formatException(ei))
+
+    def formatStack(self, stack_info: str) -> str:
+        """Format and redact stack information."""
+        return _redact(super().formatStack(stack_info))
 
 
 def setup_logging(
@@ -58,10 +124,7 @@ def setup_logging(
     logger.handlers.clear()
 
     # Create formatter with PII redaction
-    formatter = PIIRedactingFormatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = PIIRedactingFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     # Console handler
     if console:
@@ -91,4 +154,7 @@ def get_logger(name: str = "ps5_dump_runner") -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS.setdefault(name, logging.getLogger(name))
+    return logger
@@ -4,8 +4,8 @@ Provides thread-safe utilities for running background operations
 and updating the GUI from worker threads.
 """
 
-import queue
 import threading
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Generic, Optional, TypeVar
@@ -23,7 +23,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult(Generic[T]):
     """Result of a background task."""
     status: TaskStatus
@@ -45,12 +45,13 @@ class ThreadedTask(Generic[T]):
         task = ThreadedTask(long_operation)
         task.start()
 
-        # In GUI update loop:
-        while task.is_running:
-            progress = task.get_progress()
-            if progress:
-                update_progress_bar(progress)
+        # In GUI update loop (scheduled, e.g. with root.after):
+        progress = task.get_progress()
+        if progress is not None:
+            update_progress_bar(progress)
 
+        # Outside the GUI thread, block until done:
+        task.wait()
         result = task.get_result()
     """
 
@@ -76,9 +77,12 @@ class ThreadedTask(Generic[T]):
         self._on_complete = on_complete
 
         self._thread: Optional[threading.Thread] = None
-        self._progress_queue: queue.Queue[float] = queue.Queue()
+        # Only the latest progress value matters to the GUI
+        self._progress: Optional[float] = None
+        self._progress_lock = threading.Lock()
         self._result: Optional[TaskResult[T]] = None
         self._cancelled = threading.Event()
+        self._done = threading.Event()
         self._status = TaskStatus.PENDING
 
     @property
@@ -126,6 +130,8 @@ class ThreadedTask(Generic[T]):
             self._result = TaskResult(status=TaskStatus.FAILED, error=e)
             self._status = TaskStatus.FAILED
 
+        self._done.set()
+
         if self._on_complete:
             self._on_complete(self._result)
 
@@ -136,29 +142,38 @@ class ThreadedTask(Generic[T]):
         Args:
             progress: Progress value between 0.0 and 1.0
         """
-        self._progress_queue.put(min(1.0, max(0.0, progress)))
+        with self._progress_lock:
+            self._progress = min(1.0, max(0.0, progress))
 
     def get_progress(self) -> Optional[float]:
         """
         Get the latest progress update.
 
+        Earlier updates not yet read are superseded and discarded.
+
         Returns:
-            Progress value (0.0-1.0) or None if no update available
+            Progress value (0.0-1.0) or None if no update since the last call
         """
-        try:
-            return self._progress_queue.get_nowait()
-        except queue.Empty:
-            return None
+        with self._progress_lock:
+            progress, self._progress = self._progress, None
+        return progress
 
     def get_all_progress(self) -> list[float]:
-        """Get all pending progress updates."""
-        updates = []
-        while True:
-            try:
-                updates.append(self._progress_queue.get_nowait())
-            except queue.Empty:
-                break
-        return updates
+        """Get pending progress updates (at most the latest one)."""
+        progress = self.get_progress()
+        return [] if progress is None else [progress]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the task finishes.
+
+        Args:
+            timeout: Maximum time to wait (None = forever)
+
+        Returns:
+            True if the task finished, False if the timeout expired
+        """
+        return self._done.wait(timeout)
 
     def get_result(self, timeout: Optional[float] = None) -> TaskResult[T]:
         """
@@ -173,10 +188,8 @@ class ThreadedTask(Generic[T]):
         Raises:
             TimeoutError: If timeout expires before task completes
         """
-        if self._thread:
-            self._thread.join(timeout=timeout)
-            if self._thread.is_alive():
-                raise TimeoutError("Task did not complete within timeout")
+        if self._thread and not self._done.wait(timeout):
+            raise TimeoutError("Task did not complete within timeout")
 
         return self._result or TaskResult(status=TaskStatus.PENDING)
 
@@ -205,7 +218,10 @@ class GUIUpdateQueue:
 
     def __init__(self):
         """Initialize the update queue."""
-        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue()
+        # Unbounded: status updates must not be dropped
+        self._queue: deque[tuple[str, Any]] = deque()
+        # Guards swapping the deque out in get_all
+        self._lock = threading.Lock()
 
     def put(self, update_type: str, data: Any) -> None:
         """
@@ -215,7 +231,8 @@ class GUIUpdateQueue:
             update_type: Type identifier for the update
             data: Update data
         """
-        self._queue.put((update_type, data))
+        with self._lock:
+            self._queue.append((update_type, data))
 
     def get(self) -> Optional[tuple[str, Any]]:
         """
@@ -224,10 +241,8 @@ class GUIUpdateQueue:
         Returns:
             Tuple of (update_type, data) or None if empty
         """
-        try:
-            return self._queue.get_nowait()
-        except queue.Empty:
-            return None
+        with self._lock:
+            return self._queue.popleft() if self._queue else None
 
     def get_all(self) -> list[tuple[str, Any]]:
         """
@@ -236,18 +251,11 @@ class GUIUpdateQueue:
         Returns:
             List of (update_type, data) tuples
         """
-        updates = []
-        while True:
-            try:
-                updates.append(self._queue.get_nowait())
-            except queue.Empty:
-                break
-        return updates
+        with self._lock:
+            updates, self._queue = self._queue, deque()
+        return list(updates)
 
     def clear(self) -> None:
         """Clear all pending updates."""
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        with self._lock:
+            self._queue.clear()
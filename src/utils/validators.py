@@ -4,21 +4,33 @@ Provides validation functions for user inputs like IP addresses,
 ports, and file paths.
 """
 
+import os
 import re
+import stat
 from pathlib import Path
 from typing import Optional, Tuple
 
 
-# IPv4 address pattern
+# IPv4 address pattern (use with fullmatch)
 IPV4_PATTERN = re.compile(
-    r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-    r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
+    r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
+    r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)'
 )
 
-# Hostname pattern (simplified)
-HOSTNAME_PATTERN = re.compile(
-    r'^(?=.{1,253}$)(?!-)[A-Za-z0-9-]{1,63}(?<!-)(\.[A-Za-z0-9-]{1,63})*$'
-)
+# Hostname limits (RFC 1035)
+MAX_HOSTNAME_LENGTH = 253
+MAX_LABEL_LENGTH = 63
+
+
+def _is_valid_hostname_label(label: str) -> bool:
+    """Check a single dot-separated hostname label."""
+    return (
+        0 < len(label) <= MAX_LABEL_LENGTH
+        and label[0] != "-"
+        and label[-1] != "-"
+        and label.isascii()
+        and label.replace("-", "").isalnum()
+    )
 
 
 def validate_ip_address(ip: str) -> Tuple[bool, Optional[str]]:
@@ -36,7 +48,7 @@ def validate_ip_address(ip: str) -> Tuple[bool, Optional[str]]:
 
     ip = ip.strip()
 
-    if IPV4_PATTERN.match(ip):
+    if IPV4_PATTERN.fullmatch(ip):
         return True, None
 
     return False, f"Invalid IP address format: {ip}"
@@ -57,7 +69,10 @@ def validate_hostname(hostname: str) -> Tuple[bool, Optional[str]]:
 
     hostname = hostname.strip()
 
-    if HOSTNAME_PATTERN.match(hostname):
+    # Validated label by label; linear time with no regex backtracking
+    if len(hostname) <= MAX_HOSTNAME_LENGTH and all(
+        _is_valid_hostname_label(label) for label in hostname.split(".")
+    ):
         return True, None
 
     return False, f"Invalid hostname format: {hostname}"
@@ -101,13 +116,14 @@ def validate_port(port: int) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(port, int):
+    # Exact type check keeps the common int case off the conversion path
+    if type(port) is not int:
         try:
             port = int(port)
         except (ValueError, TypeError):
             return False, "Port must be a number"
 
-    if port < 1 or port > 65535:
+    if not 1 <= port <= 65535:
         return False, f"Port must be between 1 and 65535, got {port}"
 
     return True, None
@@ -123,18 +139,39 @@ def validate_timeout(timeout: int) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(timeout, int):
+    if type(timeout) is not int:
         try:
             timeout = int(timeout)
         except (ValueError, TypeError):
             return False, "Timeout must be a number"
 
-    if timeout < 5 or timeout > 300:
+    if not 5 <= timeout <= 300:
         return False, f"Timeout must be between 5 and 300 seconds, got {timeout}"
 
     return True, None
 
 
+def _stat_file(path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+    """
+    Stat a path once and check it is a regular file.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        Tuple of (stat_result, error_message); stat_result is None on error
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None, f"File does not exist: {path}"
+
+    if not stat.S_ISREG(st.st_mode):
+        return None, f"Path is not a file: {path}"
+
+    return st, None
+
+
 def validate_file_path(path: Path, must_exist: bool = True) -> Tuple[bool, Optional[str]]:
     """
     Validate a file path.
@@ -153,10 +190,9 @@ def validate_file_path(path: Path, must_exist: bool = True) -> Tuple[bool, Optio
         path = Path(path)
 
     if must_exist:
-        if not path.exists():
-            return False, f"File does not exist: {path}"
-        if not path.is_file():
-            return False, f"Path is not a file: {path}"
+        st, error = _stat_file(path)
+        if st is None:
+            return False, error
 
     return True, None
 
@@ -175,21 +211,17 @@ def validate_dump_runner_files(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Validate ELF file
-    is_valid, error = validate_file_path(elf_path, must_exist=True)
-    if not is_valid:
-        return False, f"dump_runner.elf: {error}"
-
-    if elf_path.stat().st_size == 0:
-        return False, "dump_runner.elf is empty"
+    for name, path in (("dump_runner.elf", elf_path), ("homebrew.js", js_path)):
+        if not path:
+            return False, f"{name}: File path is required"
 
-    # Validate JS file
-    is_valid, error = validate_file_path(js_path, must_exist=True)
-    if not is_valid:
-        return False, f"homebrew.js: {error}"
+        # One stat per file gives existence, type and size
+        st, error = _stat_file(path)
+        if st is None:
+            return False, f"{name}: {error}"
 
-    if js_path.stat().st_size == 0:
-        return False, "homebrew.js is empty"
+        if st.st_size == 0:
+            return False, f"{name} is empty"
 
     return True, None
 
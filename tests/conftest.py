@@ -1,5 +1,7 @@
 """Pytest configuration and shared fixtures for PS5 Dump Runner FTP Installer tests."""
 
+import shutil
+
 import pytest
 from pathlib import Path
 from typing import Generator
@@ -12,8 +14,14 @@ TEST_FTP_PORT = 2121
 TEST_FTP_USER = "testuser"
 TEST_FTP_PASS = "testpass"
 
+# Fixture directories, built once at import
+FIXTURES_PATH = Path(__file__).resolve().parent / "fixtures"
+MOCK_DUMPS_PATH = FIXTURES_PATH / "mock_dumps"
+SAMPLE_RELEASES_PATH = FIXTURES_PATH / "sample_releases"
+TEST_CONFIGS_PATH = FIXTURES_PATH / "test_configs"
+
 
-@dataclass
+@dataclass(slots=True)
 class MockFTPConfig:
     """Configuration for mock FTP server in tests."""
     host: str = TEST_FTP_HOST
@@ -28,28 +36,28 @@ def ftp_config() -> MockFTPConfig:
     return MockFTPConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_path() -> Path:
     """Return the path to test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_PATH
 
 
-@pytest.fixture
-def mock_dumps_path(fixtures_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def mock_dumps_path() -> Path:
     """Return the path to mock dumps fixtures."""
-    return fixtures_path / "mock_dumps"
+    return MOCK_DUMPS_PATH
 
 
-@pytest.fixture
-def sample_releases_path(fixtures_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_releases_path() -> Path:
     """Return the path to sample releases fixtures."""
-    return fixtures_path / "sample_releases"
+    return SAMPLE_RELEASES_PATH
 
 
-@pytest.fixture
-def test_configs_path(fixtures_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def test_configs_path() -> Path:
     """Return the path to test configuration fixtures."""
-    return fixtures_path / "test_configs"
+    return TEST_CONFIGS_PATH
 
 
 @pytest.fixture
@@ -60,17 +68,23 @@ def temp_settings_file(tmp_path: Path) -> Generator[Path, None, None]:
     # Cleanup handled by tmp_path fixture
 
 
+@pytest.fixture(scope="session")
+def _sample_files_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample dump_runner files once per test session."""
+    template_dir = tmp_path_factory.mktemp("sample_files")
+    (template_dir / "dump_runner.elf").write_bytes(b"\x7fELF" + b"\x00" * 100)  # Mock ELF header
+    (template_dir / "homebrew.js").write_text("// Mock homebrew.js for testing\nconsole.log('test');")
+    return template_dir
+
+
 @pytest.fixture
-def sample_dump_runner_elf(tmp_path: Path) -> Path:
+def sample_dump_runner_elf(tmp_path: Path, _sample_files_dir: Path) -> Path:
     """Create a mock dump_runner.elf file for testing."""
-    elf_file = tmp_path / "dump_runner.elf"
-    elf_file.write_bytes(b"\x7fELF" + b"\x00" * 100)  # Mock ELF header
-    return elf_file
+    # Copied rather than hard-linked so tests may modify their file
+    return Path(shutil.copyfile(_sample_files_dir / "dump_runner.elf", tmp_path / "dump_runner.elf"))
 
 
 @pytest.fixture
-def sample_homebrew_js(tmp_path: Path) -> Path:
+def sample_homebrew_js(tmp_path: Path, _sample_files_dir: Path) -> Path:
     """Create a mock homebrew.js file for testing."""
-    js_file = tmp_path / "homebrew.js"
-    js_file.write_text("// Mock homebrew.js for testing\nconsole.log('test');")
-    return js_file
+    return Path(shutil.copyfile(_sample_files_dir / "homebrew.js", tmp_path / "homebrew.js"))
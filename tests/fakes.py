@@ -0,0 +1,157 @@
+"""Hand-written fakes for FTP tests.
+
+Plain classes with configured responses and call records, used where a
+MagicMock would need several side_effect closures to express the same
+server behavior.
+"""
+
+import posixpath
+from ftplib import error_perm
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from unittest.mock import Mock
+
+from src.ftp.connection import FTPConnectionManager
+
+
+def format_list_line(name: str, is_dir: bool) -> str:
+    """Format a Unix-style LIST line for a directory or file entry."""
+    if is_dir:
+        return f"drwxr-xr-x  2 root root 4096 Jan  1 12:00 {name}"
+    return f"-rw-r--r--  1 root root 1024 Jan  1 12:00 {name}"
+
+
+class FakeFilesystem:
+    """Directory tree mapping absolute paths to (name, is_dir) entries."""
+
+    def __init__(self, tree: Dict[str, List[Tuple[str, bool]]]):
+        """
+        Create the filesystem with the working directory at the root.
+
+        Args:
+            tree: Absolute directory path -> entries it contains
+        """
+        self.tree = tree
+        self.cwd = "/"
+
+    def resolve(self, path: str) -> str:
+        """Resolve path against the working directory."""
+        return posixpath.normpath(posixpath.join(self.cwd, path))
+
+    def is_file(self, path: str) -> bool:
+        """True if path resolves to a file entry of its parent directory."""
+        parent, _, name = self.resolve(path).rpartition("/")
+        return (name, False) in self.tree.get(parent or "/", [])
+
+    def cd(self, path: str) -> None:
+        if self.is_file(path):
+            raise error_perm("550 Not a directory")
+        self.cwd = self.resolve(path)
+
+    def list(self, callback: Callable[[str], None], path: Optional[str] = None) -> None:
+        """Pass a LIST line for each entry of path (default: cwd) to callback."""
+        if path is not None and self.is_file(path):
+            # Like ls -l, LIST of a file lists the file itself
+            callback(format_list_line(posixpath.basename(self.resolve(path)), False))
+            return
+        listed = self.resolve(path) if path is not None else self.cwd
+        for name, is_dir in self.tree.get(listed, []):
+            callback(format_list_line(name, is_dir))
+
+
+class FakeFTP:
+    """
+    Minimal stand-in for ftplib.FTP covering what DumpScanner uses.
+
+    LIST output comes from ``filesystem`` when given, otherwise every
+    listing returns ``list_lines``.
+    """
+
+    def __init__(
+        self,
+        *,
+        nlst_result: Optional[List[str]] = None,
+        nlst_error: Union[Exception, Sequence[Exception], None] = None,
+        list_lines: Iterable[str] = (),
+        filesystem: Optional[FakeFilesystem] = None,
+        dir_path_error: Optional[Exception] = None,
+        cwd_error: Optional[Exception] = None,
+        mlsd_error: Optional[Exception] = None,
+    ):
+        """
+        Configure the fake server's responses.
+
+        Args:
+            nlst_result: Entries returned by nlst()
+            nlst_error: Error raised by nlst(), or one error per call in order
+            list_lines: LIST output lines when there is no filesystem
+            filesystem: Directory tree to navigate and list
+            dir_path_error: Error raised by dir() when given a path argument
+            cwd_error: Error raised by cwd()
+            mlsd_error: Error raised by mlsd()
+        """
+        self.nlst_result = nlst_result or []
+        self.nlst_error = nlst_error
+        self.list_lines = tuple(list_lines)
+        self.filesystem = filesystem or FakeFilesystem({})
+        self.dir_path_error = dir_path_error
+        self.cwd_error = cwd_error
+        self.mlsd_error = mlsd_error
+
+        self.nlst_calls: List[str] = []
+        self.dir_calls: List[Optional[str]] = []
+        self.cwd_calls: List[str] = []
+        self.pwd_calls = 0
+        self.voidcmd_calls: List[str] = []
+        self.mlsd_calls: List[str] = []
+
+    def nlst(self, path: str) -> List[str]:
+        self.nlst_calls.append(path)
+        error = self.nlst_error
+        if isinstance(error, (list, tuple)):
+            error = error[len(self.nlst_calls) - 1]
+        if error is not None:
+            raise error
+        return list(self.nlst_result)
+
+    def dir(self, *args) -> None:
+        # ftp.dir([path,] callback): the callback is always the last argument
+        *path_args, callback = args
+        path = path_args[0] if path_args else None
+        self.dir_calls.append(path)
+        if path is not None and self.dir_path_error is not None:
+            raise self.dir_path_error
+        if self.filesystem.tree:
+            self.filesystem.list(callback, path)
+        else:
+            for line in self.list_lines:
+                callback(line)
+
+    def mlsd(self, path: str = "", facts: Sequence[str] = ()) -> Iterator[Tuple[str, Dict[str, str]]]:
+        self.mlsd_calls.append(path)
+        if self.mlsd_error is not None:
+            raise self.mlsd_error
+        for name, is_dir in self.filesystem.tree.get(self.filesystem.resolve(path), []):
+            yield name, {"type": "dir" if is_dir else "file"}
+
+    def cwd(self, path: str) -> None:
+        self.cwd_calls.append(path)
+        if self.cwd_error is not None:
+            raise self.cwd_error
+        self.filesystem.cd(path)
+
+    def pwd(self) -> str:
+        self.pwd_calls += 1
+        return self.filesystem.cwd
+
+    def voidcmd(self, cmd: str) -> str:
+        self.voidcmd_calls.append(cmd)
+        return "200 OK"
+
+
+def fake_connection(ftp) -> Mock:
+    """Mock a connected FTPConnectionManager at "/" that wraps ftp."""
+    connection = Mock(spec=FTPConnectionManager)
+    connection.is_connected = True
+    connection.ftp = ftp
+    connection.home_dir = "/"
+    return connection
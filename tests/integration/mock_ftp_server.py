@@ -5,6 +5,8 @@ the PS5 FTP directory structure.
 """
 
 import os
+import shutil
+import socket
 import tempfile
 import threading
 import time
@@ -30,6 +32,10 @@ class MockPS5FTPServer:
     DEFAULT_USER = "testuser"
     DEFAULT_PASS = "testpass"
 
+    # Readiness probe: attempts and delay between them (seconds)
+    READY_ATTEMPTS = 50
+    READY_INTERVAL = 0.005
+
     def __init__(
         self,
         port: int = 2121,
@@ -40,7 +46,8 @@ class MockPS5FTPServer:
         Initialize the mock FTP server.
 
         Args:
-            port: Port to listen on
+            port: Port to listen on (0 picks a free port, readable from
+                ``port`` after start())
             username: FTP username
             password: FTP password
         """
@@ -114,6 +121,15 @@ class MockPS5FTPServer:
 
         return local_path
 
+    def reset(self) -> None:
+        """Restore the default PS5 directory structure, discarding changes."""
+        for child in self.root_dir.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
+        self._create_ps5_structure()
+
     def start(self) -> None:
         """Start the FTP server in a background thread."""
         # Create temporary directory for mock filesystem
@@ -137,15 +153,25 @@ class MockPS5FTPServer:
         handler.authorizer = authorizer
         handler.passive_ports = range(60000, 60100)
 
-        # Create server
+        # Create server (pyftpdlib binds with SO_REUSEADDR and listens here)
         self._server = FTPServer((self.host, self.port), handler)
+        self.port = self._server.socket.getsockname()[1]
 
         # Start in background thread
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
 
-        # Give server time to start
-        time.sleep(0.2)
+        self._wait_until_ready()
+
+    def _wait_until_ready(self) -> None:
+        """Return as soon as the server accepts connections."""
+        for _ in range(self.READY_ATTEMPTS):
+            try:
+                with socket.create_connection((self.host, self.port), timeout=0.1):
+                    return
+            except OSError:
+                time.sleep(self.READY_INTERVAL)
+        raise RuntimeError(f"Mock FTP server did not start on port {self.port}")
 
     def stop(self) -> None:
         """Stop the FTP server and clean up."""
@@ -176,7 +202,7 @@ import pytest
 @pytest.fixture
 def mock_ftp_server():
     """Pytest fixture providing a mock FTP server."""
-    server = MockPS5FTPServer(port=21210)  # Use non-standard port for tests
+    server = MockPS5FTPServer(port=0)  # Any free port, so test workers don't collide
     server.start()
     yield server
     server.stop()
@@ -5,6 +5,7 @@ and uploading files using a mock FTP server.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.ftp.connection import FTPConnectionConfig, FTPConnectionManager, ConnectionState
@@ -14,13 +15,47 @@ from src.ftp.exceptions import FTPConnectionError, FTPAuthenticationError
 from .mock_ftp_server import MockPS5FTPServer
 
 
-@pytest.fixture
-def ftp_server():
-    """Provide a running mock FTP server."""
-    server = MockPS5FTPServer(port=21211)
+@pytest.fixture(scope="session")
+def ftp_server(request):
+    """Provide a running mock FTP server, started once per session."""
+    server = MockPS5FTPServer(port=0)
     server.start()
-    yield server
-    server.stop()
+    request.addfinalizer(server.stop)
+    return server
+
+
+@pytest.fixture
+def ftp_server_reset(ftp_server):
+    """Restore the mock filesystem after a test that modifies it."""
+    yield ftp_server
+    ftp_server.reset()
+
+
+@pytest.fixture(scope="module")
+def connected_manager(ftp_server):
+    """Provide one manager connected to the mock server for the module."""
+    manager = FTPConnectionManager()
+    config = FTPConnectionConfig(
+        host=ftp_server.host,
+        port=ftp_server.port,
+        username=ftp_server.username,
+    )
+    manager.connect(config, password=ftp_server.password)
+    yield manager
+    manager.disconnect()
+
+
+@pytest.fixture(scope="module")
+def temp_files(tmp_path_factory):
+    """Create the (read-only) test files for upload once per module."""
+    tmp_path = tmp_path_factory.mktemp("uploads")
+    elf_path = tmp_path / "dump_runner.elf"
+    js_path = tmp_path / "homebrew.js"
+
+    elf_path.write_bytes(b"\x7fELF" + b"\x00" * 100)
+    js_path.write_text("// homebrew.js test content")
+
+    return elf_path, js_path
 
 
 @pytest.fixture
@@ -85,17 +120,12 @@ class TestFTPConnectionWorkflow:
 class TestDumpScannerWorkflow:
     """Integration tests for dump scanning workflow."""
 
-    def test_scan_finds_dumps(self, ftp_server, connection_manager):
+    def test_scan_finds_dumps(self, ftp_server, connected_manager):
         """Test scanning finds game dumps in mock structure."""
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        connection_manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
-        scanner = DumpScanner(connection_manager)
+        scanner = DumpScanner(manager)
         dumps = scanner.scan()
 
         # Should find dumps in /data/homebrew, /mnt/usb0/homebrew, /mnt/ext0/homebrew
@@ -109,19 +139,12 @@ class TestDumpScannerWorkflow:
         usb_dumps = scanner.get_dumps_by_location(LocationType.USB0)
         assert len(usb_dumps) >= 1
 
-        connection_manager.disconnect()
-
-    def test_scan_detects_installed_files(self, ftp_server, connection_manager):
+    def test_scan_detects_installed_files(self, ftp_server, connected_manager):
         """Test scanning detects dumps with files installed."""
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        connection_manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
-        scanner = DumpScanner(connection_manager)
+        scanner = DumpScanner(manager)
         dumps = scanner.scan()
 
         # Find CUSA00001 which has files installed
@@ -132,18 +155,26 @@ class TestDumpScannerWorkflow:
         assert cusa00001.has_js is True
         assert cusa00001.installation_status != InstallationStatus.NOT_INSTALLED
 
-        connection_manager.disconnect()
+    def test_mlsd_scan_matches_nlst_scan(self, ftp_server, connected_manager):
+        """Test an MLSD scan finds the same dumps and files as NLST/LIST."""
+        manager = connected_manager
+        assert manager.is_connected
 
-    def test_scan_multiple_times(self, ftp_server, connection_manager):
-        """Test scanning multiple times updates results."""
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
+        expected = DumpScanner(manager).scan()
+        scanner = DumpScanner(manager, use_mlsd=True)
+        dumps = scanner.scan()
+
+        assert scanner._use_mlsd is True
+        # Listing order is up to the server and may differ between commands
+        assert sorted((d.path, d.has_elf, d.has_js) for d in dumps) == sorted(
+            (d.path, d.has_elf, d.has_js) for d in expected
         )
 
-        connection_manager.connect(config, password=ftp_server.password)
-        scanner = DumpScanner(connection_manager)
+    def test_scan_multiple_times(self, ftp_server, ftp_server_reset, connected_manager):
+        """Test scanning multiple times updates results."""
+        manager = connected_manager
+        assert manager.is_connected
+        scanner = DumpScanner(manager)
 
         # First scan
         dumps1 = scanner.scan()
@@ -151,6 +182,7 @@ class TestDumpScannerWorkflow:
 
         # Add a new game dump
         ftp_server.add_game_dump("/data/homebrew/NEWGAME01")
+        scanner.invalidate()
 
         # Second scan should find the new dump
         dumps2 = scanner.scan()
@@ -163,7 +195,90 @@ class TestDumpScannerWorkflow:
         assert new_dump is not None
         assert new_dump.name == "NEWGAME01"
 
-        connection_manager.disconnect()
+    def test_rescan_reuses_listings_but_not_dump_status(
+        self, ftp_server, ftp_server_reset, connected_manager, monkeypatch
+    ):
+        """Test a rescan within the TTL skips base listings yet sees new files."""
+        manager = connected_manager
+        assert manager.is_connected
+        scanner = DumpScanner(manager, scan_paths=["/data/homebrew/"])
+        scanner.scan()
+        assert not scanner.get_dump_by_path("/data/homebrew/CUSA00002").has_elf
+
+        # Install files behind the scanner's back, then count base listings
+        ftp_server.add_game_dump("/data/homebrew/CUSA00002", with_files=True)
+        ftp = manager.ftp
+        listed = []
+        real_nlst, real_dir = ftp.nlst, ftp.dir
+        monkeypatch.setattr(ftp, "nlst", lambda *args: listed.append(args) or real_nlst(*args))
+        monkeypatch.setattr(ftp, "dir", lambda *args: listed.append(args[:-1]) or real_dir(*args))
+
+        scanner.scan()
+
+        assert listed
+        assert not [args for args in listed if args and args[0].rstrip("/") == "/data/homebrew"]
+        dump = scanner.get_dump_by_path("/data/homebrew/CUSA00002")
+        assert dump.has_elf and dump.has_js
+
+
+class TestParallelScan:
+    """Integration tests for scanning over several FTP sessions."""
+
+    @pytest.mark.parametrize("max_connections", [1, 4, 8])
+    def test_parallel_scan_matches_sequential(
+        self, ftp_server, connected_manager, max_connections
+    ):
+        """Test a parallel scan finds the same dumps, in the same order."""
+        manager = connected_manager
+        assert manager.is_connected
+
+        sequential = DumpScanner(manager).scan()
+        scanner = DumpScanner(manager, max_connections=max_connections)
+        parallel = scanner.scan()
+
+        assert [d.path for d in parallel] == [d.path for d in sequential]
+        assert [d.has_elf for d in parallel] == [d.has_elf for d in sequential]
+        assert len({d.location_type for d in parallel}) == 3
+        assert manager.is_connected
+
+        scanner.close()
+
+    def test_rescan_reuses_sessions(self, ftp_server, connected_manager):
+        """Test a second parallel scan runs on the sessions of the first."""
+        manager = connected_manager
+        assert manager.is_connected
+        scanner = DumpScanner(manager, cache_ttl=0, max_connections=3)
+
+        first = scanner.scan()
+        sessions = [session.ftp for session in scanner._sessions]
+        second = scanner.scan()
+
+        assert [d.path for d in second] == [d.path for d in first]
+        assert sessions
+        assert [session.ftp for session in scanner._sessions] == sessions
+
+        scanner.close()
+        assert scanner._sessions == []
+
+    @pytest.mark.parametrize("n", [16])
+    def test_concurrent_connections(self, ftp_server, connected_manager, n):
+        """Test the mock server serves many sessions listing at once."""
+        manager = connected_manager
+        assert manager.is_connected
+
+        sessions = [manager.clone() for _ in range(n)]
+        try:
+            with ThreadPoolExecutor(max_workers=n) as executor:
+                listings = list(executor.map(
+                    lambda session: sorted(session.ftp.nlst("/data/homebrew")), sessions
+                ))
+        finally:
+            for session in sessions:
+                session.disconnect()
+
+        assert len(listings) == n
+        assert all(listing == listings[0] for listing in listings)
+        assert len(listings[0]) >= 3
 
 
 class TestCompleteWorkflow:
@@ -201,7 +316,7 @@ class TestCompleteWorkflow:
 
     def test_reconnect_after_disconnect(self, ftp_server):
         """Test reconnecting after disconnection."""
-        manager = FTPConnectionManager()
+        manager = FTPConnectionManager(pool_idle=30.0)
         config = FTPConnectionConfig(
             host=ftp_server.host,
             port=ftp_server.port,
@@ -211,41 +326,29 @@ class TestCompleteWorkflow:
         # First connection
         manager.connect(config, password=ftp_server.password)
         assert manager.is_connected
-        manager.disconnect()
+        first_session = manager.ftp
+        manager.disconnect(park=True)
         assert not manager.is_connected
 
-        # Reconnect
+        # Reconnect reuses the parked session
         manager.connect(config, password=ftp_server.password)
         assert manager.is_connected
+        assert manager.ftp is first_session
+        assert manager.list_directory("/data/homebrew")
         manager.disconnect()
+        manager.close_idle()
 
 
+@pytest.mark.usefixtures("ftp_server_reset")
 class TestUploadWorkflow:
     """Integration tests for file upload workflow."""
 
-    @pytest.fixture
-    def temp_files(self, tmp_path):
-        """Create temporary test files for upload."""
-        elf_path = tmp_path / "dump_runner.elf"
-        js_path = tmp_path / "homebrew.js"
-
-        elf_path.write_bytes(b"\x7fELF" + b"\x00" * 100)
-        js_path.write_text("// homebrew.js test content")
-
-        return elf_path, js_path
-
-    def test_upload_to_single_dump(self, ftp_server, temp_files):
+    def test_upload_to_single_dump(self, ftp_server, connected_manager, temp_files):
         """Test uploading files to a single dump."""
         from src.ftp.uploader import FileUploader
 
-        manager = FTPConnectionManager()
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
         scanner = DumpScanner(manager)
         dumps = scanner.scan()
@@ -271,20 +374,17 @@ class TestUploadWorkflow:
         assert result.js_uploaded is True
         assert result.bytes_transferred > 0
 
-        manager.disconnect()
-
-    def test_upload_to_multiple_dumps(self, ftp_server, temp_files):
-        """Test batch upload to multiple dumps."""
+    @pytest.mark.parametrize("parallel", [1, 4])
+    @pytest.mark.parametrize("blocksize", [8192, 65536, 262144])
+    def test_upload_to_multiple_dumps(
+        self, ftp_server, ftp_server_reset, connected_manager, temp_files,
+        tmp_path, monkeypatch, blocksize, parallel
+    ):
+        """Test batch upload to multiple dumps across block sizes and sessions."""
         from src.ftp.uploader import FileUploader
 
-        manager = FTPConnectionManager()
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
         scanner = DumpScanner(manager)
         dumps = scanner.scan()
@@ -292,13 +392,22 @@ class TestUploadWorkflow:
         # Select first 2 dumps
         target_dumps = dumps[:2]
 
-        elf_path, js_path = temp_files
-        uploader = FileUploader(manager)
+        # An ELF spanning several blocks at every block size
+        _, js_path = temp_files
+        elf_path = tmp_path / "dump_runner.elf"
+        elf_data = b"\x7fELF" + bytes(range(256)) * 2048
+        elf_path.write_bytes(elf_data)
+
+        monkeypatch.setattr(FileUploader, "BLOCK_SIZE", blocksize)
+        uploader = FileUploader(manager, max_connections=parallel)
 
         results = uploader.upload_batch(target_dumps, elf_path, js_path)
 
         assert len(results) == 2
         assert all(r.success for r in results)
+        for dump in target_dumps:
+            uploaded = ftp_server.root_dir / dump.path.lstrip("/") / "dump_runner.elf"
+            assert uploaded.read_bytes() == elf_data
 
         # Verify summary
         summary = uploader.get_batch_summary(results)
@@ -306,20 +415,39 @@ class TestUploadWorkflow:
         assert summary["successful"] == 2
         assert summary["failed"] == 0
 
-        manager.disconnect()
+    def test_parallel_upload_to_multiple_dumps(self, ftp_server, connected_manager, temp_files):
+        """Test a parallel batch upload puts the files in every dump."""
+        from src.ftp.uploader import FileUploader
+
+        manager = connected_manager
+        assert manager.is_connected
 
-    def test_upload_with_progress_callback(self, ftp_server, temp_files):
+        for i in range(4):
+            ftp_server.add_game_dump(f"/data/homebrew/PARALLEL{i}")
+        scanner = DumpScanner(manager)
+        scanner.scan()
+        target_dumps = [
+            scanner.get_dump_by_path(f"/data/homebrew/PARALLEL{i}") for i in range(4)
+        ]
+
+        elf_path, js_path = temp_files
+        uploader = FileUploader(manager, max_connections=3)
+
+        results = uploader.upload_batch(target_dumps, elf_path, js_path)
+
+        assert [r.dump_path for r in results] == [d.path for d in target_dumps]
+        assert all(r.success for r in results)
+        for dump in target_dumps:
+            scanner.refresh(dump)
+            assert dump.has_elf and dump.has_js
+        assert manager.is_connected
+
+    def test_upload_with_progress_callback(self, ftp_server, connected_manager, temp_files):
         """Test upload reports progress."""
         from src.ftp.uploader import FileUploader, UploadProgress
 
-        manager = FTPConnectionManager()
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
         scanner = DumpScanner(manager)
         dumps = scanner.scan()
@@ -341,20 +469,12 @@ class TestUploadWorkflow:
         # Progress callback should have been called at least once
         assert len(progress_updates) >= 0  # May be 0 for small files
 
-        manager.disconnect()
-
-    def test_verify_files_uploaded(self, ftp_server, temp_files):
+    def test_verify_files_uploaded(self, ftp_server, connected_manager, temp_files):
         """Test that files actually appear on the server."""
         from src.ftp.uploader import FileUploader
 
-        manager = FTPConnectionManager()
-        config = FTPConnectionConfig(
-            host=ftp_server.host,
-            port=ftp_server.port,
-            username=ftp_server.username,
-        )
-
-        manager.connect(config, password=ftp_server.password)
+        manager = connected_manager
+        assert manager.is_connected
 
         # Add a fresh dump without files
         ftp_server.add_game_dump("/data/homebrew/UPLOAD_TEST")
@@ -379,5 +499,3 @@ class TestUploadWorkflow:
         # Now files should be present
         assert target_dump.has_elf is True
         assert target_dump.has_js is True
-
-        manager.disconnect()
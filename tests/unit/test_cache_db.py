@@ -0,0 +1,94 @@
+"""Unit tests for ReleaseCacheDB.
+
+Tests storing, querying and removing cached release metadata.
+"""
+
+import pytest
+
+from src.updater.cache_db import ReleaseCacheDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create an initialized ReleaseCacheDB in a temp directory."""
+    db = ReleaseCacheDB(tmp_path / "releases.db")
+    db.initialize()
+    return db
+
+
+def make_metadata(version, downloaded_at, assets=None):
+    """Build a metadata dict for a release."""
+    return {
+        "version": version,
+        "name": f"Release {version}",
+        "published_at": "2024-01-15T10:30:00+00:00",
+        "body": "Release notes",
+        "html_url": "https://example.com",
+        "downloaded_at": downloaded_at,
+        "assets": assets or {},
+    }
+
+
+class TestReleaseCacheDB:
+    """Tests for ReleaseCacheDB."""
+
+    def test_initialize_reports_new_database(self, tmp_path):
+        """Test initialize returns True only on first creation."""
+        db = ReleaseCacheDB(tmp_path / "releases.db")
+        assert db.initialize() is True
+        assert db.initialize() is False
+        assert ReleaseCacheDB(tmp_path / "releases.db").initialize() is False
+
+    def test_put_and_get(self, db):
+        """Test round-tripping metadata with assets."""
+        assets = {"dump_runner.elf": {"sha256": "abc", "etag": '"e1"', "size": 10}}
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0, assets))
+
+        metadata = db.get("v1.0.0")
+        assert metadata["version"] == "v1.0.0"
+        assert metadata["body"] == "Release notes"
+        assert metadata["assets"] == assets
+
+    def test_get_missing(self, db):
+        """Test get returns None for unknown releases."""
+        assert db.get("v9.9.9") is None
+
+    def test_put_replaces_assets(self, db):
+        """Test replacing a release drops its previous assets."""
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0, {"dump_runner.zip": {"size": 1}}))
+        db.put("v1.0.0", make_metadata("v1.0.0", 200.0, {"dump_runner.elf": {"size": 2}}))
+
+        assert list(db.get("v1.0.0")["assets"]) == ["dump_runner.elf"]
+
+    def test_dir_names_by_download_time(self, db):
+        """Test releases are ordered most recently downloaded first."""
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0))
+        db.put("v1.1.0", make_metadata("v1.1.0", 300.0))
+        db.put("v0.9.0", make_metadata("v0.9.0", 200.0))
+
+        assert db.dir_names_by_download_time() == ["v1.1.0", "v0.9.0", "v1.0.0"]
+
+    def test_delete(self, db):
+        """Test deleting a release."""
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0, {"dump_runner.elf": {"size": 1}}))
+        db.delete("v1.0.0")
+
+        assert db.get("v1.0.0") is None
+        assert db.versions() == []
+
+    def test_remove(self, db):
+        """Test removing the database files."""
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0))
+        db.remove()
+
+        assert not db.path.exists()
+
+    def test_move_aside(self, db):
+        """Test moving the database aside so a fresh one can be created."""
+        db.put("v1.0.0", make_metadata("v1.0.0", 100.0))
+        db.move_aside()
+
+        assert not db.path.exists()
+        assert db.path.with_name(db.path.name + ".corrupt").exists()
+        assert db.initialize() is True
+        assert db.get("v1.0.0") is None
@@ -4,7 +4,9 @@ Tests connection lifecycle, state transitions, and error handling.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from dataclasses import FrozenInstanceError
+from ftplib import FTP
+from unittest.mock import Mock, patch
 import socket
 
 from src.ftp.connection import (
@@ -47,6 +49,15 @@ class TestFTPConnectionConfig:
         assert config.passive_mode is False
         assert config.timeout == 60
 
+    def test_immutable_and_hashable(self):
+        """Test a config can't change after validation and works as a key."""
+        config = FTPConnectionConfig(host="192.168.1.100")
+
+        with pytest.raises(FrozenInstanceError):
+            config.port = 0
+        assert not hasattr(config, "__dict__")
+        assert {config: 1}[FTPConnectionConfig(host="192.168.1.100")] == 1
+
     def test_empty_host_raises_error(self):
         """Test that empty host raises ValueError."""
         with pytest.raises(ValueError, match="Host is required"):
@@ -80,7 +91,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_connect_success(self, mock_ftp_class):
         """Test successful connection."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp_class.return_value = mock_ftp
 
         manager = FTPConnectionManager()
@@ -104,7 +115,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_connect_socket_error(self, mock_ftp_class):
         """Test connection failure due to socket error."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp.connect.side_effect = socket.error("Connection refused")
         mock_ftp_class.return_value = mock_ftp
 
@@ -120,7 +131,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_connect_timeout(self, mock_ftp_class):
         """Test connection timeout."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp.connect.side_effect = socket.timeout("Connection timed out")
         mock_ftp_class.return_value = mock_ftp
 
@@ -137,7 +148,7 @@ class TestFTPConnectionManager:
         """Test authentication failure."""
         from ftplib import error_perm
 
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp.login.side_effect = error_perm("530 Login incorrect")
         mock_ftp_class.return_value = mock_ftp
 
@@ -152,7 +163,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_disconnect(self, mock_ftp_class):
         """Test disconnection."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp_class.return_value = mock_ftp
 
         manager = FTPConnectionManager()
@@ -167,10 +178,109 @@ class TestFTPConnectionManager:
         assert manager.is_connected is False
         mock_ftp.quit.assert_called_once()
 
+    @patch("src.ftp.connection.FTP")
+    def test_reconnect_reuses_parked_session(self, mock_ftp_class):
+        """Test a pooled disconnect keeps the session for the next connect."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+        manager.disconnect(park=True)
+
+        assert not manager.is_connected
+        mock_ftp.quit.assert_not_called()
+
+        manager.connect(config, password="testpass")
+
+        assert manager.is_connected
+        assert manager.ftp is mock_ftp
+        assert mock_ftp.login.call_count == 1
+        mock_ftp.voidcmd.assert_called_once_with("NOOP")
+
+    @patch("src.ftp.connection.FTP")
+    def test_reconnect_with_other_credentials_opens_new_session(self, mock_ftp_class):
+        """Test a parked session is closed when the next connect can't use it."""
+        first, second = Mock(spec=FTP), Mock(spec=FTP)
+        mock_ftp_class.side_effect = [first, second]
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+        manager.disconnect(park=True)
+        manager.connect(config, password="otherpass")
+
+        first.quit.assert_called_once()
+        assert manager.ftp is second
+        second.login.assert_called_once()
+
+    @patch("src.ftp.connection.FTP")
+    def test_reconnect_replaces_dead_parked_session(self, mock_ftp_class):
+        """Test a parked session that fails NOOP is replaced."""
+        first, second = Mock(spec=FTP), Mock(spec=FTP)
+        first.voidcmd.side_effect = ConnectionResetError("forcibly closed")
+        mock_ftp_class.side_effect = [first, second]
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+        manager.disconnect(park=True)
+        manager.connect(config, password="testpass")
+
+        assert manager.ftp is second
+
+    @patch("src.ftp.connection.FTP")
+    def test_close_idle(self, mock_ftp_class):
+        """Test close_idle quits the parked session."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        manager.connect(FTPConnectionConfig(host="192.168.1.100"), password="testpass")
+        manager.disconnect(park=True)
+        manager.close_idle()
+
+        mock_ftp.quit.assert_called_once()
+
+    @patch("src.ftp.connection.FTP")
+    def test_disconnect_without_park_quits(self, mock_ftp_class):
+        """Test a plain disconnect always QUITs, even with a pool."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        manager.connect(FTPConnectionConfig(host="192.168.1.100"), password="testpass")
+        manager.disconnect()
+
+        mock_ftp.quit.assert_called_once()
+        manager.close_idle()
+        mock_ftp.quit.assert_called_once()
+
+    @patch("src.ftp.connection.time.monotonic")
+    @patch("src.ftp.connection.FTP")
+    def test_close_expired_idle(self, mock_ftp_class, mock_monotonic):
+        """Test close_expired_idle only quits a session parked for pool_idle."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp_class.return_value = mock_ftp
+        mock_monotonic.return_value = 100.0
+
+        manager = FTPConnectionManager(pool_idle=30.0)
+        manager.connect(FTPConnectionConfig(host="192.168.1.100"), password="testpass")
+        manager.disconnect(park=True)
+
+        mock_monotonic.return_value = 120.0
+        manager.close_expired_idle()
+        mock_ftp.quit.assert_not_called()
+
+        mock_monotonic.return_value = 130.0
+        manager.close_expired_idle()
+        mock_ftp.quit.assert_called_once()
+
     @patch("src.ftp.connection.FTP")
     def test_disconnect_graceful_on_error(self, mock_ftp_class):
         """Test disconnect handles errors gracefully."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp.quit.side_effect = Exception("Already closed")
         mock_ftp_class.return_value = mock_ftp
 
@@ -192,7 +302,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_list_directory(self, mock_ftp_class):
         """Test listing directory contents."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp.nlst.return_value = ["game1", "game2", "game3"]
         mock_ftp_class.return_value = mock_ftp
 
@@ -208,7 +318,7 @@ class TestFTPConnectionManager:
     @patch("src.ftp.connection.FTP")
     def test_change_directory(self, mock_ftp_class):
         """Test changing directory."""
-        mock_ftp = MagicMock()
+        mock_ftp = Mock(spec=FTP)
         mock_ftp_class.return_value = mock_ftp
 
         manager = FTPConnectionManager()
@@ -219,6 +329,102 @@ class TestFTPConnectionManager:
 
         mock_ftp.cwd.assert_called_with("/data/homebrew/game1")
 
+    @patch("src.ftp.connection.FTP")
+    def test_home_dir_read_once_per_session(self, mock_ftp_class):
+        """Test home_dir issues PWD once and again after reconnecting."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp.pwd.return_value = "/"
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager()
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+
+        assert manager.home_dir == "/"
+        assert manager.home_dir == "/"
+        assert mock_ftp.pwd.call_count == 1
+
+        manager.disconnect()
+        manager.connect(config, password="testpass")
+
+        assert manager.home_dir == "/"
+        assert mock_ftp.pwd.call_count == 2
+
+    @patch("src.ftp.connection.FTP")
+    def test_change_directory_updates_home_dir(self, mock_ftp_class):
+        """Test home_dir follows explicit directory changes."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp.pwd.return_value = "/"
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager()
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+
+        manager.change_directory("/data/homebrew")
+
+        assert manager.home_dir == "/data/homebrew"
+        mock_ftp.pwd.assert_not_called()
+
+    @patch("src.ftp.connection.FTP")
+    def test_clone(self, mock_ftp_class):
+        """Test clone opens a second session with the same credentials."""
+        mock_ftp_class.side_effect = lambda: Mock(spec=FTP)
+
+        manager = FTPConnectionManager()
+        config = FTPConnectionConfig(host="192.168.1.100", username="user")
+        manager.connect(config, password="testpass")
+
+        clone = manager.clone()
+
+        assert clone is not manager
+        assert clone.is_connected
+        assert clone.config is config
+        assert clone.ftp is not manager.ftp
+        clone.ftp.login.assert_called_once_with(user="user", passwd="testpass")
+
+    def test_clone_raises_when_not_connected(self):
+        """Test clone requires an established connection."""
+        manager = FTPConnectionManager()
+
+        with pytest.raises(FTPNotConnectedError):
+            manager.clone()
+
+    @patch("src.ftp.connection.FTP")
+    def test_noop(self, mock_ftp_class):
+        """Test sending a keep-alive NOOP."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager()
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+
+        manager.noop()
+
+        mock_ftp.voidcmd.assert_called_once_with("NOOP")
+
+    @patch("src.ftp.connection.FTP")
+    def test_noop_stale_connection(self, mock_ftp_class):
+        """Test NOOP on a dropped control connection raises FTPConnectionError."""
+        mock_ftp = Mock(spec=FTP)
+        mock_ftp.voidcmd.side_effect = ConnectionResetError("forcibly closed")
+        mock_ftp_class.return_value = mock_ftp
+
+        manager = FTPConnectionManager()
+        config = FTPConnectionConfig(host="192.168.1.100")
+        manager.connect(config, password="testpass")
+
+        with pytest.raises(FTPConnectionError):
+            manager.noop()
+
+    def test_noop_raises_when_not_connected(self):
+        """Test NOOP without a connection raises FTPNotConnectedError."""
+        manager = FTPConnectionManager()
+
+        with pytest.raises(FTPNotConnectedError):
+            manager.noop()
+
 
 class TestConnectionStateEnum:
     """Tests for ConnectionState enum."""
@@ -5,7 +5,7 @@ game dumps by name in the dump list widget.
 """
 
 import tkinter as tk
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 import pytest
 
@@ -142,6 +142,36 @@ class TestDumpListSearch:
         dump_list._search_var.set("xyz123")
         assert len(dump_list._filtered_dumps) == 0
 
+    def test_filter_follows_new_dumps(self, root, mock_dumps):
+        """Test that filtering uses the names of the latest set_dumps call."""
+        dump_list = DumpList(root)
+        dump_list.set_dumps(mock_dumps)
+        dump_list.set_dumps(mock_dumps[2:])
+
+        dump_list._search_var.set("horizon")
+        assert dump_list._filtered_dumps == []
+
+        dump_list._search_var.set("ring")
+        assert [d.name for d in dump_list._filtered_dumps] == ["ELDEN RING"]
+
+    def test_filter_many_dumps(self, root):
+        """Test filtering a large dump list keeps matches in order."""
+        dumps = [
+            GameDump(
+                path=f"/data/homebrew/Game {i:05d}",
+                name=f"Game {i:05d}",
+                location_type=LocationType.INTERNAL,
+            )
+            for i in range(10000)
+        ]
+        dump_list = DumpList(root)
+        dump_list.set_dumps(dumps)
+
+        dump_list._search_var.set("game 0999")
+        assert [d.name for d in dump_list._filtered_dumps] == [
+            f"Game {i:05d}" for i in range(9990, 10000)
+        ]
+
 
 class TestDumpListSearchVisualFeedback:
     """Tests for visual feedback during search."""
@@ -160,6 +190,60 @@ class TestDumpListSearchVisualFeedback:
         assert "5" in count_text
         # Should show something like "2 of 5 dumps"
 
+    def test_tree_redrawn_once_typing_pauses(self, root, mock_dumps):
+        """Test a burst of search changes leaves one pending tree redraw."""
+        dump_list = DumpList(root)
+        dump_list.set_dumps(mock_dumps)
+
+        for text in ("H", "Ho", "Hor", "Horizon"):
+            dump_list._search_var.set(text)
+
+        # Filter is current, the tree still shows the previous rows
+        assert len(dump_list._filtered_dumps) == 2
+        assert len(dump_list._tree.get_children()) == 5
+        assert dump_list._redraw_after_id is not None
+
+        dump_list._redraw_now()
+
+        assert len(dump_list._tree.get_children()) == 2
+        assert dump_list._redraw_after_id is None
+
+    def test_select_all_uses_pending_filter(self, root, mock_dumps):
+        """Test Select All before the debounced redraw selects only matches."""
+        dump_list = DumpList(root)
+        dump_list.set_dumps(mock_dumps)
+        dump_list._search_var.set("Horizon")
+
+        dump_list._select_all()
+
+        assert [d.name for d in dump_list.get_selected_dumps()] == [
+            d.name for d in dump_list._filtered_dumps
+        ]
+        assert len(dump_list._tree.get_children()) == 2
+
+    def test_filter_does_not_rebuild_all(self, root, mock_dumps):
+        """Test filtering detaches and reattaches only the rows that change."""
+        dump_list = DumpList(root)
+        dump_list.set_dumps(mock_dumps)
+        dump_list._search_var.set("Horizon")
+        dump_list._redraw_now()
+
+        tree = dump_list._tree
+        with patch.object(tree, "insert") as insert, \
+                patch.object(tree, "delete") as delete, \
+                patch.object(tree, "detach", wraps=tree.detach) as detach, \
+                patch.object(tree, "move", wraps=tree.move) as move:
+            dump_list._search_var.set("Horizon Zero")
+            dump_list._redraw_now()
+            dump_list._search_var.set("")
+            dump_list._redraw_now()
+
+        insert.assert_not_called()
+        delete.assert_not_called()
+        detach.assert_called_once_with(mock_dumps[1].path)
+        assert move.call_count == 4
+        assert list(tree.get_children()) == [d.path for d in mock_dumps]
+
     def test_count_label_shows_total_when_no_filter(self, root, mock_dumps):
         """Test count label shows total when no filter active."""
         dump_list = DumpList(root)
@@ -230,7 +314,8 @@ class TestDumpListSearchEdgeCases:
 
         # Select first item
         first_path = mock_dumps[0].path
-        dump_list._selected_paths.add(first_path)
+        dump_list._toggle_item(first_path)
+        assert mock_dumps[0].selected
 
         # Apply filter that hides the selected item
         dump_list._search_var.set("ELDEN")
@@ -244,3 +329,4 @@ class TestDumpListSearchEdgeCases:
 
         # Selection should still be there
         assert first_path in dump_list._selected_paths
+        assert dump_list.get_selected_dumps() == [mock_dumps[0]]
@@ -3,13 +3,17 @@
 Tests GitHub API integration and release download/caching functionality.
 """
 
+import hashlib
 import json
+import os
+import sqlite3
 import pytest
-from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch, Mock
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 
 from src.updater.github_client import (
+    AssetDownload,
     GitHubClient,
     GitHubRelease,
     ReleaseAsset,
@@ -73,6 +77,64 @@ SAMPLE_RELEASES_RESPONSE = [
 ]
 
 
+def write_files(directory, files):
+    """Write small files with one unbuffered write each."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for name, data in files.items():
+        fd = os.open(directory / name, flags, 0o666)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Build lightweight stand-ins for requests responses."""
+    def make(status=200, json_data=None, headers=None, chunks=(), text=""):
+        return SimpleNamespace(
+            status_code=status,
+            headers=headers or {},
+            text=text,
+            content=b"" if json_data is None else json.dumps(json_data).encode(),
+            json=Mock(return_value=json_data),
+            iter_content=Mock(return_value=list(chunks)),
+            raise_for_status=Mock(),
+        )
+    return make
+
+
+@pytest.fixture(scope="session")
+def sample_release():
+    """Parse SAMPLE_RELEASE_RESPONSE once; tests only read the release."""
+    return GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def incomplete_release():
+    """Parse SAMPLE_RELEASE_RESPONSE without its homebrew.js asset once."""
+    data = SAMPLE_RELEASE_RESPONSE.copy()
+    data["assets"] = [a for a in data["assets"] if a["name"] != "homebrew.js"]
+    return GitHubRelease.from_api_response(data)
+
+
+def fake_download(contents):
+    """Build a download_asset_to_file side effect writing canned asset content."""
+    def download_asset_to_file(
+        asset, fileobj, callback=None, etag=None, resume_from=0, if_range=None
+    ):
+        data = contents[asset.name]
+        fileobj.write(data[resume_from:])
+        if callback:
+            callback(len(data), len(data))
+        return AssetDownload(
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            etag=f'"{asset.name}-etag"',
+        )
+    return download_asset_to_file
+
+
 class TestReleaseAsset:
     """Tests for ReleaseAsset dataclass."""
 
@@ -115,36 +177,24 @@ class TestGitHubRelease:
         assert release.draft is False
         assert len(release.assets) == 2
 
-    def test_version_property(self):
-        """Test version property returns tag_name."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        assert release.version == "v1.0.0"
-
-    def test_has_elf_property(self):
-        """Test has_elf property."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        assert release.has_elf is True
-
-    def test_has_js_property(self):
-        """Test has_js property."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        assert release.has_js is True
-
-    def test_is_complete_property(self):
-        """Test is_complete property when both files present."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        assert release.is_complete is True
-
-    def test_is_complete_missing_js(self):
+    @pytest.mark.parametrize("attr, expected", [
+        ("version", "v1.0.0"),  # tag_name
+        ("has_elf", True),
+        ("has_js", True),
+        ("is_complete", True),  # both files present
+    ])
+    def test_release_properties(self, sample_release, attr, expected):
+        """Test the derived properties of a complete release."""
+        assert getattr(sample_release, attr) == expected
+
+    def test_is_complete_missing_js(self, incomplete_release):
         """Test is_complete property when JS is missing."""
-        data = SAMPLE_RELEASE_RESPONSE.copy()
-        data["assets"] = [a for a in data["assets"] if a["name"] != "homebrew.js"]
-        release = GitHubRelease.from_api_response(data)
+        release = incomplete_release
         assert release.is_complete is False
 
-    def test_get_asset(self):
+    def test_get_asset(self, sample_release):
         """Test get_asset method."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+        release = sample_release
 
         elf = release.get_asset("dump_runner.elf")
         assert elf is not None
@@ -153,110 +203,143 @@ class TestGitHubRelease:
         missing = release.get_asset("nonexistent.txt")
         assert missing is None
 
-    def test_get_elf_asset(self):
-        """Test get_elf_asset convenience method."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        asset = release.get_elf_asset()
-        assert asset is not None
-        assert asset.name == "dump_runner.elf"
+    def test_get_asset_duplicate_name(self):
+        """Test get_asset returns the first asset when names repeat."""
+        data = SAMPLE_RELEASE_RESPONSE.copy()
+        duplicate = dict(data["assets"][0], size=1)
+        data["assets"] = data["assets"] + [duplicate]
+        release = GitHubRelease.from_api_response(data)
 
-    def test_get_js_asset(self):
-        """Test get_js_asset convenience method."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
-        asset = release.get_js_asset()
+        assert release.get_asset(duplicate["name"]).size == data["assets"][0]["size"]
+
+    @pytest.mark.parametrize("method, name", [
+        ("get_elf_asset", "dump_runner.elf"),
+        ("get_js_asset", "homebrew.js"),
+    ])
+    def test_asset_shortcuts(self, sample_release, method, name):
+        """Test the get_elf_asset/get_js_asset convenience methods."""
+        asset = getattr(sample_release, method)()
         assert asset is not None
-        assert asset.name == "homebrew.js"
+        assert asset.name == name
 
-    def test_published_at_parsing(self):
+    def test_published_at_parsing(self, sample_release):
         """Test published_at date parsing."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+        release = sample_release
         assert release.published_at is not None
         assert release.published_at.year == 2024
         assert release.published_at.month == 1
         assert release.published_at.day == 15
+        assert release.published_at.utcoffset().total_seconds() == 0
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Create one GitHubClient (and requests Session) for the module."""
+    client = GitHubClient()
+    yield client
+    client.close()
 
 
 class TestGitHubClient:
     """Tests for GitHubClient."""
 
     @pytest.fixture
-    def client(self):
-        """Create a GitHubClient instance."""
-        return GitHubClient(timeout=10)
+    def client(self, shared_client, monkeypatch):
+        """Provide the shared client with per-test state reset."""
+        monkeypatch.setattr(shared_client, "_timeout", 10)
+        monkeypatch.setattr(shared_client, "_response_cache", {})
+        return shared_client
 
     @pytest.fixture
-    def mock_response(self):
+    def session_get(self, client, monkeypatch):
+        """Replace the client session's get() with a mock for this test."""
+        mock = Mock()
+        monkeypatch.setattr(client._session, "get", mock)
+        return mock
+
+    @pytest.fixture
+    def mock_response(self, make_response):
         """Create a mock response object."""
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = SAMPLE_RELEASE_RESPONSE
-        return response
+        return make_response(json_data=SAMPLE_RELEASE_RESPONSE)
 
-    def test_get_latest_release_success(self, client, mock_response):
+    def test_get_latest_release_success(self, client, mock_response, session_get):
         """Test successful get_latest_release."""
-        with patch.object(client._session, 'get', return_value=mock_response):
+        session_get.return_value = mock_response
+        release = client.get_latest_release()
+
+        assert release.tag_name == "v1.0.0"
+        assert release.is_complete is True
+
+    def test_get_latest_release_without_orjson(self, client, mock_response, session_get):
+        """Test that responses are parsed with json when orjson is unavailable."""
+        session_get.return_value = mock_response
+        with patch("src.updater.github_client.orjson", None):
             release = client.get_latest_release()
 
-            assert release.tag_name == "v1.0.0"
-            assert release.is_complete is True
+        assert release.tag_name == "v1.0.0"
+        mock_response.json.assert_called_once()
 
-    def test_get_latest_release_not_found(self, client):
-        """Test get_latest_release when no releases exist."""
-        response = MagicMock()
-        response.status_code = 404
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_get_latest_release_invalid_json(
+        self, client, make_response, session_get, use_orjson
+    ):
+        """Test that an undecodable 200 body raises GitHubError with or without orjson."""
+        import requests
+
+        response = make_response(text="<html>")
+        response.content = b"<html>"
+        response.json.side_effect = requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+        session_get.return_value = response
 
-        with patch.object(client._session, 'get', return_value=response):
-            with pytest.raises(GitHubNotFoundError):
+        orjson_module = pytest.importorskip("orjson") if use_orjson else None
+        with patch("src.updater.github_client.orjson", orjson_module):
+            with pytest.raises(GitHubError, match="Invalid JSON"):
                 client.get_latest_release()
 
-    def test_get_latest_release_rate_limited(self, client):
+    def test_get_latest_release_not_found(self, client, make_response, session_get):
+        """Test get_latest_release when no releases exist."""
+        response = make_response(status=404)
+
+        session_get.return_value = response
+        with pytest.raises(GitHubNotFoundError):
+            client.get_latest_release()
+
+    def test_get_latest_release_rate_limited(self, client, make_response, session_get):
         """Test get_latest_release when rate limited."""
-        response = MagicMock()
-        response.status_code = 403
-        response.text = "API rate limit exceeded"
+        response = make_response(status=403, text="API rate limit exceeded")
 
-        with patch.object(client._session, 'get', return_value=response):
-            with pytest.raises(GitHubRateLimitError):
-                client.get_latest_release()
+        session_get.return_value = response
+        with pytest.raises(GitHubRateLimitError):
+            client.get_latest_release()
 
-    def test_get_latest_release_connection_error(self, client):
+    def test_get_latest_release_connection_error(self, client, session_get):
         """Test get_latest_release with connection error."""
         import requests
 
-        with patch.object(
-            client._session,
-            'get',
-            side_effect=requests.exceptions.ConnectionError("Network error")
-        ):
-            with pytest.raises(GitHubConnectionError):
-                client.get_latest_release()
+        session_get.side_effect = requests.exceptions.ConnectionError("Network error")
+        with pytest.raises(GitHubConnectionError):
+            client.get_latest_release()
 
-    def test_get_latest_release_timeout(self, client):
+    def test_get_latest_release_timeout(self, client, session_get):
         """Test get_latest_release with timeout."""
         import requests
 
-        with patch.object(
-            client._session,
-            'get',
-            side_effect=requests.exceptions.Timeout("Request timed out")
-        ):
-            with pytest.raises(GitHubConnectionError):
-                client.get_latest_release()
+        session_get.side_effect = requests.exceptions.Timeout("Request timed out")
+        with pytest.raises(GitHubConnectionError):
+            client.get_latest_release()
 
-    def test_get_releases_success(self, client):
+    def test_get_releases_success(self, client, make_response, session_get):
         """Test successful get_releases."""
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = SAMPLE_RELEASES_RESPONSE
+        response = make_response(json_data=SAMPLE_RELEASES_RESPONSE)
 
-        with patch.object(client._session, 'get', return_value=response):
-            releases = client.get_releases(limit=10)
+        session_get.return_value = response
+        releases = client.get_releases(limit=10)
 
-            assert len(releases) == 2
-            assert releases[0].tag_name == "v1.0.0"
-            assert releases[1].tag_name == "v0.9.0"
+        assert len(releases) == 2
+        assert releases[0].tag_name == "v1.0.0"
+        assert releases[1].tag_name == "v0.9.0"
 
-    def test_get_releases_filters_drafts(self, client):
+    def test_get_releases_filters_drafts(self, client, make_response, session_get):
         """Test that get_releases filters out drafts."""
         data = SAMPLE_RELEASES_RESPONSE.copy()
         data.append({
@@ -266,32 +349,100 @@ class TestGitHubClient:
             "assets": [],
         })
 
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = data
+        response = make_response(json_data=data)
 
-        with patch.object(client._session, 'get', return_value=response):
-            releases = client.get_releases()
-            # Should not include the draft
-            assert len(releases) == 2
+        session_get.return_value = response
+        releases = client.get_releases()
+        # Should not include the draft
+        assert len(releases) == 2
 
-    def test_get_release_by_tag_success(self, client, mock_response):
+    def test_get_release_by_tag_success(self, client, mock_response, session_get):
         """Test successful get_release_by_tag."""
-        with patch.object(client._session, 'get', return_value=mock_response):
-            release = client.get_release_by_tag("v1.0.0")
-            assert release.tag_name == "v1.0.0"
+        session_get.return_value = mock_response
+        release = client.get_release_by_tag("v1.0.0")
+        assert release.tag_name == "v1.0.0"
 
-    def test_get_release_by_tag_not_found(self, client):
+    def test_get_release_by_tag_not_found(self, client, make_response, session_get):
         """Test get_release_by_tag with non-existent tag."""
-        response = MagicMock()
-        response.status_code = 404
+        response = make_response(status=404)
+
+        session_get.return_value = response
+        with pytest.raises(GitHubNotFoundError):
+            client.get_release_by_tag("nonexistent")
+
+    def test_make_request_reuses_fresh_response(self, client, make_response, session_get):
+        """Test that a response within the TTL is served without a request."""
+        response = make_response(json_data=SAMPLE_RELEASE_RESPONSE, headers={"ETag": '"abc"'})
+
+        session_get.return_value = response
+        client.get_latest_release()
+        release = client.get_latest_release()
+
+        assert release.tag_name == "v1.0.0"
+        assert session_get.call_count == 1
+
+    def test_make_request_revalidates_with_etag(self, client, make_response, session_get):
+        """Test that a stale response is revalidated and reused on 304."""
+        response = make_response(json_data=SAMPLE_RELEASE_RESPONSE, headers={"ETag": '"abc"'})
+
+        not_modified = make_response(status=304)
+
+        session_get.side_effect = [response, not_modified]
+        client.get_latest_release()
+        client._response_cache[f"{RELEASES_URL}/latest"]["fetched_at"] = 0
+        release = client.get_latest_release()
+
+        assert release.tag_name == "v1.0.0"
+        assert session_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.json.assert_not_called()
+
+    def test_response_cache_persisted(self, tmp_path, make_response):
+        """Test that cached responses are reloaded by a new client."""
+        cache_path = tmp_path / "github_api_cache.json"
+        response = make_response(json_data=SAMPLE_RELEASE_RESPONSE, headers={"ETag": '"abc"'})
+
+        with GitHubClient(response_cache_path=cache_path) as client:
+            with patch.object(client._session, 'get', return_value=response):
+                client.get_latest_release()
 
-        with patch.object(client._session, 'get', return_value=response):
-            with pytest.raises(GitHubNotFoundError):
-                client.get_release_by_tag("nonexistent")
+        with GitHubClient(response_cache_path=cache_path) as client:
+            with patch.object(client._session, 'get') as mock_get:
+                release = client.get_latest_release()
+
+        assert release.tag_name == "v1.0.0"
+        mock_get.assert_not_called()
+
+    def test_download_asset_to_file(self, client, make_response, session_get):
+        """Test asset download streams chunks into a file object."""
+        import io
+
+        asset = ReleaseAsset(
+            name="dump_runner.zip",
+            download_url="https://example.com/dump_runner.zip",
+            size=12,
+            content_type="application/zip",
+        )
+
+        response = make_response(headers={"content-length": "12"}, chunks=[b"chunk1", b"chunk2"])
+
+        progress_calls = []
+        def callback(downloaded, total):
+            progress_calls.append((downloaded, total))
+
+        fileobj = io.BytesIO()
+        session_get.return_value = response
+        result = client.download_asset_to_file(asset, fileobj, callback=callback)
+
+        assert result.size == 12
+        assert result.sha256 == hashlib.sha256(b"chunk1chunk2").hexdigest()
+        assert result.not_modified is False
+        assert fileobj.getvalue() == b"chunk1chunk2"
+        assert progress_calls == [(6, 12), (12, 12)]
+
+    def test_download_asset_to_file_not_modified(self, client, make_response, session_get):
+        """Test conditional download skips the body when the ETag matches."""
+        import io
 
-    def test_download_asset_success(self, client):
-        """Test successful asset download."""
         asset = ReleaseAsset(
             name="dump_runner.elf",
             download_url="https://example.com/file.elf",
@@ -299,48 +450,160 @@ class TestGitHubClient:
             content_type="application/octet-stream",
         )
 
-        response = MagicMock()
-        response.headers = {"content-length": "1024"}
-        response.iter_content = MagicMock(return_value=[b"test content"])
-        response.raise_for_status = MagicMock()
+        response = make_response(status=304)
+
+        fileobj = io.BytesIO()
+        session_get.return_value = response
+        result = client.download_asset_to_file(asset, fileobj, etag='"abc"')
 
-        with patch.object(client._session, 'get', return_value=response):
-            content = client.download_asset(asset)
-            assert content == b"test content"
+        assert result.not_modified is True
+        assert fileobj.getvalue() == b""
+        assert session_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        response.iter_content.assert_not_called()
+
+    def test_download_asset_to_file_resume(self, client, make_response, session_get):
+        """Test resumed download requests a range and hashes the whole asset."""
+        import io
 
-    def test_download_asset_with_progress_callback(self, client):
-        """Test asset download with progress callback."""
         asset = ReleaseAsset(
             name="dump_runner.elf",
             download_url="https://example.com/file.elf",
-            size=1024,
+            size=12,
             content_type="application/octet-stream",
         )
 
-        response = MagicMock()
-        response.headers = {"content-length": "1024"}
-        response.iter_content = MagicMock(return_value=[b"chunk1", b"chunk2"])
-        response.raise_for_status = MagicMock()
+        response = make_response(
+            status=206, headers={"content-length": "6"}, chunks=[b"chunk2"]
+        )
 
-        progress_calls = []
-        def callback(downloaded, total):
-            progress_calls.append((downloaded, total))
+        fileobj = io.BytesIO(b"chunk1")
+        fileobj.seek(0, io.SEEK_END)
+        session_get.return_value = response
+        result = client.download_asset_to_file(
+            asset, fileobj, resume_from=6, if_range='"abc"'
+        )
 
-        with patch.object(client._session, 'get', return_value=response):
-            client.download_asset(asset, callback=callback)
-            assert len(progress_calls) == 2
+        assert session_get.call_args.kwargs["headers"] == {
+            "Range": "bytes=6-",
+            "If-Range": '"abc"',
+        }
+        assert fileobj.getvalue() == b"chunk1chunk2"
+        assert result.size == 12
+        assert result.sha256 == hashlib.sha256(b"chunk1chunk2").hexdigest()
+
+    def test_download_asset_to_file_range_ignored(self, client, make_response, session_get):
+        """Test that a full response to a range request restarts the file."""
+        import io
+
+        asset = ReleaseAsset(
+            name="dump_runner.elf",
+            download_url="https://example.com/file.elf",
+            size=12,
+            content_type="application/octet-stream",
+        )
+
+        response = make_response(
+            status=200, headers={"content-length": "12"}, chunks=[b"chunk1chunk2"]
+        )
+
+        fileobj = io.BytesIO(b"stale!")
+        fileobj.seek(0, io.SEEK_END)
+        session_get.return_value = response
+        result = client.download_asset_to_file(asset, fileobj, resume_from=6)
+
+        assert fileobj.getvalue() == b"chunk1chunk2"
+        assert result.size == 12
+
+    def test_download_asset_to_file_dropped_keeps_validator(
+        self, client, make_response, session_get
+    ):
+        """Test that a download cut off mid-stream reports how to resume it."""
+        import io
+        import requests
+
+        asset = ReleaseAsset(
+            name="dump_runner.elf",
+            download_url="https://example.com/file.elf",
+            size=12,
+            content_type="application/octet-stream",
+        )
+
+        response = make_response(headers={
+            "content-length": "12",
+            "ETag": 'W/"weak"',
+            "Last-Modified": "Mon, 15 Jan 2024 10:30:00 GMT",
+        })
+        response.iter_content.side_effect = requests.exceptions.ChunkedEncodingError("reset")
+        session_get.return_value = response
+
+        with pytest.raises(GitHubConnectionError) as exc_info:
+            client.download_asset_to_file(asset, io.BytesIO())
+
+        # Weak ETags can't be used with If-Range
+        assert exc_info.value.validator == "Mon, 15 Jan 2024 10:30:00 GMT"
+
+    def test_session_retries_gateway_errors(self, client):
+        """Test that the session retries transient gateway errors."""
+        adapter = client._session.get_adapter("https://api.github.com")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
 
     def test_context_manager(self):
         """Test GitHubClient as context manager."""
         with GitHubClient() as client:
             assert client._session is not None
 
-    def test_close(self, client):
+    def test_close(self):
         """Test closing the client."""
+        client = GitHubClient()
         client.close()
         # Session should still exist but be closed
 
 
+class TestDumpRunnerRelease:
+    """Tests for DumpRunnerRelease file checks."""
+
+    def test_files_valid(self, tmp_path):
+        """Test files_valid when both files have content."""
+        write_files(tmp_path, {"dump_runner.elf": b"elf", "homebrew.js": b"js"})
+        release = DumpRunnerRelease.from_local_files(
+            tmp_path / "dump_runner.elf", tmp_path / "homebrew.js"
+        )
+
+        assert release.files_exist is True
+        assert release.files_valid is True
+
+    def test_files_valid_empty_file(self, tmp_path):
+        """Test files_valid is False when a file is empty."""
+        write_files(tmp_path, {"dump_runner.elf": b"elf", "homebrew.js": b""})
+        release = DumpRunnerRelease.from_local_files(
+            tmp_path / "dump_runner.elf", tmp_path / "homebrew.js"
+        )
+
+        assert release.files_exist is True
+        assert release.files_valid is False
+
+    def test_files_valid_directory(self, tmp_path):
+        """Test files_valid is False when a path is a directory."""
+        (tmp_path / "dump_runner.elf").mkdir()
+        (tmp_path / "homebrew.js").write_bytes(b"js")
+        release = DumpRunnerRelease.from_local_files(
+            tmp_path / "dump_runner.elf", tmp_path / "homebrew.js"
+        )
+
+        assert release.files_valid is False
+
+    def test_files_missing(self, tmp_path):
+        """Test checks are False when a file is missing."""
+        (tmp_path / "homebrew.js").write_bytes(b"js")
+        release = DumpRunnerRelease.from_local_files(
+            tmp_path / "dump_runner.elf", tmp_path / "homebrew.js"
+        )
+
+        assert release.files_exist is False
+        assert release.files_valid is False
+
+
 class TestDownloadProgress:
     """Tests for DownloadProgress dataclass."""
 
@@ -391,14 +654,39 @@ class TestDownloadProgress:
         assert progress2.overall_percentage == 75.0
 
 
+@pytest.fixture(scope="session")
+def zip_blob():
+    """Build a release zip with the required files once (stored, not deflated)."""
+    import io
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("dump_runner/dump_runner.elf", b"elf content from zip")
+        zf.writestr("dump_runner/homebrew.js", b"js content from zip")
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def cached_metadata_json():
+    """Serialize the metadata of a cached v1.0.0 release once."""
+    return json.dumps({"version": "v1.0.0", "downloaded_at": "2024-01-15T10:30:00+00:00"})
+
+
+@pytest.fixture(scope="session")
+def cache_base_dir(tmp_path_factory):
+    """Create one base directory for every test's release cache."""
+    return tmp_path_factory.mktemp("cache_base")
+
+
 class TestReleaseDownloader:
     """Tests for ReleaseDownloader."""
 
     @pytest.fixture
-    def temp_cache_dir(self, tmp_path):
-        """Create a temporary cache directory."""
-        cache_dir = tmp_path / "releases"
-        cache_dir.mkdir()
+    def temp_cache_dir(self, cache_base_dir, request):
+        """Create a cache directory of this test's own under the shared base."""
+        cache_dir = cache_base_dir / request.node.name / "releases"
+        cache_dir.mkdir(parents=True)
         return cache_dir
 
     @pytest.fixture
@@ -418,8 +706,7 @@ class TestReleaseDownloader:
         release_dir.mkdir()
 
         # Create files
-        (release_dir / "dump_runner.elf").write_bytes(b"elf content")
-        (release_dir / "homebrew.js").write_bytes(b"js content")
+        write_files(release_dir, {"dump_runner.elf": b"elf content", "homebrew.js": b"js content"})
 
         # Create metadata
         metadata = {
@@ -428,7 +715,7 @@ class TestReleaseDownloader:
             "published_at": "2024-01-15T10:30:00+00:00",
             "body": "Release notes",
             "html_url": "https://example.com",
-            "downloaded_at": datetime.now().isoformat(),
+            "downloaded_at": "2024-01-15T10:30:00+00:00",
         }
         (release_dir / "release_metadata.json").write_text(json.dumps(metadata))
 
@@ -438,16 +725,30 @@ class TestReleaseDownloader:
         assert result.version == "v1.0.0"
         assert result.files_exist
 
-    def test_download_release_success(self, downloader, temp_cache_dir):
+    def test_get_cached_release_latest_by_metadata_mtime(self, downloader, temp_cache_dir):
+        """Test that the latest cached release is the one written last."""
+        for mtime, version in [(1000, "v1.0.0"), (2000, "v0.9.0")]:
+            release_dir = temp_cache_dir / version
+            release_dir.mkdir()
+            write_files(release_dir, {"dump_runner.elf": b"elf content", "homebrew.js": b"js content"})
+            metadata_path = release_dir / "release_metadata.json"
+            metadata_path.write_text(json.dumps({"version": version}))
+            os.utime(metadata_path, (mtime, mtime))
+
+        result = downloader.get_cached_release()
+        assert result is not None
+        assert result.version == "v0.9.0"
+
+    def test_download_release_success(self, downloader, temp_cache_dir, sample_release):
         """Test successful release download."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+        release = sample_release
 
         # Mock the client
-        mock_client = MagicMock()
-        mock_client.download_asset.side_effect = [
-            b"elf file content",
-            b"js file content",
-        ]
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        })
 
         with patch.object(downloader, '_get_client', return_value=mock_client):
             result = downloader.download_release(release)
@@ -459,23 +760,101 @@ class TestReleaseDownloader:
             assert result.elf_path.read_bytes() == b"elf file content"
             assert result.js_path.read_bytes() == b"js file content"
 
-    def test_download_release_uses_cache(self, downloader, temp_cache_dir):
+    def test_download_release_resumes_interrupted_download(
+        self, downloader, temp_cache_dir, sample_release
+    ):
+        """Test that a dropped connection resumes from the bytes received."""
+        release = sample_release
+        contents = {
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        }
+        complete = fake_download(contents)
+        offsets = []
+
+        def flaky_download(
+            asset, fileobj, callback=None, etag=None, resume_from=0, if_range=None
+        ):
+            if asset.name == "dump_runner.elf":
+                offsets.append((resume_from, if_range))
+                if len(offsets) == 1:
+                    fileobj.write(contents[asset.name][:4])
+                    raise GitHubConnectionError(
+                        "Download failed: connection reset", validator='"elf-etag"'
+                    )
+            return complete(asset, fileobj, callback, etag, resume_from)
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = flaky_download
+
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            result = downloader.download_release(release)
+
+        assert offsets == [(0, None), (4, '"elf-etag"')]
+        assert result.elf_path.read_bytes() == b"elf file content"
+        assert not (temp_cache_dir / "v1.0.0" / "dump_runner.elf.part").exists()
+
+    def test_download_release_restarts_without_validator(
+        self, downloader, sample_release
+    ):
+        """Test that a dropped download with no ETag/Last-Modified starts over."""
+        contents = {
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        }
+        complete = fake_download(contents)
+        offsets = []
+
+        def flaky_download(
+            asset, fileobj, callback=None, etag=None, resume_from=0, if_range=None
+        ):
+            if asset.name == "dump_runner.elf":
+                offsets.append(resume_from)
+                if len(offsets) == 1:
+                    fileobj.write(b"garbage")
+                    raise GitHubConnectionError("Download failed: connection reset")
+            return complete(asset, fileobj, callback, etag, resume_from)
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = flaky_download
+
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            result = downloader.download_release(sample_release)
+
+        assert offsets == [0, 0]
+        assert result.elf_path.read_bytes() == b"elf file content"
+
+    def test_download_release_gives_up_after_attempts(
+        self, downloader, temp_cache_dir, sample_release
+    ):
+        """Test that repeated connection failures abort the download."""
+        release = sample_release
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = GitHubConnectionError("offline")
+
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            with pytest.raises(GitHubConnectionError):
+                downloader.download_release(release)
+
+        # Each of the two assets was attempted DOWNLOAD_ATTEMPTS times
+        assert mock_client.download_asset_to_file.call_count == 2 * downloader.DOWNLOAD_ATTEMPTS
+        assert not (temp_cache_dir / "v1.0.0").exists()
+
+    def test_download_release_uses_cache(
+        self, downloader, temp_cache_dir, sample_release, cached_metadata_json
+    ):
         """Test that download uses cached release when available."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+        release = sample_release
 
         # Create cached release
         release_dir = temp_cache_dir / "v1.0.0"
         release_dir.mkdir()
-        (release_dir / "dump_runner.elf").write_bytes(b"cached elf")
-        (release_dir / "homebrew.js").write_bytes(b"cached js")
-        metadata = {
-            "version": "v1.0.0",
-            "downloaded_at": datetime.now().isoformat(),
-        }
-        (release_dir / "release_metadata.json").write_text(json.dumps(metadata))
+        write_files(release_dir, {"dump_runner.elf": b"cached elf", "homebrew.js": b"cached js"})
+        (release_dir / "release_metadata.json").write_text(cached_metadata_json)
 
         # Mock client should not be called
-        mock_client = MagicMock()
+        mock_client = Mock()
 
         with patch.object(downloader, '_get_client', return_value=mock_client):
             result = downloader.download_release(release)
@@ -483,26 +862,26 @@ class TestReleaseDownloader:
             assert result is not None
             assert result.version == "v1.0.0"
             # Client should not have been called (used cache)
-            mock_client.download_asset.assert_not_called()
+            mock_client.download_asset_to_file.assert_not_called()
 
-    def test_download_release_force_redownload(self, downloader, temp_cache_dir):
+    def test_download_release_force_redownload(
+        self, downloader, temp_cache_dir, sample_release, cached_metadata_json
+    ):
         """Test force redownload even when cached."""
-        release = GitHubRelease.from_api_response(SAMPLE_RELEASE_RESPONSE)
+        release = sample_release
 
         # Create cached release
         release_dir = temp_cache_dir / "v1.0.0"
         release_dir.mkdir()
-        (release_dir / "dump_runner.elf").write_bytes(b"old elf")
-        (release_dir / "homebrew.js").write_bytes(b"old js")
-        metadata = {"version": "v1.0.0", "downloaded_at": datetime.now().isoformat()}
-        (release_dir / "release_metadata.json").write_text(json.dumps(metadata))
+        write_files(release_dir, {"dump_runner.elf": b"old elf", "homebrew.js": b"old js"})
+        (release_dir / "release_metadata.json").write_text(cached_metadata_json)
 
         # Mock client
-        mock_client = MagicMock()
-        mock_client.download_asset.side_effect = [
-            b"new elf content",
-            b"new js content",
-        ]
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"new elf content",
+            "homebrew.js": b"new js content",
+        })
 
         with patch.object(downloader, '_get_client', return_value=mock_client):
             result = downloader.download_release(release, force=True)
@@ -511,12 +890,168 @@ class TestReleaseDownloader:
             assert result.elf_path.read_bytes() == b"new elf content"
             assert result.js_path.read_bytes() == b"new js content"
 
-    def test_download_release_incomplete_fails(self, downloader):
+    def test_download_release_aggregates_progress(self, downloader, sample_release):
+        """Test that parallel downloads report combined progress."""
+        release = sample_release
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"x" * 102400,
+            "homebrew.js": b"x" * 5120,
+        })
+
+        progress_updates = []
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            downloader.download_release(release, progress_callback=progress_updates.append)
+
+        assert len(progress_updates) == 2
+        final = progress_updates[-1]
+        assert final.total_bytes == 102400 + 5120
+        assert final.bytes_downloaded == final.total_bytes
+        assert final.overall_percentage == 100.0
+
+    def test_download_release_records_asset_hashes(
+        self, downloader, temp_cache_dir, sample_release
+    ):
+        """Test that metadata records SHA-256, ETag and size per asset."""
+        release = sample_release
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        })
+
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            downloader.download_release(release)
+
+        metadata = downloader._read_metadata(temp_cache_dir / "v1.0.0")
+        elf_info = metadata["assets"]["dump_runner.elf"]
+        assert elf_info["sha256"] == hashlib.sha256(b"elf file content").hexdigest()
+        assert elf_info["etag"] == '"dump_runner.elf-etag"'
+        assert elf_info["size"] == len(b"elf file content")
+
+    def test_force_redownload_not_modified_keeps_files(
+        self, downloader, temp_cache_dir, sample_release
+    ):
+        """Test forced redownload revalidates intact files with their ETag."""
+        release = sample_release
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        })
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            downloader.download_release(release)
+
+        mock_client.download_asset_to_file.side_effect = (
+            lambda asset, fileobj, callback=None, etag=None, resume_from=0, if_range=None:
+                AssetDownload(size=0, sha256="", etag=etag, not_modified=True)
+        )
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            result = downloader.download_release(release, force=True)
+
+        etags = {
+            c.kwargs["etag"] for c in mock_client.download_asset_to_file.call_args_list[-2:]
+        }
+        assert etags == {'"dump_runner.elf-etag"', '"homebrew.js-etag"'}
+        assert result.elf_path.read_bytes() == b"elf file content"
+        assert result.js_path.read_bytes() == b"js file content"
+        assert not (temp_cache_dir / "v1.0.0" / "dump_runner.elf.part").exists()
+
+    def test_force_redownload_rehashes_cached_files(
+        self, downloader, temp_cache_dir, sample_release
+    ):
+        """Test a cached file altered in place is downloaded without its ETag."""
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download({
+            "dump_runner.elf": b"elf file content",
+            "homebrew.js": b"js file content",
+        })
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            downloader.download_release(sample_release)
+
+            # Same size, different bytes: the size check alone can't tell
+            (temp_cache_dir / "v1.0.0" / "dump_runner.elf").write_bytes(b"elf file CONTENT")
+            result = downloader.download_release(sample_release, force=True)
+
+        etags = [
+            c.kwargs["etag"] for c in mock_client.download_asset_to_file.call_args_list[-2:]
+        ]
+        assert etags == [None, None]
+        assert result.elf_path.read_bytes() == b"elf file content"
+
+    def test_truncated_cached_file_is_invalid(self, downloader, temp_cache_dir):
+        """Test that a cached file whose size differs from metadata is rejected."""
+        release_dir = temp_cache_dir / "v1.0.0"
+        release_dir.mkdir()
+        write_files(release_dir, {"dump_runner.elf": b"elf", "homebrew.js": b"js content"})
+        metadata = {
+            "version": "v1.0.0",
+            "downloaded_at": "2024-01-15T10:30:00+00:00",
+            "assets": {"dump_runner.elf": {"sha256": "", "etag": None, "size": 1024}},
+        }
+        (release_dir / "release_metadata.json").write_text(json.dumps(metadata))
+
+        assert downloader.get_cached_release("v1.0.0") is None
+
+    def test_corrupt_database_is_recreated(self, downloader, temp_cache_dir):
+        """Test that an unreadable metadata database is moved aside, not fatal."""
+        (temp_cache_dir / "releases.db").write_bytes(b"not a database" * 100)
+
+        assert downloader.get_cached_release() is None
+        assert downloader.list_cached_versions() == []
+        assert (temp_cache_dir / "releases.db.corrupt").exists()
+
+    def test_locked_database_treated_as_uncached(self, downloader):
+        """Test that a database that can't be opened means nothing is cached."""
+        with patch(
+            "src.updater.downloader.ReleaseCacheDB.initialize",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            assert downloader.get_cached_release("v1.0.0") is None
+            assert downloader.list_cached_versions() == []
+
+    def test_failed_download_drops_metadata(self, downloader, temp_cache_dir, sample_release):
+        """Test that removing a failed download's directory also drops its metadata."""
+        release_dir = temp_cache_dir / "v1.0.0"
+        release_dir.mkdir()
+        downloader._write_metadata(release_dir, sample_release)
+
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = GitHubConnectionError("offline")
+        with patch.object(downloader, '_get_client', return_value=mock_client):
+            with pytest.raises(GitHubConnectionError):
+                downloader.download_release(sample_release, force=True)
+
+        assert not release_dir.exists()
+        assert downloader._read_metadata(release_dir) is None
+
+    def test_legacy_json_metadata_imported_once(
+        self, downloader, temp_cache_dir, cached_metadata_json
+    ):
+        """Test that JSON metadata is imported only when the database is created."""
+        release_dir = temp_cache_dir / "v1.0.0"
+        release_dir.mkdir()
+        write_files(release_dir, {"dump_runner.elf": b"elf content", "homebrew.js": b"js content"})
+        (release_dir / "release_metadata.json").write_text(cached_metadata_json)
+
+        assert downloader.list_cached_versions() == ["v1.0.0"]
+
+        # JSON written after the database exists is no longer read
+        other_dir = temp_cache_dir / "v0.9.0"
+        other_dir.mkdir()
+        (other_dir / "release_metadata.json").write_text(json.dumps({"version": "v0.9.0"}))
+
+        reopened = ReleaseDownloader(cache_dir=temp_cache_dir)
+        assert reopened.list_cached_versions() == ["v1.0.0"]
+        assert (temp_cache_dir / "releases.db").exists()
+
+    def test_download_release_incomplete_fails(self, downloader, incomplete_release):
         """Test that incomplete releases raise error."""
         # Create release without JS file
-        data = SAMPLE_RELEASE_RESPONSE.copy()
-        data["assets"] = [a for a in data["assets"] if a["name"] != "homebrew.js"]
-        release = GitHubRelease.from_api_response(data)
+        release = incomplete_release
 
         with pytest.raises(ValueError, match="missing required files"):
             downloader.download_release(release)
@@ -560,16 +1095,36 @@ class TestReleaseDownloader:
         assert "v1.0.0" in versions
         assert "v0.9.0" in versions
 
+    def test_list_cached_versions_sorted_numerically(self, downloader, temp_cache_dir):
+        """Test cached versions are ordered by numeric version parts."""
+        for version in ["v1.9.0", "v1.10.0", "v1.2.0"]:
+            release_dir = temp_cache_dir / version
+            release_dir.mkdir()
+            (release_dir / "release_metadata.json").write_text(json.dumps({"version": version}))
+
+        assert downloader.list_cached_versions() == ["v1.10.0", "v1.9.0", "v1.2.0"]
+
+    def test_list_cached_versions_sanitized_name(self, downloader, temp_cache_dir):
+        """Test that sanitized directory names fall back to metadata."""
+        release_dir = temp_cache_dir / "release_1.0"
+        release_dir.mkdir()
+        metadata = {"version": "release/1.0"}
+        (release_dir / "release_metadata.json").write_text(json.dumps(metadata))
+
+        assert downloader.list_cached_versions() == ["release/1.0"]
+
+    def test_get_release_dir_sanitizes_version(self, downloader, temp_cache_dir):
+        """Test that unsafe characters in versions are replaced."""
+        assert downloader._get_release_dir("v1.0.0-rc_1") == temp_cache_dir / "v1.0.0-rc_1"
+        assert downloader._get_release_dir("release/1.0 beta") == temp_cache_dir / "release_1.0_beta"
+
     def test_context_manager(self, temp_cache_dir):
         """Test ReleaseDownloader as context manager."""
         with ReleaseDownloader(cache_dir=temp_cache_dir) as downloader:
             assert downloader._cache_dir == temp_cache_dir
 
-    def test_download_release_from_zip(self, downloader, temp_cache_dir):
+    def test_download_release_from_zip(self, downloader, temp_cache_dir, zip_blob):
         """Test downloading release from zip file."""
-        import io
-        import zipfile
-
         # Create release with zip asset
         data = {
             "tag_name": "v1.0.0",
@@ -592,16 +1147,11 @@ class TestReleaseDownloader:
         assert release.has_zip is True
         assert release.is_complete is True
 
-        # Create a mock zip file with the required files
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("dump_runner/dump_runner.elf", b"elf content from zip")
-            zf.writestr("dump_runner/homebrew.js", b"js content from zip")
-        zip_content = zip_buffer.getvalue()
-
         # Mock the client
-        mock_client = MagicMock()
-        mock_client.download_asset.return_value = zip_content
+        mock_client = Mock()
+        mock_client.download_asset_to_file.side_effect = fake_download(
+            {"dump_runner.zip": zip_blob}
+        )
 
         with patch.object(downloader, '_get_client', return_value=mock_client):
             result = downloader.download_release(release)
@@ -612,3 +1162,8 @@ class TestReleaseDownloader:
             assert result.js_path.exists()
             assert result.elf_path.read_bytes() == b"elf content from zip"
             assert result.js_path.read_bytes() == b"js content from zip"
+
+        metadata = downloader._read_metadata(temp_cache_dir / "v1.0.0")
+        js_info = metadata["assets"]["homebrew.js"]
+        assert js_info["sha256"] == hashlib.sha256(b"js content from zip").hexdigest()
+        assert js_info["size"] == len(b"js content from zip")
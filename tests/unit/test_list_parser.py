@@ -5,7 +5,12 @@ Tests the parsing of Unix-style LIST output to extract directory names.
 
 import pytest
 
-from src.ftp.list_parser import parse_list_output, parse_list_output_flexible
+from src.ftp.list_parser import (
+    parse_list_output,
+    parse_list_line,
+    parse_list_output_flexible,
+    split_list_line,
+)
 
 
 class TestParseListOutput:
@@ -28,9 +33,7 @@ drwxr-xr-x  2 root root 4096 Jan  1 12:00 CUSA11111"""
         result = parse_list_output(list_output)
 
         assert len(result) == 3
-        assert "CUSA12345" in result
-        assert "CUSA67890" in result
-        assert "CUSA11111" in result
+        assert set(result) == {"CUSA12345", "CUSA67890", "CUSA11111"}
 
     def test_ignores_files(self):
         """Should ignore files (lines starting with -)."""
@@ -83,8 +86,7 @@ drwxr-xr-x  2 root root 4096 Jan  1 12:00 CUSA67890
         result = parse_list_output(list_output)
 
         assert len(result) == 2
-        assert "CUSA12345" in result
-        assert "CUSA67890" in result
+        assert set(result) == {"CUSA12345", "CUSA67890"}
 
     def test_handles_malformed_lines(self):
         """Should skip malformed lines that don't match expected format."""
@@ -96,8 +98,7 @@ drwxr-xr-x  2 root root 4096 Jan  1 12:00 CUSA67890"""
         result = parse_list_output(list_output)
 
         assert len(result) == 2
-        assert "CUSA12345" in result
-        assert "CUSA67890" in result
+        assert set(result) == {"CUSA12345", "CUSA67890"}
 
     def test_handles_different_permission_formats(self):
         """Should handle various Unix permission formats."""
@@ -108,9 +109,7 @@ drwx------  2 root root 4096 Jan  1 12:00 DIR3"""
         result = parse_list_output(list_output)
 
         assert len(result) == 3
-        assert "DIR1" in result
-        assert "DIR2" in result
-        assert "DIR3" in result
+        assert set(result) == {"DIR1", "DIR2", "DIR3"}
 
     def test_handles_different_month_formats(self):
         """Should handle different month name formats."""
@@ -177,9 +176,7 @@ drwxr-xr-x SimpleDir"""
         result = parse_list_output_flexible(list_output)
 
         assert len(result) == 3
-        assert "UnixDir" in result
-        assert "WindowsDir" in result
-        assert "SimpleDir" in result
+        assert set(result) == {"UnixDir", "WindowsDir", "SimpleDir"}
 
     def test_ignores_windows_files(self):
         """Should ignore Windows-style file entries."""
@@ -207,6 +204,47 @@ drwxr-xr-x SimpleDir"""
         assert result == ["RealFolder"]
 
 
+class TestSplitListLine:
+    """Test split_list_line() function."""
+
+    def test_splits_permissions_and_name(self):
+        """Should return the permissions and the trailing name."""
+        line = "-rw-r--r--  1 root root 1024 Jan  1 12:00 dump_runner.elf"
+
+        assert split_list_line(line) == ("-rw-r--r--", "dump_runner.elf")
+
+    def test_preserves_repeated_spaces_in_name(self):
+        """Should keep the name's internal spacing and drop trailing whitespace."""
+        line = "drwxr-xr-x  2 root root 4096 Jan  1 12:00 Game  [v1.00]\r"
+
+        assert split_list_line(line) == ("drwxr-xr-x", "Game  [v1.00]")
+
+    def test_returns_none_without_name(self):
+        """Should reject lines with fewer than nine fields."""
+        assert split_list_line("drwxr-xr-x  2 root root 4096 Jan  1 12:00") is None
+        assert split_list_line("") is None
+
+
+class TestParseListLine:
+    """Test parse_list_line() function."""
+
+    def test_returns_directory_name(self):
+        """Should return the name of a directory entry."""
+        line = "drwxr-xr-x  2 root root 4096 Jan  1 12:00 CUSA12345"
+
+        assert parse_list_line(line) == "CUSA12345"
+
+    @pytest.mark.parametrize("line", [
+        "-rw-r--r--  1 root root 1024 Jan  1 12:00 file.txt",
+        "drwxr-xr-x  2 root root 4096 Jan  1 12:00 ..",
+        "total 8",
+        "   ",
+    ])
+    def test_returns_none_for_non_directories(self, line):
+        """Should return None for files, special directories and other lines."""
+        assert parse_list_line(line) is None
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -235,9 +273,11 @@ drwxr-xr-x  2 root root 4096 Jan  1 12:00 name.with.dots"""
         result = parse_list_output(list_output)
 
         assert len(result) == 3
-        assert "name-with-dashes" in result
-        assert "name_with_underscores" in result
-        assert "name.with.dots" in result
+        assert set(result) == {
+            "name-with-dashes",
+            "name_with_underscores",
+            "name.with.dots",
+        }
 
     def test_unicode_in_directory_names(self):
         """Should handle Unicode characters in directory names."""
@@ -37,85 +37,73 @@ class TestLocalScannerInit:
         assert dumps1 is not dumps2  # Different list objects
 
 
+def make_dump(parent: Path, name: str, files=("eboot.bin",)) -> Path:
+    """Create a dump folder containing the given files."""
+    folder = parent / name
+    folder.mkdir(parents=True)
+    for file_name in files:
+        (folder / file_name).write_bytes(b"data")
+    return folder
+
+
 class TestLocalScannerScan:
     """Test LocalScanner.scan() method."""
 
-    def test_scans_predefined_paths(self):
+    def test_scans_predefined_paths(self, tmp_path):
         """Should scan all predefined paths on the volume."""
-        volume = Path("E:\\")
-        scanner = LocalScanner(volume)
+        make_dump(tmp_path / "homebrew", "Game 1")
+        make_dump(tmp_path / "etaHEN" / "games", "Game 2")
+        scanner = LocalScanner(tmp_path)
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", return_value=[]):
-                    result = scanner.scan()
+        result = scanner.scan()
 
-                    assert scanner._last_scan is not None
-                    assert isinstance(scanner._last_scan, datetime)
+        assert sorted(d.name for d in result) == ["Game 1", "Game 2"]
+        assert scanner._last_scan is not None
+        assert isinstance(scanner._last_scan, datetime)
 
-    def test_finds_valid_dump_folders(self):
+    def test_finds_valid_dump_folders(self, tmp_path):
         """Should find any folder with eboot.bin file."""
-        volume = Path("E:\\")
-        scanner = LocalScanner(volume)
+        make_dump(tmp_path / "homebrew", "Game 1")
+        scanner = LocalScanner(tmp_path)
 
-        # Mock folder structure - any folder name is acceptable
-        mock_dump = MagicMock(spec=Path)
-        mock_dump.name = "Game 1"
-        mock_dump.is_dir.return_value = True
-        mock_dump.__truediv__ = lambda self, other: MagicMock(spec=Path, exists=lambda: True)
+        result = scanner.scan()
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", return_value=[mock_dump]):
-                    result = scanner.scan()
-
-                    assert len(result) > 0
-                    assert all(isinstance(d, GameDump) for d in result)
+        assert len(result) > 0
+        assert all(isinstance(d, GameDump) for d in result)
 
-    def test_skips_folders_without_eboot_bin(self):
+    def test_skips_folders_without_eboot_bin(self, tmp_path):
         """Should skip folders without eboot.bin file."""
-        volume = Path("E:\\")
-        scanner = LocalScanner(volume)
+        make_dump(tmp_path / "homebrew", "Game 1", files=("param.sfo",))
+        scanner = LocalScanner(tmp_path)
 
-        mock_dump = MagicMock(spec=Path)
-        mock_dump.name = "Game 1"
-        mock_dump.is_dir.return_value = True
-        mock_dump.__truediv__ = lambda self, other: MagicMock(spec=Path, exists=lambda: False)
+        result = scanner.scan()
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", return_value=[mock_dump]):
-                    result = scanner.scan()
+        assert len(result) == 0
 
-                    assert len(result) == 0
+    def test_skips_files(self, tmp_path):
+        """Should only consider directories as dump folders."""
+        (tmp_path / "homebrew").mkdir()
+        (tmp_path / "homebrew" / "eboot.bin").write_bytes(b"data")
+        scanner = LocalScanner(tmp_path)
 
-    def test_accepts_any_folder_name_with_eboot_bin(self):
-        """Should accept any folder name as long as eboot.bin exists."""
-        volume = Path("E:\\")
-        scanner = LocalScanner(volume)
+        assert scanner.scan() == []
 
+    def test_accepts_any_folder_name_with_eboot_bin(self, tmp_path):
+        """Should accept any folder name as long as eboot.bin exists."""
         # Create folders with various names - all should be accepted if they have eboot.bin
-        mock_folder1 = MagicMock(spec=Path)
-        mock_folder1.name = "Game 1"
-        mock_folder1.is_dir.return_value = True
-        mock_folder1.__truediv__ = lambda self, other: MagicMock(spec=Path, exists=lambda: True)
-
-        mock_folder2 = MagicMock(spec=Path)
-        mock_folder2.name = "My Custom Game"
-        mock_folder2.is_dir.return_value = True
-        mock_folder2.__truediv__ = lambda self, other: MagicMock(spec=Path, exists=lambda: True)
+        for parent in (tmp_path / "homebrew", tmp_path / "etaHEN" / "games"):
+            make_dump(parent, "Game 1")
+            make_dump(parent, "My Custom Game")
+        scanner = LocalScanner(tmp_path)
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", return_value=[mock_folder1, mock_folder2]):
-                    result = scanner.scan()
+        result = scanner.scan()
 
-                    # Scanner scans 2 predefined paths, so 2 folders * 2 paths = 4 results
-                    assert len(result) == 4
-                    # Check that both folder names appear in results
-                    names = [dump.name for dump in result]
-                    assert names.count("Game 1") == 2
-                    assert names.count("My Custom Game") == 2
+        # Scanner scans 2 predefined paths, so 2 folders * 2 paths = 4 results
+        assert len(result) == 4
+        # Check that both folder names appear in results
+        names = [dump.name for dump in result]
+        assert names.count("Game 1") == 2
+        assert names.count("My Custom Game") == 2
 
     def test_handles_permission_errors(self):
         """Should handle permission errors gracefully."""
@@ -124,7 +112,7 @@ class TestLocalScannerScan:
 
         with patch("pathlib.Path.exists", return_value=True):
             with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", side_effect=PermissionError("Access denied")):
+                with patch("os.scandir", side_effect=PermissionError("Access denied")):
                     result = scanner.scan()
 
                     # Should return empty list, not crash
@@ -141,128 +129,127 @@ class TestLocalScannerScan:
             assert result == []
             assert scanner._last_scan is not None
 
-    def test_sets_location_type_to_local(self):
+    def test_sets_location_type_to_local(self, tmp_path):
         """Should set location_type to LOCAL for all found dumps."""
-        volume = Path("E:\\")
-        scanner = LocalScanner(volume)
-
-        mock_dump = MagicMock(spec=Path)
-        mock_dump.name = "CUSA12345"
-        mock_dump.is_dir.return_value = True
-        mock_dump.__str__.return_value = "E:\\homebrew\\CUSA12345"
-        mock_sfo = MagicMock(spec=Path)
-        mock_sfo.exists.return_value = True
-        mock_dump.__truediv__.return_value = mock_sfo
+        folder = make_dump(tmp_path / "homebrew", "CUSA12345")
+        scanner = LocalScanner(tmp_path)
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.is_dir", return_value=True):
-                with patch("pathlib.Path.iterdir", return_value=[mock_dump]):
-                    result = scanner.scan()
+        result = scanner.scan()
 
-                    assert len(result) > 0
-                    for dump in result:
-                        assert dump.location_type == LocationType.LOCAL
+        assert len(result) > 0
+        for dump in result:
+            assert dump.location_type == LocationType.LOCAL
+            assert dump.path == str(folder)
 
 
 class TestCheckDumpFolder:
     """Test LocalScanner._check_dump_folder() method."""
 
-    def test_accepts_any_folder_name_with_eboot_bin(self):
+    def test_accepts_any_folder_name_with_eboot_bin(self, tmp_path):
         """Should accept any folder name as long as eboot.bin exists."""
-        scanner = LocalScanner(Path("E:\\"))
-
-        valid_folders = [
-            Path("E:\\homebrew\\CUSA12345"),
-            Path("E:\\homebrew\\Game 1"),
-            Path("E:\\homebrew\\My Custom Game"),
-            Path("E:\\homebrew\\Spider-Man"),
-        ]
+        scanner = LocalScanner(tmp_path)
 
-        for folder in valid_folders:
-            with patch("pathlib.Path.exists", return_value=True):
-                result = scanner._check_dump_folder(folder)
-                assert result is not None
-                assert result.name == folder.name
+        for name in ["CUSA12345", "Game 1", "My Custom Game", "Spider-Man"]:
+            folder = make_dump(tmp_path / "homebrew", name)
+            result = scanner._check_dump_folder(folder)
+            assert result is not None
+            assert result.name == folder.name
 
-    def test_rejects_folders_without_eboot_bin(self):
+    def test_rejects_folders_without_eboot_bin(self, tmp_path):
         """Should reject folders that don't have eboot.bin file."""
-        scanner = LocalScanner(Path("E:\\"))
+        scanner = LocalScanner(tmp_path)
 
-        test_folders = [
-            Path("E:\\homebrew\\CUSA12345"),
-            Path("E:\\homebrew\\Game 1"),
-            Path("E:\\homebrew\\Random Folder"),
-        ]
-
-        for folder in test_folders:
-            with patch("pathlib.Path.exists", return_value=False):
-                result = scanner._check_dump_folder(folder)
-                assert result is None
+        for name in ["CUSA12345", "Game 1", "Random Folder"]:
+            folder = make_dump(tmp_path / "homebrew", name, files=())
+            result = scanner._check_dump_folder(folder)
+            assert result is None
 
-    def test_requires_eboot_bin(self):
+    def test_requires_eboot_bin(self, tmp_path):
         """Should require eboot.bin file to be present."""
-        scanner = LocalScanner(Path("E:\\"))
-        folder = Path("E:\\homebrew\\CUSA12345")
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345", files=("dump_runner.elf", "homebrew.js"))
 
-        with patch("pathlib.Path.exists", return_value=False):
-            result = scanner._check_dump_folder(folder)
-            assert result is None
+        result = scanner._check_dump_folder(folder)
+        assert result is None
+
+    def test_rejects_unreadable_folder(self, tmp_path):
+        """Should skip folders that cannot be listed."""
+        scanner = LocalScanner(tmp_path)
+
+        result = scanner._check_dump_folder(tmp_path / "missing")
+        assert result is None
+
+    def test_detects_installation_from_same_listing(self, tmp_path):
+        """Should report installed files found alongside eboot.bin."""
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345", files=("eboot.bin", "dump_runner.elf"))
+
+        result = scanner._check_dump_folder(folder)
+
+        assert result.has_elf is True
+        assert result.has_js is False
 
 
 class TestCheckInstallationStatus:
     """Test LocalScanner._check_installation_status() method."""
 
-    def test_detects_full_installation(self):
-        """Should detect when both dump_runner.elf and homebrew.js exist."""
-        scanner = LocalScanner(Path("E:\\"))
-        dump = GameDump(
-            path="E:\\homebrew\\CUSA12345",
-            name="CUSA12345",
+    @staticmethod
+    def make_game_dump(folder: Path) -> GameDump:
+        """Create a GameDump for a folder."""
+        return GameDump(
+            path=str(folder),
+            name=folder.name,
             location_type=LocationType.LOCAL,
         )
 
-        with patch("pathlib.Path.exists", return_value=True):
-            scanner._check_installation_status(dump, Path(dump.path))
+    def test_detects_full_installation(self, tmp_path):
+        """Should detect when both dump_runner.elf and homebrew.js exist."""
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345", files=("eboot.bin", "dump_runner.elf", "homebrew.js"))
+        dump = self.make_game_dump(folder)
 
-            assert dump.has_elf is True
-            assert dump.has_js is True
-            assert dump.installation_status == InstallationStatus.UNKNOWN
+        scanner._check_installation_status(dump, folder)
 
-    def test_detects_partial_installation(self):
-        """Should detect when only one file is present."""
-        scanner = LocalScanner(Path("E:\\"))
-        dump = GameDump(
-            path="E:\\homebrew\\CUSA12345",
-            name="CUSA12345",
-            location_type=LocationType.LOCAL,
-        )
+        assert dump.has_elf is True
+        assert dump.has_js is True
+        assert dump.installation_status == InstallationStatus.UNKNOWN
 
-        # Mock only elf file exists
-        def exists_side_effect(path_self):
-            return "dump_runner.elf" in str(path_self)
+    def test_detects_partial_installation(self, tmp_path):
+        """Should detect when only one file is present."""
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345", files=("eboot.bin", "dump_runner.elf"))
+        dump = self.make_game_dump(folder)
 
-        with patch.object(Path, "exists", exists_side_effect):
-            scanner._check_installation_status(dump, Path(dump.path))
+        scanner._check_installation_status(dump, folder)
 
-            assert dump.has_elf is True
-            assert dump.has_js is False
-            assert dump.installation_status == InstallationStatus.UNKNOWN
+        assert dump.has_elf is True
+        assert dump.has_js is False
+        assert dump.installation_status == InstallationStatus.UNKNOWN
 
-    def test_detects_not_installed(self):
+    def test_detects_not_installed(self, tmp_path):
         """Should detect when neither file is present."""
-        scanner = LocalScanner(Path("E:\\"))
-        dump = GameDump(
-            path="E:\\homebrew\\CUSA12345",
-            name="CUSA12345",
-            location_type=LocationType.LOCAL,
-        )
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345")
+        dump = self.make_game_dump(folder)
 
-        with patch("pathlib.Path.exists", return_value=False):
-            scanner._check_installation_status(dump, Path(dump.path))
+        scanner._check_installation_status(dump, folder)
+
+        assert dump.has_elf is False
+        assert dump.has_js is False
+        assert dump.installation_status == InstallationStatus.NOT_INSTALLED
+
+    def test_uses_provided_names(self, tmp_path):
+        """Should use an existing listing instead of reading the folder."""
+        scanner = LocalScanner(tmp_path)
+        folder = tmp_path / "CUSA12345"
+        dump = self.make_game_dump(folder)
 
-            assert dump.has_elf is False
-            assert dump.has_js is False
-            assert dump.installation_status == InstallationStatus.NOT_INSTALLED
+        with patch("os.scandir") as mock_scandir:
+            scanner._check_installation_status(dump, folder, {"dump_runner.elf", "homebrew.js"})
+
+        mock_scandir.assert_not_called()
+        assert dump.has_elf is True
+        assert dump.has_js is True
 
     def test_handles_errors_gracefully(self):
         """Should handle file system errors without crashing."""
@@ -273,7 +260,7 @@ class TestCheckInstallationStatus:
             location_type=LocationType.LOCAL,
         )
 
-        with patch("pathlib.Path.exists", side_effect=Exception("Disk error")):
+        with patch("os.scandir", side_effect=Exception("Disk error")):
             scanner._check_installation_status(dump, Path(dump.path))
 
             assert dump.installation_status == InstallationStatus.UNKNOWN
@@ -282,20 +269,20 @@ class TestCheckInstallationStatus:
 class TestRefresh:
     """Test LocalScanner.refresh() method."""
 
-    def test_refreshes_single_dump_status(self):
+    def test_refreshes_single_dump_status(self, tmp_path):
         """Should refresh installation status of a single dump."""
-        scanner = LocalScanner(Path("E:\\"))
+        scanner = LocalScanner(tmp_path)
+        folder = make_dump(tmp_path, "CUSA12345", files=("eboot.bin", "dump_runner.elf", "homebrew.js"))
         dump = GameDump(
-            path="E:\\homebrew\\CUSA12345",
+            path=str(folder),
             name="CUSA12345",
             location_type=LocationType.LOCAL,
         )
 
-        with patch("pathlib.Path.exists", return_value=True):
-            refreshed = scanner.refresh(dump)
+        refreshed = scanner.refresh(dump)
 
-            assert refreshed.has_elf is True
-            assert refreshed.has_js is True
+        assert refreshed.has_elf is True
+        assert refreshed.has_js is True
 
     def test_handles_missing_dump_folder(self):
         """Should handle case when dump folder no longer exists."""
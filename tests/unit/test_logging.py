@@ -0,0 +1,148 @@
+"""Unit tests for logging utilities.
+
+Tests PII redaction in log output.
+"""
+
+import logging
+
+import pytest
+
+from src.utils.logging import (
+    LOG_DATE_FORMAT,
+    LOG_FORMAT,
+    PIIRedactingFormatter,
+    _redact_message,
+    get_logger,
+)
+
+
+@pytest.fixture
+def formatter():
+    """Create a formatter that outputs only the message."""
+    return PIIRedactingFormatter(fmt="%(message)s")
+
+
+def format_message(formatter, message: str) -> str:
+    """Format a message through the given formatter."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    return formatter.format(record)
+
+
+class TestPIIRedactingFormatter:
+    """Tests for PIIRedactingFormatter."""
+
+    @pytest.mark.parametrize("message,expected", [
+        ("password=secret123", "password=[REDACTED]"),
+        ("Password: hunter2, user=bob", "Password: [REDACTED], user=bob"),
+        ('{"passwd": "abc"}', '{"passwd": "[REDACTED]}'),
+        ("pass=xyz done", "pass=[REDACTED] done"),
+        ("FTP PASS=xyz", "FTP PASS=[REDACTED]"),
+    ])
+    def test_redacts_passwords(self, formatter, message, expected):
+        """Test password values are redacted."""
+        assert format_message(formatter, message) == expected
+
+    def test_redacts_ftp_credentials(self, formatter):
+        """Test credentials in FTP URLs are redacted."""
+        message = format_message(formatter, "Connecting to ftp://user:pw@host/")
+        assert message == "Connecting to ftp://[REDACTED]@host/"
+
+    def test_partially_redacts_ip_addresses(self, formatter):
+        """Test the last two octets of IP addresses are masked."""
+        message = format_message(formatter, "Connected to 192.168.1.50:2121")
+        assert message == "Connected to 192.168.*.*:2121"
+
+    def test_plain_message_unchanged(self, formatter):
+        """Test messages without PII pass through unchanged."""
+        message = "Uploaded dump_runner.elf to /data/homebrew/GAME"
+        assert format_message(formatter, message) == message
+
+
+class TestGetLogger:
+    """Tests for get_logger."""
+
+    def test_returns_same_logger(self):
+        """Test repeated calls return the standard logging logger."""
+        logger = get_logger("ps5_dump_runner.test")
+        assert logger is logging.getLogger("ps5_dump_runner.test")
+        assert get_logger("ps5_dump_runner.test") is logger
+
+    def test_default_name(self):
+        """Test the default logger is the app logger."""
+        assert get_logger().name == "ps5_dump_runner"
+
+
+class TestRedactionCache:
+    """Tests for cached message redaction."""
+
+    def test_repeated_message_uses_cache(self, formatter):
+        """Test identical messages are redacted once."""
+        _redact_message.cache_clear()
+        for _ in range(3):
+            assert format_message(formatter, "Login password=abc") == "Login password=[REDACTED]"
+
+        info = _redact_message.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_redacts_message_with_args(self, formatter):
+        """Test messages built from args are redacted after formatting."""
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 1, "Connecting to %s", ("10.0.0.5",), None
+        )
+        assert formatter.format(record) == "Connecting to 10.0.*.*"
+
+    def test_redacts_exception_text(self, formatter):
+        """Test exception tracebacks are redacted."""
+        try:
+            raise ValueError("bad password=hunter2")
+        except ValueError:
+            import sys
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+
+        message = formatter.format(record)
+        assert "hunter2" not in message
+        assert "password=[REDACTED]" in message
+
+
+class TestAppFormat:
+    """Tests for the application log format fast path."""
+
+    def make_record(self, message, exc_info=None):
+        """Create a log record with a fixed timestamp."""
+        record = logging.LogRecord(
+            "ps5_dump_runner.test", logging.WARNING, __file__, 1, message, None, exc_info
+        )
+        record.created = 1700000000.0
+        record.msecs = 0.0
+        return record
+
+    def test_matches_standard_formatter(self):
+        """Test the fast path renders the same line as logging.Formatter."""
+        formatter = PIIRedactingFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        standard = logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+        assert formatter._is_app_format is True
+        assert formatter.format(self.make_record("Scan complete")) == \
+            standard.format(self.make_record("Scan complete"))
+
+    def test_redacts_on_fast_path(self):
+        """Test the fast path still redacts the message."""
+        formatter = PIIRedactingFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        message = formatter.format(self.make_record("Login pass=abc"))
+
+        assert message.endswith(" - ps5_dump_runner.test - WARNING - Login pass=[REDACTED]")
+
+    def test_exception_uses_standard_path(self):
+        """Test records with exceptions include the redacted traceback."""
+        formatter = PIIRedactingFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        try:
+            raise RuntimeError("ftp://user:pw@host")
+        except RuntimeError:
+            import sys
+            record = self.make_record("failed", sys.exc_info())
+
+        message = formatter.format(record)
+        assert "RuntimeError: ftp://[REDACTED]@host" in message
@@ -5,7 +5,7 @@ Tests game dump discovery and status tracking.
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from ftplib import error_perm
+from ftplib import FTP, error_perm
 
 from src.ftp.scanner import (
     LocationType,
@@ -14,8 +14,9 @@ from src.ftp.scanner import (
     DumpScanner,
 )
 from src.ftp.connection import FTPConnectionManager, ConnectionState
-from src.ftp.exceptions import FTPNotConnectedError
+from src.ftp.exceptions import FTPConnectionError, FTPNotConnectedError
 from src.config.paths import SCAN_PATHS, get_location_type_from_path
+from tests.fakes import FakeFilesystem, FakeFTP, fake_connection
 
 
 class TestLocationTypeEnum:
@@ -139,6 +140,15 @@ class TestGameDump:
         assert dump.name == "GAME001"
         assert dump.path == "/data/homebrew/GAME001/"
 
+    def test_path_and_name_interned(self):
+        """Test dumps built from equal strings share one path and name object."""
+        base = "/data/homebrew/"
+        d1 = GameDump.from_path(base + "GAME001")
+        d2 = GameDump.from_path("".join([base, "GAME001"]))
+
+        assert d1.path is d2.path
+        assert d1.name is d2.name
+
     def test_display_name(self):
         """Test display name includes location prefix."""
         internal = GameDump.from_path("/data/homebrew/Game1")
@@ -183,6 +193,18 @@ class TestDumpScanner:
         assert scanner.last_scan is None
         assert scanner.dumps == []
 
+    def test_scan_paths_only_scans_given_paths(self):
+        """Test scan visits only the paths passed to the constructor."""
+        ftp = FakeFTP(filesystem=FakeFilesystem({"/data/homebrew": [("Game1", True)]}))
+        mock_connection = fake_connection(ftp)
+
+        paths = ["/data/homebrew/"]
+        scanner = DumpScanner(mock_connection, scan_paths=paths)
+        paths.append("/mnt/usb0/homebrew/")
+        scanner.scan()
+
+        assert not any("usb0" in path for path in ftp.cwd_calls)
+
     def test_scan_not_connected_raises_error(self):
         """Test scan raises error when not connected."""
         mock_connection = Mock(spec=FTPConnectionManager)
@@ -200,8 +222,8 @@ class TestDumpScanner:
         mock_connection.is_connected = True
         mock_connection.ftp = mock_ftp
 
-        # Mock pwd to return current directory
-        mock_ftp.pwd.return_value = "/"
+        # Working directory the scanner returns to
+        mock_connection.home_dir = "/"
 
         # Mock cwd - only /data/homebrew/ and its subdirs exist
         def mock_cwd(path):
@@ -238,8 +260,8 @@ class TestDumpScanner:
         mock_connection.is_connected = True
         mock_connection.ftp = mock_ftp
 
-        # Mock pwd to return current directory
-        mock_ftp.pwd.return_value = "/"
+        # Working directory the scanner returns to
+        mock_connection.home_dir = "/"
 
         # All paths raise permission error in CWD check (don't exist)
         def mock_cwd(path):
@@ -261,8 +283,8 @@ class TestDumpScanner:
         mock_connection.is_connected = True
         mock_connection.ftp = mock_ftp
 
-        # Mock pwd to return current directory
-        mock_ftp.pwd.return_value = "/"
+        # Working directory the scanner returns to
+        mock_connection.home_dir = "/"
 
         # Mock cwd - only /data/homebrew/ exists
         def mock_cwd(path):
@@ -284,8 +306,9 @@ class TestDumpScanner:
         mock_ftp.nlst.side_effect = mock_nlst
 
         # Mock dir for _list_files_in_dir (used by _check_installation_status)
-        def mock_dir(callback):
+        def mock_dir(*args):
             # Simulate LIST output for /data/homebrew/InstalledGame
+            callback = args[-1]
             callback("-rw-r--r-- 1 root root 12345 Jan 01 00:00 dump_runner.elf")
             callback("-rw-r--r-- 1 root root 1234 Jan 01 00:00 homebrew.js")
             callback("-rw-r--r-- 1 root root 100 Jan 01 00:00 other.txt")
@@ -300,6 +323,124 @@ class TestDumpScanner:
         assert dumps[0].has_js is True
         assert dumps[0].installation_status == InstallationStatus.UNKNOWN
 
+    @pytest.mark.parametrize("dump_path,dir_path_error,dir_calls,cwd_calls", [
+        # Plain path: a single LIST <path>
+        ("/data/homebrew/Game", None, ["/data/homebrew/Game"], []),
+        # Spaces could be taken as a pattern, so CWD there and back
+        ("/data/homebrew/My Game", None, [None], ["/data/homebrew/My Game", "/"]),
+        # Server refuses a LIST argument: retry via CWD
+        ("/data/homebrew/Game", error_perm("501 Syntax error"),
+         ["/data/homebrew/Game", None], ["/data/homebrew/Game", "/"]),
+    ])
+    def test_refresh_lists_dump_once(self, dump_path, dir_path_error, dir_calls, cwd_calls):
+        """Test installation status comes from one LIST of the dump directory."""
+        ftp = FakeFTP(
+            filesystem=FakeFilesystem({
+                dump_path: [("dump_runner.elf", False), ("homebrew.js", False), ("sce_sys", True)],
+            }),
+            dir_path_error=dir_path_error,
+        )
+        mock_connection = fake_connection(ftp)
+
+        dump = DumpScanner(mock_connection).refresh(GameDump.from_path(dump_path))
+
+        assert dump.has_elf is True
+        assert dump.has_js is True
+        assert ftp.dir_calls == dir_calls
+        assert ftp.cwd_calls == cwd_calls
+        assert ftp.nlst_calls == []
+
+    @pytest.mark.parametrize("files, has_elf, has_js, status", [
+        (["dump_runner.elf", "homebrew.js", "eboot.bin"], True, True, InstallationStatus.UNKNOWN),
+        (["homebrew.js", "eboot.bin"], False, True, InstallationStatus.UNKNOWN),
+        (["eboot.bin"], False, False, InstallationStatus.NOT_INSTALLED),
+    ])
+    def test_refresh_sets_status_from_files(self, files, has_elf, has_js, status):
+        """Test the dump_runner files found set the flags and status."""
+        ftp = FakeFTP(filesystem=FakeFilesystem({
+            "/data/homebrew/Game": [(name, False) for name in files],
+        }))
+        mock_connection = fake_connection(ftp)
+
+        dump = DumpScanner(mock_connection).refresh(GameDump.from_path("/data/homebrew/Game"))
+
+        assert (dump.has_elf, dump.has_js) == (has_elf, has_js)
+        assert dump.installation_status == status
+
+    def test_scan_with_mlsd_lists_each_directory_once(self):
+        """Test MLSD replaces NLST + LIST: one listing per scanned directory."""
+        ftp = FakeFTP(filesystem=FakeFilesystem({
+            "/data/homebrew": [("Game1", True), ("Game2", True), ("notes.txt", False)],
+            "/data/homebrew/Game1": [("dump_runner.elf", False), ("homebrew.js", False)],
+            "/data/homebrew/Game2": [("eboot.bin", False)],
+        }))
+        mock_connection = fake_connection(ftp)
+
+        scanner = DumpScanner(mock_connection, scan_paths=["/data/homebrew/"], use_mlsd=True)
+        dumps = scanner.scan()
+
+        assert [(d.name, d.has_elf, d.has_js) for d in dumps] == [
+            ("Game1", True, True),
+            ("Game2", False, False),
+        ]
+        assert ftp.mlsd_calls == ["/data/homebrew/", "/data/homebrew/Game1", "/data/homebrew/Game2"]
+        assert ftp.nlst_calls == []
+        assert ftp.dir_calls == []
+
+    def test_scan_falls_back_when_mlsd_unsupported(self):
+        """Test a server without MLSD is scanned with NLST/LIST after one attempt."""
+        ftp = FakeFTP(
+            nlst_result=["/data/homebrew/Game1"],
+            filesystem=FakeFilesystem({
+                "/data/homebrew": [("Game1", True)],
+                "/data/homebrew/Game1": [("dump_runner.elf", False)],
+            }),
+            mlsd_error=error_perm("500 Unknown command"),
+        )
+        mock_connection = fake_connection(ftp)
+
+        scanner = DumpScanner(mock_connection, scan_paths=["/data/homebrew"], use_mlsd=True)
+        dumps = scanner.scan()
+
+        assert [(d.name, d.has_elf) for d in dumps] == [("Game1", True)]
+        assert ftp.mlsd_calls == ["/data/homebrew"]
+        assert ftp.nlst_calls == ["/data/homebrew"]
+
+    def test_scan_with_mlsd_type_is_case_insensitive(self):
+        """Test MLSD type facts like 'Dir' and 'FILE' are recognised."""
+        ftp = FakeFTP()
+        listings = {
+            "/data/homebrew": [("Game1", {"type": "Dir"})],
+            "/data/homebrew/Game1": [("dump_runner.elf", {"type": "FILE"})],
+        }
+        ftp.mlsd = lambda path, facts=(): iter(listings[path.rstrip("/")])
+        mock_connection = fake_connection(ftp)
+
+        scanner = DumpScanner(mock_connection, scan_paths=["/data/homebrew"], use_mlsd=True)
+        dumps = scanner.scan()
+
+        assert [(d.name, d.has_elf) for d in dumps] == [("Game1", True)]
+        assert ftp.nlst_calls == []
+
+    def test_scan_falls_back_when_mlsd_has_no_type_facts(self):
+        """Test an MLSD listing without type facts switches to NLST/LIST."""
+        ftp = FakeFTP(
+            nlst_result=["/data/homebrew/Game1"],
+            filesystem=FakeFilesystem({
+                "/data/homebrew": [("Game1", True)],
+                "/data/homebrew/Game1": [("dump_runner.elf", False)],
+            }),
+        )
+        ftp.mlsd = lambda path, facts=(): iter([("Game1", {"size": "0"})])
+        mock_connection = fake_connection(ftp)
+
+        scanner = DumpScanner(mock_connection, scan_paths=["/data/homebrew"], use_mlsd=True)
+        dumps = scanner.scan()
+
+        assert [(d.name, d.has_elf) for d in dumps] == [("Game1", True)]
+        assert ftp.nlst_calls == ["/data/homebrew"]
+        assert scanner._use_mlsd is False
+
     def test_get_dump_by_path(self):
         """Test finding dump by path."""
         mock_connection = Mock(spec=FTPConnectionManager)
@@ -369,6 +510,217 @@ class TestDumpScanner:
         with pytest.raises(FTPNotConnectedError):
             scanner.refresh(dump)
 
+    def test_scan_types_nlst_entries_with_one_list(self):
+        """Test NLST entries are typed by one LIST instead of per-entry probes."""
+        ftp = FakeFTP(
+            nlst_result=["/data/homebrew/Game1", "/data/homebrew/notes.txt"],
+            filesystem=FakeFilesystem({
+                "/data/homebrew": [("Game1", True), ("notes.txt", False)],
+            }),
+        )
+        mock_connection = fake_connection(ftp)
+
+        scanner = DumpScanner(mock_connection, scan_paths=["/data/homebrew/"])
+        dumps = scanner.scan()
+
+        assert [d.name for d in dumps] == ["Game1"]
+        assert ftp.nlst_calls == ["/data/homebrew/"]
+        # The working directory comes from the connection, not per-listing PWD
+        assert ftp.pwd_calls == 0
+
+    def test_scan_probe_rejects_file_listed_by_path(self):
+        """Test an untyped entry that LIST shows as a file is not a dump."""
+        ftp = FakeFTP(
+            nlst_result=["/data/homebrew/readme.txt"],
+            nlst_error=[None, error_perm("550 Not a directory")],
+            filesystem=FakeFilesystem({
+                "/data/homebrew": [("readme.txt", False)],
+            }),
+        )
+
+        scanner = DumpScanner(fake_connection(ftp), scan_paths=["/data/homebrew"])
+
+        assert scanner.scan() == []
+        assert "/data/homebrew/readme.txt" in ftp.cwd_calls
+
+    def test_parallel_scan_falls_back_when_clone_refused(self):
+        """Test paths are scanned on the main connection if extra sessions fail."""
+        mock_ftp = Mock(spec=FTP)
+        mock_connection = fake_connection(mock_ftp)
+        mock_connection.clone.side_effect = FTPNotConnectedError("Clone")
+        mock_ftp.nlst.side_effect = lambda path: [f"{path}Game"]
+        mock_ftp.dir.side_effect = lambda *args: args[-1](
+            "drwxr-xr-x  2 root root 4096 Jan  1 12:00 Game"
+        )
+
+        scanner = DumpScanner(
+            mock_connection,
+            max_connections=3,
+            scan_paths=["/data/homebrew/", "/mnt/usb0/homebrew/"],
+        )
+        dumps = scanner.scan()
+
+        assert [d.path for d in dumps] == [
+            "/data/homebrew/Game",
+            "/mnt/usb0/homebrew/Game",
+        ]
+        mock_connection.clone.assert_called_once()
+
+    def _parallel_connections(self):
+        """Main connection whose clones list the same fake directories."""
+        def make_connection():
+            ftp = Mock(spec=FTP)
+            ftp.nlst.side_effect = lambda path: [f"{path}Game"]
+            ftp.dir.side_effect = lambda *args: args[-1](
+                "drwxr-xr-x  2 root root 4096 Jan  1 12:00 Game"
+            )
+            connection = Mock(spec=FTPConnectionManager)
+            connection.is_connected = True
+            connection.ftp = ftp
+            connection.home_dir = "/"
+            connection.config = "config"
+            return connection
+
+        mock_connection = make_connection()
+        clones = []
+
+        def clone():
+            clones.append(make_connection())
+            return clones[-1]
+
+        mock_connection.clone.side_effect = clone
+        return mock_connection, clones
+
+    def test_parallel_scan_keeps_sessions_between_scans(self):
+        """Test extra sessions are reused by the next scan until close()."""
+        mock_connection, clones = self._parallel_connections()
+        scanner = DumpScanner(
+            mock_connection,
+            cache_ttl=0,
+            max_connections=2,
+            scan_paths=["/data/homebrew/", "/mnt/usb0/homebrew/"],
+        )
+
+        scanner.scan()
+        dumps = scanner.scan()
+
+        assert len(dumps) == 2
+        assert len(clones) == 1
+        clones[0].noop.assert_called_once()
+        clones[0].disconnect.assert_not_called()
+
+        scanner.close()
+
+        clones[0].disconnect.assert_called_once()
+
+    def test_parallel_scan_shares_status_checks(self):
+        """Test per-dump status listings are spread across the sessions."""
+        mock_connection, clones = self._parallel_connections()
+        mock_connection.ftp.nlst.side_effect = lambda path: [f"{path}Game1", f"{path}Game2"]
+        mock_connection.ftp.dir.side_effect = lambda *args: [
+            args[-1](f"drwxr-xr-x  2 root root 4096 Jan  1 12:00 {name}")
+            for name in ("Game1", "Game2")
+        ]
+        scanner = DumpScanner(
+            mock_connection,
+            max_connections=2,
+            scan_paths=["/data/homebrew/"],
+        )
+
+        dumps = scanner.scan()
+
+        assert [d.name for d in dumps] == ["Game1", "Game2"]
+        main_listed = [c.args[0] for c in mock_connection.ftp.dir.call_args_list]
+        clone_listed = [c.args[0] for c in clones[0].ftp.dir.call_args_list]
+        assert "/data/homebrew/Game1" in main_listed
+        assert clone_listed == ["/data/homebrew/Game2"]
+
+    def test_parallel_scan_replaces_dead_session(self):
+        """Test a kept session that stopped answering is swapped for a new one."""
+        mock_connection, clones = self._parallel_connections()
+        scanner = DumpScanner(
+            mock_connection,
+            cache_ttl=0,
+            max_connections=2,
+            scan_paths=["/data/homebrew/", "/mnt/usb0/homebrew/"],
+        )
+
+        scanner.scan()
+        clones[0].noop.side_effect = FTPConnectionError("192.168.1.100", 2121)
+        dumps = scanner.scan()
+
+        assert len(dumps) == 2
+        assert len(clones) == 2
+        clones[0].disconnect.assert_called_once()
+
+
+class TestListingCache:
+    """Tests for DumpScanner directory listing cache."""
+
+    def _scanner(self, **kwargs):
+        mock_ftp = Mock(spec=FTP)
+        mock_connection = fake_connection(mock_ftp)
+        mock_ftp.nlst.return_value = ["/data/homebrew/Game1"]
+        return DumpScanner(mock_connection, **kwargs), mock_ftp
+
+    def test_listing_reused_within_ttl(self):
+        """Test a second listing of the same path is served from cache."""
+        scanner, mock_ftp = self._scanner()
+
+        first = scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        second = scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+
+        assert first == second == ["/data/homebrew/Game1"]
+        mock_ftp.nlst.assert_called_once()
+
+    def test_cache_keeps_list_source(self):
+        """Test cached listings remember whether LIST fallback was used."""
+        scanner, mock_ftp = self._scanner()
+        mock_ftp.nlst.side_effect = error_perm("500 NLST not supported")
+        mock_ftp.dir.side_effect = lambda *args: args[-1](
+            "drwxr-xr-x  2 root root 4096 Jan  1 12:00 Game1"
+        )
+
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        entries, used_list = scanner._nlst_with_retry(
+            mock_ftp, "/data/homebrew", return_source=True
+        )
+
+        assert entries == ["/data/homebrew/Game1"]
+        assert used_list is True
+        mock_ftp.dir.assert_called_once()
+
+    def test_invalidate_path(self):
+        """Test invalidating a path forces it to be listed again."""
+        scanner, mock_ftp = self._scanner()
+
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        scanner._nlst_with_retry(mock_ftp, "/mnt/usb0")
+        scanner.invalidate("/data/homebrew")
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        scanner._nlst_with_retry(mock_ftp, "/mnt/usb0")
+
+        assert mock_ftp.nlst.call_count == 3
+
+    def test_invalidate_all(self):
+        """Test invalidating without a path drops every listing."""
+        scanner, mock_ftp = self._scanner()
+
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        scanner.invalidate()
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+
+        assert mock_ftp.nlst.call_count == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Test cache_ttl=0 lists the directory every time."""
+        scanner, mock_ftp = self._scanner(cache_ttl=0)
+
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+        scanner._nlst_with_retry(mock_ftp, "/data/homebrew")
+
+        assert mock_ftp.nlst.call_count == 2
+
 
 class TestScanPaths:
     """Tests for SCAN_PATHS configuration."""
@@ -0,0 +1,97 @@
+"""Unit tests for background task helpers.
+
+Tests ThreadedTask progress reporting and GUIUpdateQueue.
+"""
+
+import pytest
+
+from src.utils.threading import (
+    GUIUpdateQueue,
+    TaskStatus,
+    ThreadedTask,
+)
+
+
+class TestThreadedTask:
+    """Tests for ThreadedTask."""
+
+    def test_run_to_completion(self):
+        """Test task result is returned after completion."""
+        task = ThreadedTask(lambda: "done")
+        task.start()
+        result = task.get_result(timeout=5)
+
+        assert result.status == TaskStatus.COMPLETED
+        assert result.result == "done"
+
+    def test_wait(self):
+        """Test wait blocks until the task finishes."""
+        import threading
+
+        release = threading.Event()
+        task = ThreadedTask(release.wait)
+        task.start()
+
+        assert task.wait(timeout=0.01) is False
+        release.set()
+        assert task.wait(timeout=5) is True
+        assert task.status == TaskStatus.COMPLETED
+
+    def test_get_result_timeout(self):
+        """Test get_result raises when the task is still running."""
+        import threading
+
+        release = threading.Event()
+        task = ThreadedTask(release.wait)
+        task.start()
+
+        with pytest.raises(TimeoutError):
+            task.get_result(timeout=0.01)
+        release.set()
+        assert task.get_result(timeout=5).status == TaskStatus.COMPLETED
+
+    def test_get_result_not_started(self):
+        """Test get_result returns PENDING for a task never started."""
+        task = ThreadedTask(lambda: None)
+        assert task.get_result().status == TaskStatus.PENDING
+
+    def test_progress_clamped(self):
+        """Test progress values are clamped to 0.0-1.0."""
+        task = ThreadedTask(lambda: None)
+        task.report_progress(-0.5)
+        assert task.get_progress() == 0.0
+
+        task.report_progress(1.5)
+        assert task.get_progress() == 1.0
+        assert task.get_progress() is None
+
+    def test_progress_keeps_latest(self):
+        """Test only the latest unread progress update is kept."""
+        task = ThreadedTask(lambda: None)
+        for i in range(1000):
+            task.report_progress(i / 1000)
+
+        assert task.get_all_progress() == [0.999]
+        assert task.get_all_progress() == []
+
+
+class TestGUIUpdateQueue:
+    """Tests for GUIUpdateQueue."""
+
+    def test_put_and_get(self):
+        """Test updates are returned in order."""
+        update_queue = GUIUpdateQueue()
+        update_queue.put("status", "Connecting...")
+        update_queue.put("progress", 0.5)
+
+        assert update_queue.get() == ("status", "Connecting...")
+        assert update_queue.get_all() == [("progress", 0.5)]
+        assert update_queue.get() is None
+
+    def test_clear(self):
+        """Test clearing pending updates."""
+        update_queue = GUIUpdateQueue()
+        update_queue.put("status", "Connecting...")
+        update_queue.clear()
+
+        assert update_queue.get_all() == []
@@ -5,8 +5,6 @@ Tests file upload operations, batch uploads, cancellation, and progress reportin
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch, call
-from pathlib import Path
-import tempfile
 
 from src.ftp.uploader import FileUploader, UploadProgress, UploadResult
 from src.ftp.scanner import GameDump, LocationType, InstallationStatus
@@ -14,6 +12,20 @@ from src.ftp.connection import FTPConnectionManager, ConnectionState
 from src.ftp.exceptions import FTPUploadError
 
 
+@pytest.fixture(scope="module")
+def temp_files(tmp_path_factory):
+    """Create the (read-only) test files once per module."""
+    tmpdir = tmp_path_factory.mktemp("uploads")
+    elf_path = tmpdir / "dump_runner.elf"
+    js_path = tmpdir / "homebrew.js"
+
+    # Create test files with content
+    elf_path.write_bytes(b"\x7fELF" + b"\x00" * 100)
+    js_path.write_text("// homebrew.js test content")
+
+    return elf_path, js_path
+
+
 class TestUploadProgress:
     """Tests for UploadProgress dataclass."""
 
@@ -110,19 +122,6 @@ class TestFileUploader:
             installation_status=InstallationStatus.NOT_INSTALLED
         )
 
-    @pytest.fixture
-    def temp_files(self):
-        """Create temporary test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            elf_path = Path(tmpdir) / "dump_runner.elf"
-            js_path = Path(tmpdir) / "homebrew.js"
-
-            # Create test files with content
-            elf_path.write_bytes(b"\x7fELF" + b"\x00" * 100)
-            js_path.write_text("// homebrew.js test content")
-
-            yield elf_path, js_path
-
     def test_init(self, mock_connection):
         """Test uploader initialization."""
         uploader = FileUploader(mock_connection)
@@ -167,6 +166,16 @@ class TestFileUploader:
         # Verify FTP commands were called
         mock_connection.ftp.storbinary.assert_called()
 
+    def test_upload_uses_large_blocksize(self, mock_connection, sample_dump, temp_files):
+        """Test files are sent in blocks well above ftplib's 8KB default."""
+        uploader = FileUploader(mock_connection)
+        elf_path, js_path = temp_files
+
+        uploader.upload_to_dump(sample_dump, elf_path, js_path)
+
+        for upload_call in mock_connection.ftp.storbinary.call_args_list:
+            assert upload_call.kwargs["blocksize"] >= 65536
+
     def test_upload_to_dump_with_progress(self, mock_connection, sample_dump, temp_files):
         """Test upload with progress callback."""
         uploader = FileUploader(mock_connection)
@@ -335,6 +344,61 @@ class TestFileUploader:
         cancelled_count = sum(1 for r in results if "cancelled" in (r.error_message or "").lower())
         assert cancelled_count >= 1
 
+    def test_upload_batch_parallel(self, mock_connection, temp_files):
+        """Test parallel batch spreads dumps over cloned sessions."""
+        dumps = [
+            GameDump(
+                path=f"/data/homebrew/Game{i}",
+                name=f"Game{i}",
+                location_type=LocationType.INTERNAL
+            )
+            for i in range(8)
+        ]
+        clones = []
+
+        def clone():
+            session = Mock(spec=FTPConnectionManager)
+            session.is_connected = True
+            session.ftp = MagicMock()
+            clones.append(session)
+            return session
+
+        mock_connection.clone.side_effect = clone
+        uploader = FileUploader(mock_connection, max_connections=4)
+        elf_path, js_path = temp_files
+
+        results = uploader.upload_batch(dumps, elf_path, js_path)
+
+        assert [r.dump_path for r in results] == [d.path for d in dumps]
+        assert all(r.success for r in results)
+        assert len(clones) == 3
+        stores = mock_connection.ftp.storbinary.call_count + sum(
+            c.ftp.storbinary.call_count for c in clones
+        )
+        assert stores == 16
+        for session in clones:
+            session.disconnect.assert_called_once()
+
+    def test_upload_batch_parallel_clone_refused(self, mock_connection, temp_files):
+        """Test parallel batch uploads on the main session if clones fail."""
+        dumps = [
+            GameDump(
+                path=f"/data/homebrew/Game{i}",
+                name=f"Game{i}",
+                location_type=LocationType.INTERNAL
+            )
+            for i in range(3)
+        ]
+        mock_connection.clone.side_effect = OSError("Too many connections")
+        uploader = FileUploader(mock_connection, max_connections=4)
+        elf_path, js_path = temp_files
+
+        results = uploader.upload_batch(dumps, elf_path, js_path)
+
+        assert all(r.success for r in results)
+        assert mock_connection.ftp.storbinary.call_count == 6
+        mock_connection.clone.assert_called_once()
+
     def test_get_batch_summary(self, mock_connection, temp_files):
         """Test batch summary statistics."""
         uploader = FileUploader(mock_connection)
@@ -0,0 +1,157 @@
+"""Unit tests for input validators.
+
+Tests IP address, hostname and host validation.
+"""
+
+import pytest
+
+from src.utils.validators import (
+    validate_dump_runner_files,
+    validate_host,
+    validate_hostname,
+    validate_ip_address,
+    validate_port,
+    validate_timeout,
+)
+
+
+class TestValidateIPAddress:
+    """Tests for validate_ip_address."""
+
+    @pytest.mark.parametrize("ip", ["192.168.1.50", "0.0.0.0", "255.255.255.255", " 10.0.0.1 "])
+    def test_valid(self, ip):
+        """Test valid IPv4 addresses."""
+        assert validate_ip_address(ip) == (True, None)
+
+    @pytest.mark.parametrize("ip", ["256.1.1.1", "1.2.3", "1.2.3.4.5", "1.2.3.4x", "a.b.c.d"])
+    def test_invalid(self, ip):
+        """Test invalid IPv4 addresses."""
+        is_valid, error = validate_ip_address(ip)
+        assert is_valid is False
+        assert "Invalid IP address" in error
+
+    def test_empty(self):
+        """Test empty IP address."""
+        assert validate_ip_address("  ") == (False, "IP address is required")
+
+
+class TestValidateHostname:
+    """Tests for validate_hostname."""
+
+    @pytest.mark.parametrize("hostname", ["ps5", "ps5.local", "my-ps5.home.lan", "a" * 63])
+    def test_valid(self, hostname):
+        """Test valid hostnames."""
+        assert validate_hostname(hostname) == (True, None)
+
+    @pytest.mark.parametrize("hostname", [
+        "-ps5",
+        "ps5-",
+        "ps5.-local",
+        "ps5..local",
+        "ps5.local.",
+        "ps_5",
+        "pś5",
+        "a" * 64,
+        ".".join(["a" * 63] * 4),
+    ])
+    def test_invalid(self, hostname):
+        """Test invalid hostnames."""
+        is_valid, error = validate_hostname(hostname)
+        assert is_valid is False
+        assert "Invalid hostname" in error
+
+
+class TestValidateHost:
+    """Tests for validate_host."""
+
+    def test_ip_or_hostname(self):
+        """Test hosts may be IP addresses or hostnames."""
+        assert validate_host("192.168.1.50") == (True, None)
+        assert validate_host("ps5.local") == (True, None)
+
+    def test_invalid(self):
+        """Test invalid hosts."""
+        is_valid, error = validate_host("not a host")
+        assert is_valid is False
+        assert "Invalid host" in error
+
+
+class TestValidateDumpRunnerFiles:
+    """Tests for validate_dump_runner_files."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Create non-empty dump_runner files."""
+        elf_path = tmp_path / "dump_runner.elf"
+        js_path = tmp_path / "homebrew.js"
+        elf_path.write_bytes(b"elf")
+        js_path.write_bytes(b"js")
+        return elf_path, js_path
+
+    def test_valid(self, files):
+        """Test valid files."""
+        assert validate_dump_runner_files(*files) == (True, None)
+
+    def test_missing_elf(self, files):
+        """Test missing ELF file."""
+        elf_path, js_path = files
+        elf_path.unlink()
+
+        is_valid, error = validate_dump_runner_files(elf_path, js_path)
+        assert is_valid is False
+        assert error == f"dump_runner.elf: File does not exist: {elf_path}"
+
+    def test_empty_js(self, files):
+        """Test empty JS file."""
+        elf_path, js_path = files
+        js_path.write_bytes(b"")
+
+        assert validate_dump_runner_files(elf_path, js_path) == (False, "homebrew.js is empty")
+
+    def test_directory(self, files, tmp_path):
+        """Test a directory is rejected."""
+        elf_path, _ = files
+
+        is_valid, error = validate_dump_runner_files(elf_path, tmp_path)
+        assert is_valid is False
+        assert error == f"homebrew.js: Path is not a file: {tmp_path}"
+
+
+class TestValidatePort:
+    """Tests for validate_port."""
+
+    @pytest.mark.parametrize("port", [1, 2121, 65535, "1337"])
+    def test_valid(self, port):
+        """Test valid ports, including numeric strings."""
+        assert validate_port(port) == (True, None)
+
+    @pytest.mark.parametrize("port", [0, 65536, "70000"])
+    def test_out_of_range(self, port):
+        """Test ports outside 1-65535."""
+        is_valid, error = validate_port(port)
+        assert is_valid is False
+        assert "between 1 and 65535" in error
+
+    def test_not_a_number(self):
+        """Test non-numeric ports."""
+        assert validate_port("abc") == (False, "Port must be a number")
+
+
+class TestValidateTimeout:
+    """Tests for validate_timeout."""
+
+    @pytest.mark.parametrize("timeout", [5, 30, 300, "60"])
+    def test_valid(self, timeout):
+        """Test valid timeouts."""
+        assert validate_timeout(timeout) == (True, None)
+
+    @pytest.mark.parametrize("timeout", [4, 301])
+    def test_out_of_range(self, timeout):
+        """Test timeouts outside 5-300 seconds."""
+        is_valid, error = validate_timeout(timeout)
+        assert is_valid is False
+        assert "between 5 and 300" in error
+
+    def test_not_a_number(self):
+        """Test non-numeric timeouts."""
+        assert validate_timeout(None) == (False, "Timeout must be a number")